@@ -25,6 +25,64 @@ class Settings(BaseSettings):
     recon_host: str = "recon"
     recon_port: int = 50052
 
+    # gRPC channels (shared per process). GEO_HOST / RECON_HOST may also be a
+    # comma-separated replica list ("geo-1,geo-2:50061,[fd00::5]:50061"), resolved at
+    # startup and then every grpc_resolve_interval seconds.
+    grpc_lb_policy: str = "round_robin"
+    grpc_resolve_interval: float = 30.0
+    grpc_keepalive_time_ms: int = 30000
+    grpc_keepalive_timeout_ms: int = 10000
+    # Largest geo / recon response accepted (gRPC's default of 4 MB is exceeded by a
+    # dense-city enrichment of ~45k businesses)
+    grpc_max_receive_mb: int = 256
+    # Attempts per call (including the first) on UNAVAILABLE, plus CANCELLED for read RPCs; 1 disables retries
+    grpc_retry_max_attempts: int = 3
+    # Outlier ejection: a replica failing this % of calls is ejected (0 disables)
+    grpc_outlier_failure_percent: int = 50
+    grpc_outlier_min_requests: int = 20
+    grpc_outlier_ejection_seconds: int = 30
+    # Deadlines (seconds) of calls to geo / recon; the services stop working on a call
+    # once its deadline passes, and /api/enrich and /api/recon also cancel their call
+    # when the HTTP client disconnects
+    grpc_call_timeout: float = 10.0     # ACL, CRUD and listing calls
+    enrich_timeout: float = 60.0        # EnrichPolygon (Overpass allows up to 30 s)
+    recon_timeout: float = 300.0        # RunRecon / RunReconStream
+    upload_timeout: float = 600.0       # UploadSource / UploadSourceStream
+    # HTTP/2 connections per replica address; calls rotate over them so that a
+    # multi-process geo server (GEO_WORKERS) gets work on every worker
+    grpc_connections_per_host: int = 4
+
+    # Background health monitor behind /api/health
+    health_probe_interval: float = 5.0   # seconds between probes of geo (incl. its DB pools) and recon
+    health_probe_timeout: float = 2.0
+    health_history_size: int = 60        # probe latencies kept per dependency
+
+    # Admission control per backend process: in-flight /api/enrich* and /api/recon*
+    # requests overall and per user; beyond that requests queue fairly between users
+    enrich_admission_limit: int = 16
+    enrich_admission_per_user: int = 4
+    recon_admission_limit: int = 8
+    recon_admission_per_user: int = 2
+    admission_queue_per_user: int = 20    # waiting requests per user before 429
+    admission_queue_max: int = 200        # waiting requests in total before 429
+    admission_queue_timeout: float = 30.0 # seconds a request may wait before 429
+
+    # Response compression, negotiated from Accept-Encoding in this order of preference
+    # (zstd, br, gzip); an empty list disables it
+    compression_encodings: list[str] = ["zstd", "br", "gzip"]
+    compression_min_size: int = 1024    # bytes; smaller bodies are sent uncompressed
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4 # higher levels cost far more CPU for a few %
+    compression_zstd_level: int = 3
+    # JSON lists of /api/enrich, /api/pois and /api/areas with at least this many items
+    # are serialised and sent in batches instead of as one body; 0 disables. Matches
+    # geo's LIST_DEFAULT_PAGE_SIZE, so unpaged lists longer than one geo page stream
+    json_stream_min_items: int = 500
+    json_stream_batch_items: int = 1000
+    # Unpaged list endpoints stop fetching geo pages once they hold this many rows and
+    # return the rest's cursor in X-Next-Page-Token
+    list_max_items: int = 20000
+
     # CORS
     cors_origins: list[str] = ["http://localhost:5173"]
 
@@ -36,6 +94,21 @@ class Settings(BaseSettings):
     # Additional PostGIS sources (same JSON as GEO_ADDITIONAL_DBS)
     geo_additional_dbs: str = "[]"
 
+    # Streaming datasource upload: features per UploadSourceStream chunk
+    upload_chunk_features: int = 2000
+    # Rows per record batch when reading GeoParquet / FlatGeobuf / CSV uploads
+    upload_batch_rows: int = 50000
+
+    # Auth middleware cache of user -> default project and (user, project) -> granted
+    # access (denials are not cached); TTL in seconds, 0 disables
+    project_cache_ttl: float = 60.0
+    project_cache_max_entries: int = 10000
+    # Also drop entries on geo's WatchProjectChanges stream, so changes made through
+    # other backend workers apply at once (holds one geo connection per worker).
+    # Without it, a member removed through one worker keeps access on the other
+    # workers for up to project_cache_ttl: enable it when running several workers
+    project_cache_watch: bool = False
+
     # Rate Limiting
     nominatim_rate_limit: int = 60
 
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tgeo.proto\x12\x03geo\"&\n\nCoordinate\x12\x0b\n\x03lat\x18\x01 \x01(\x01\x12\x0b\n\x03lng\x18\x02 \x01(\x01\"[\n\x0ePolygonRequest\x12$\n\x0b\x63oordinates\x18\x01 \x03(\x0b\x32\x0f.geo.Coordinate\x12\x0f\n\x07sources\x18\x02 \x03(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\"\xb1\x01\n\x08\x42usiness\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03lat\x18\x02 \x01(\x01\x12\x0b\n\x03lng\x18\x03 \x01(\x01\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x05 \x01(\t\x12\r\n\x05phone\x18\x06 \x01(\t\x12\x0f\n\x07website\x18\x07 \x01(\t\x12\r\n\x05\x65mail\x18\x08 \x01(\t\x12\x0e\n\x06source\x18\t \x01(\t\x12\n\n\x02id\x18\n \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x0b \x01(\t\"\xa4\x01\n\x12\x45nrichmentResponse\x12\x10\n\x08\x61rea_km2\x18\x01 \x01(\x01\x12\x1c\n\x14\x65stimated_population\x18\x02 \x01(\x05\x12\x13\n\x0bregion_type\x18\x03 \x01(\t\x12\x17\n\x0fnearby_features\x18\x04 \x03(\t\x12!\n\nbusinesses\x18\x05 \x03(\x0b\x32\r.geo.Business\x12\r\n\x05\x65rror\x18\x06 \x01(\t\"\xab\x01\n\x13\x41\x64\x64\x43ustomPOIRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x0b\n\x03lat\x18\x03 \x01(\x01\x12\x0b\n\x03lng\x18\x04 \x01(\x01\x12\x11\n\ttags_json\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\r\n\x05phone\x18\x07 \x01(\t\x12\x0f\n\x07website\x18\x08 \x01(\t\x12\x12\n\nproject_id\x18\t \x01(\t\"\xb0\x01\n\x11\x43ustomPOIResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x0b\n\x03lat\x18\x04 \x01(\x01\x12\x0b\n\x03lng\x18\x05 \x01(\x01\x12\x11\n\ttags_json\x18\x06 \x01(\t\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\r\n\x05phone\x18\t \x01(\t\x12\x0f\n\x07website\x18\n \x01(\t\"\x8d\x01\n\x16UpdateCustomPOIRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x0f\n\x07website\x18\x06 \x01(\t\x12\x12\n\nproject_id\x18\x07 \x01(\t\"8\n\x16\x44\x65leteCustomPOIRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"0\n\x0e\x44\x65leteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"o\n\x15ListCustomPOIsRequest\x12\x0f\n\x07min_lat\x18\x01 \x01(\x01\x12\x0f\n\x07min_lng\x18\x02 \x01(\x01\x12\x0f\n\x07max_lat\x18\x03 \x01(\x01\x12\x0f\n\x07max_lng\x18\x04 \x01(\x01\x12\x12\n\nproject_id\x18\x05 \x01(\t\"M\n\x16ListCustomPOIsResponse\x12$\n\x04pois\x18\x01 \x03(\x0b\x32\x16.geo.CustomPOIResponse\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\x8a\x01\n\x14\x41\x64\x64\x43ustomAreaRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12$\n\x0b\x63oordinates\x18\x03 \x03(\x0b\x32\x0f.geo.Coordinate\x12\x15\n\rmetadata_json\x18\x04 \x01(\t\x12\x12\n\nproject_id\x18\x05 \x01(\t\"\x8f\x01\n\x12\x43ustomAreaResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12$\n\x0b\x63oordinates\x18\x04 \x03(\x0b\x32\x0f.geo.Coordinate\x12\x15\n\rmetadata_json\x18\x05 \x01(\t\x12\r\n\x05\x65rror\x18\x06 \x01(\t\"\\\n\x17UpdateCustomAreaRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\"9\n\x17\x44\x65leteCustomAreaRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\",\n\x16ListCustomAreasRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\",\n\x18\x45nsureUserProjectRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"T\n\x0fProjectResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x18\n\x10\x64\x65\x66\x61ult_acl_mode\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"8\n\x0eProjectSummary\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04role\x18\x03 \x01(\t\"+\n\x17ListUserProjectsRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"P\n\x18ListUserProjectsResponse\x12%\n\x08projects\x18\x01 \x03(\x0b\x32\x13.geo.ProjectSummary\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"A\n\x19\x43heckProjectAccessRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"<\n\x1a\x43heckProjectAccessResponse\x12\x0f\n\x07\x61llowed\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"6\n\x14\x43reateProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\"@\n\x15\x43reateProjectResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"<\n\x14\x44\x65leteProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\"7\n\x15\x44\x65leteProjectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"`\n\x17\x41\x64\x64ProjectMemberRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x11\n\trequester\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\"U\n\x1aRemoveProjectMemberRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x11\n\trequester\x18\x03 \x01(\t\"7\n\x15ProjectMemberResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"V\n\x1aPromoteProjectOwnerRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tnew_owner\x18\x02 \x01(\t\x12\x11\n\trequester\x18\x03 \x01(\t\"B\n\x19ListProjectMembersRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\trequester\x18\x02 \x01(\t\"/\n\rProjectMember\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\"P\n\x1aListProjectMembersResponse\x12#\n\x07members\x18\x01 \x03(\x0b\x32\x12.geo.ProjectMember\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"P\n\x17ListCustomAreasResponse\x12&\n\x05\x61reas\x18\x01 \x03(\x0b\x32\x17.geo.CustomAreaResponse\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"G\n\x0f\x41\x64\x64RouteRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nroute_type\x18\x02 \x01(\t\x12\x12\n\nstops_json\x18\x03 \x01(\t\"t\n\rRouteResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nroute_type\x18\x03 \x01(\t\x12\x12\n\nstops_json\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\r\n\x05\x65rror\x18\x06 \x01(\t\"\x13\n\x11ListRoutesRequest\"G\n\x12ListRoutesResponse\x12\"\n\x06routes\x18\x01 \x03(\x0b\x32\x12.geo.RouteResponse\x12\r\n\x05\x65rror\x18\x02 \x01(\t\" \n\x12\x44\x65leteRouteRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x0f\n\rHealthRequest\"1\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"H\n\x13UploadSourceRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07geojson\x18\x02 \x01(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\"J\n\x14UploadSourceResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rfeature_count\x18\x02 \x01(\x05\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"0\n\x1aListUploadedSourcesRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\"C\n\x1bListUploadedSourcesResponse\x12$\n\x07sources\x18\x01 \x03(\x0b\x32\x13.geo.UploadedSource\"5\n\x0eUploadedSource\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rfeature_count\x18\x02 \x01(\x05\"+\n\x1b\x44\x65leteUploadedSourceRequest\x12\x0c\n\x04name\x18\x01 \x01(\t2\xfc\x0e\n\x0eGeoDataService\x12\x31\n\x06Health\x12\x12.geo.HealthRequest\x1a\x13.geo.HealthResponse\x12=\n\rEnrichPolygon\x12\x13.geo.PolygonRequest\x1a\x17.geo.EnrichmentResponse\x12H\n\x11\x45nsureUserProject\x12\x1d.geo.EnsureUserProjectRequest\x1a\x14.geo.ProjectResponse\x12O\n\x10ListUserProjects\x12\x1c.geo.ListUserProjectsRequest\x1a\x1d.geo.ListUserProjectsResponse\x12U\n\x12\x43heckProjectAccess\x12\x1e.geo.CheckProjectAccessRequest\x1a\x1f.geo.CheckProjectAccessResponse\x12\x46\n\rCreateProject\x12\x19.geo.CreateProjectRequest\x1a\x1a.geo.CreateProjectResponse\x12\x46\n\rDeleteProject\x12\x19.geo.DeleteProjectRequest\x1a\x1a.geo.DeleteProjectResponse\x12L\n\x10\x41\x64\x64ProjectMember\x12\x1c.geo.AddProjectMemberRequest\x1a\x1a.geo.ProjectMemberResponse\x12R\n\x13RemoveProjectMember\x12\x1f.geo.RemoveProjectMemberRequest\x1a\x1a.geo.ProjectMemberResponse\x12U\n\x12ListProjectMembers\x12\x1e.geo.ListProjectMembersRequest\x1a\x1f.geo.ListProjectMembersResponse\x12R\n\x13PromoteProjectOwner\x12\x1f.geo.PromoteProjectOwnerRequest\x1a\x1a.geo.ProjectMemberResponse\x12@\n\x0c\x41\x64\x64\x43ustomPOI\x12\x18.geo.AddCustomPOIRequest\x1a\x16.geo.CustomPOIResponse\x12\x46\n\x0fUpdateCustomPOI\x12\x1b.geo.UpdateCustomPOIRequest\x1a\x16.geo.CustomPOIResponse\x12\x43\n\x0f\x44\x65leteCustomPOI\x12\x1b.geo.DeleteCustomPOIRequest\x1a\x13.geo.DeleteResponse\x12I\n\x0eListCustomPOIs\x12\x1a.geo.ListCustomPOIsRequest\x1a\x1b.geo.ListCustomPOIsResponse\x12\x43\n\rAddCustomArea\x12\x19.geo.AddCustomAreaRequest\x1a\x17.geo.CustomAreaResponse\x12I\n\x10UpdateCustomArea\x12\x1c.geo.UpdateCustomAreaRequest\x1a\x17.geo.CustomAreaResponse\x12\x45\n\x10\x44\x65leteCustomArea\x12\x1c.geo.DeleteCustomAreaRequest\x1a\x13.geo.DeleteResponse\x12L\n\x0fListCustomAreas\x12\x1b.geo.ListCustomAreasRequest\x1a\x1c.geo.ListCustomAreasResponse\x12J\n\x15ListIntersectingAreas\x12\x13.geo.PolygonRequest\x1a\x1c.geo.ListCustomAreasResponse\x12\x34\n\x08\x41\x64\x64Route\x12\x14.geo.AddRouteRequest\x1a\x12.geo.RouteResponse\x12=\n\nListRoutes\x12\x16.geo.ListRoutesRequest\x1a\x17.geo.ListRoutesResponse\x12;\n\x0b\x44\x65leteRoute\x12\x17.geo.DeleteRouteRequest\x1a\x13.geo.DeleteResponse\x12\x43\n\x0cUploadSource\x12\x18.geo.UploadSourceRequest\x1a\x19.geo.UploadSourceResponse\x12X\n\x13ListUploadedSources\x12\x1f.geo.ListUploadedSourcesRequest\x1a .geo.ListUploadedSourcesResponse\x12M\n\x14\x44\x65leteUploadedSource\x12 .geo.DeleteUploadedSourceRequest\x1a\x13.geo.DeleteResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tgeo.proto\x12\x03geo\"&\n\nCoordinate\x12\x0b\n\x03lat\x18\x01 \x01(\x01\x12\x0b\n\x03lng\x18\x02 \x01(\x01\"\x81\x02\n\x0ePolygonRequest\x12$\n\x0b\x63oordinates\x18\x01 \x03(\x0b\x32\x0f.geo.Coordinate\x12\x0f\n\x07sources\x18\x02 \x03(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\x12\x11\n\ttolerance\x18\x06 \x01(\x01\x12\x11\n\x04zoom\x18\x07 \x01(\x05H\x00\x88\x01\x01\x12\x1a\n\x12packed_coordinates\x18\x08 \x03(\x12\x12\x17\n\x0fpacked_response\x18\t \x01(\x08\x12\x19\n\x11\x63olumnar_response\x18\n \x01(\x08\x42\x07\n\x05_zoom\"\xb1\x01\n\x08\x42usiness\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03lat\x18\x02 \x01(\x01\x12\x0b\n\x03lng\x18\x03 \x01(\x01\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x05 \x01(\t\x12\r\n\x05phone\x18\x06 \x01(\t\x12\x0f\n\x07website\x18\x07 \x01(\t\x12\r\n\x05\x65mail\x18\x08 \x01(\t\x12\x0e\n\x06source\x18\t \x01(\t\x12\n\n\x02id\x18\n \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x0b \x01(\t\"\xd4\x01\n\x12\x45nrichmentResponse\x12\x10\n\x08\x61rea_km2\x18\x01 \x01(\x01\x12\x1c\n\x14\x65stimated_population\x18\x02 \x01(\x05\x12\x13\n\x0bregion_type\x18\x03 \x01(\t\x12\x17\n\x0fnearby_features\x18\x04 \x03(\t\x12!\n\nbusinesses\x18\x05 \x03(\x0b\x32\r.geo.Business\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x12.\n\x10\x62usiness_columns\x18\x07 \x01(\x0b\x32\x14.geo.BusinessColumns\"\xf0\x01\n\x0f\x42usinessColumns\x12\x0b\n\x03lat\x18\x01 \x03(\x01\x12\x0b\n\x03lng\x18\x02 \x03(\x01\x12\x13\n\x0btype_values\x18\x03 \x03(\t\x12\x12\n\ntype_index\x18\x04 \x03(\r\x12\x15\n\rsource_values\x18\x05 \x03(\t\x12\x14\n\x0csource_index\x18\x06 \x03(\r\x12\x0c\n\x04name\x18\x07 \x03(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x08 \x03(\t\x12\r\n\x05phone\x18\t \x03(\t\x12\x0f\n\x07website\x18\n \x03(\t\x12\r\n\x05\x65mail\x18\x0b \x03(\t\x12\n\n\x02id\x18\x0c \x03(\t\x12\x13\n\x0b\x64\x65scription\x18\r \x03(\t\"\xab\x01\n\x13\x41\x64\x64\x43ustomPOIRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x0b\n\x03lat\x18\x03 \x01(\x01\x12\x0b\n\x03lng\x18\x04 \x01(\x01\x12\x11\n\ttags_json\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\r\n\x05phone\x18\x07 \x01(\t\x12\x0f\n\x07website\x18\x08 \x01(\t\x12\x12\n\nproject_id\x18\t \x01(\t\"\xb0\x01\n\x11\x43ustomPOIResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x0b\n\x03lat\x18\x04 \x01(\x01\x12\x0b\n\x03lng\x18\x05 \x01(\x01\x12\x11\n\ttags_json\x18\x06 \x01(\t\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\r\n\x05phone\x18\t \x01(\t\x12\x0f\n\x07website\x18\n \x01(\t\"\x8d\x01\n\x16UpdateCustomPOIRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x0f\n\x07website\x18\x06 \x01(\t\x12\x12\n\nproject_id\x18\x07 \x01(\t\"8\n\x16\x44\x65leteCustomPOIRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"0\n\x0e\x44\x65leteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\x96\x01\n\x15ListCustomPOIsRequest\x12\x0f\n\x07min_lat\x18\x01 \x01(\x01\x12\x0f\n\x07min_lng\x18\x02 \x01(\x01\x12\x0f\n\x07max_lat\x18\x03 \x01(\x01\x12\x0f\n\x07max_lng\x18\x04 \x01(\x01\x12\x12\n\nproject_id\x18\x05 \x01(\t\x12\x11\n\tpage_size\x18\x06 \x01(\x05\x12\x12\n\npage_token\x18\x07 \x01(\t\"f\n\x16ListCustomPOIsResponse\x12$\n\x04pois\x18\x01 \x03(\x0b\x32\x16.geo.CustomPOIResponse\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"\x8a\x01\n\x14\x41\x64\x64\x43ustomAreaRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12$\n\x0b\x63oordinates\x18\x03 \x03(\x0b\x32\x0f.geo.Coordinate\x12\x15\n\rmetadata_json\x18\x04 \x01(\t\x12\x12\n\nproject_id\x18\x05 \x01(\t\"\xab\x01\n\x12\x43ustomAreaResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12$\n\x0b\x63oordinates\x18\x04 \x03(\x0b\x32\x0f.geo.Coordinate\x12\x15\n\rmetadata_json\x18\x05 \x01(\t\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x12\x1a\n\x12packed_coordinates\x18\x07 \x03(\x12\"\\\n\x17UpdateCustomAreaRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\nproject_id\x18\x04 \x01(\t\"9\n\x17\x44\x65leteCustomAreaRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"\x9b\x01\n\x16ListCustomAreasRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x11\n\ttolerance\x18\x04 \x01(\x01\x12\x11\n\x04zoom\x18\x05 \x01(\x05H\x00\x88\x01\x01\x12\x17\n\x0fpacked_response\x18\x06 \x01(\x08\x42\x07\n\x05_zoom\",\n\x18\x45nsureUserProjectRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"T\n\x0fProjectResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x18\n\x10\x64\x65\x66\x61ult_acl_mode\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"8\n\x0eProjectSummary\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04role\x18\x03 \x01(\t\"+\n\x17ListUserProjectsRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"P\n\x18ListUserProjectsResponse\x12%\n\x08projects\x18\x01 \x03(\x0b\x32\x13.geo.ProjectSummary\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"A\n\x19\x43heckProjectAccessRequest\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"<\n\x1a\x43heckProjectAccessResponse\x12\x0f\n\x07\x61llowed\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\x1c\n\x1aWatchProjectChangesRequest\"6\n\rProjectChange\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tusernames\x18\x02 \x03(\t\"6\n\x14\x43reateProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\"@\n\x15\x43reateProjectResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"<\n\x14\x44\x65leteProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\"7\n\x15\x44\x65leteProjectResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"`\n\x17\x41\x64\x64ProjectMemberRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x11\n\trequester\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\"U\n\x1aRemoveProjectMemberRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x10\n\x08username\x18\x02 \x01(\t\x12\x11\n\trequester\x18\x03 \x01(\t\"7\n\x15ProjectMemberResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"V\n\x1aPromoteProjectOwnerRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tnew_owner\x18\x02 \x01(\t\x12\x11\n\trequester\x18\x03 \x01(\t\"B\n\x19ListProjectMembersRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\trequester\x18\x02 \x01(\t\"/\n\rProjectMember\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\"P\n\x1aListProjectMembersResponse\x12#\n\x07members\x18\x01 \x03(\x0b\x32\x12.geo.ProjectMember\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"i\n\x17ListCustomAreasResponse\x12&\n\x05\x61reas\x18\x01 \x03(\x0b\x32\x17.geo.CustomAreaResponse\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"G\n\x0f\x41\x64\x64RouteRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nroute_type\x18\x02 \x01(\t\x12\x12\n\nstops_json\x18\x03 \x01(\t\"t\n\rRouteResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nroute_type\x18\x03 \x01(\t\x12\x12\n\nstops_json\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\r\n\x05\x65rror\x18\x06 \x01(\t\":\n\x11ListRoutesRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\"`\n\x12ListRoutesResponse\x12\"\n\x06routes\x18\x01 \x03(\x0b\x32\x12.geo.RouteResponse\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\" \n\x12\x44\x65leteRouteRequest\x12\n\n\x02id\x18\x01 \x01(\t\"*\n\rHealthRequest\x12\x19\n\x11\x63heck_datasources\x18\x01 \x01(\x08\"\xab\x01\n\x0eHealthResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12%\n\tbulkheads\x18\x03 \x03(\x0b\x32\x12.geo.BulkheadStats\x12\x11\n\tworker_id\x18\x04 \x01(\x05\x12\x12\n\nworker_pid\x18\x05 \x01(\x05\x12*\n\x0b\x64\x61tasources\x18\x06 \x03(\x0b\x32\x15.geo.DatasourceHealth\"U\n\x10\x44\x61tasourceHealth\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x12\n\nlatency_ms\x18\x04 \x01(\x01\"\x93\x02\n\rBulkheadStats\x12\x11\n\trpc_class\x18\x01 \x01(\t\x12\x17\n\x0fmax_concurrency\x18\x02 \x01(\r\x12\x11\n\tin_flight\x18\x03 \x01(\r\x12\x0f\n\x07waiting\x18\x04 \x01(\r\x12\x10\n\x08\x61\x64mitted\x18\x05 \x01(\x04\x12\x10\n\x08rejected\x18\x06 \x01(\x04\x12\x14\n\x0cqueue_ms_p50\x18\x07 \x01(\x01\x12\x14\n\x0cqueue_ms_p99\x18\x08 \x01(\x01\x12\x14\n\x0cqueue_ms_max\x18\t \x01(\x01\x12\x14\n\x0c\x64\x62_pool_size\x18\n \x01(\r\x12\x19\n\x11\x64\x62_pool_available\x18\x0b \x01(\r\x12\x1b\n\x13\x64\x62_requests_waiting\x18\x0c \x01(\r\"]\n\x13UploadSourceRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07geojson\x18\x02 \x01(\t\x12\x12\n\nproject_id\x18\x03 \x01(\t\x12\x13\n\x0bid_property\x18\x04 \x01(\t\"\xa1\x01\n\x14UploadSourceResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rfeature_count\x18\x02 \x01(\x05\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x0e\n\x06job_id\x18\x04 \x01(\t\x12\x10\n\x08inserted\x18\x05 \x01(\x05\x12\x0f\n\x07updated\x18\x06 \x01(\x05\x12\x0f\n\x07\x64\x65leted\x18\x07 \x01(\x05\x12\x11\n\tunchanged\x18\x08 \x01(\x05\"\xbc\x01\n\rUploadFeature\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05phone\x18\x04 \x01(\t\x12\x0f\n\x07website\x18\x05 \x01(\t\x12\r\n\x05\x65mail\x18\x06 \x01(\t\x12\x0b\n\x03lat\x18\x07 \x01(\x01\x12\x0b\n\x03lng\x18\x08 \x01(\x01\x12\x17\n\x0fproperties_json\x18\t \x01(\t\x12\x14\n\x0cgeometry_wkb\x18\n \x01(\x0c\"\x80\x01\n\x11UploadSourceChunk\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12$\n\x08\x66\x65\x61tures\x18\x04 \x03(\x0b\x32\x12.geo.UploadFeature\x12\x13\n\x0bid_property\x18\x05 \x01(\t\"9\n\x13GetUploadJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x12\n\nproject_id\x18\x02 \x01(\t\"\x81\x01\n\tUploadJob\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x13\n\x0bsource_name\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x19\n\x11\x66\x65\x61tures_received\x18\x04 \x01(\x03\x12\x15\n\rfeature_count\x18\x05 \x01(\x05\x12\r\n\x05\x65rror\x18\x06 \x01(\t\"W\n\x1aListUploadedSourcesRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\"k\n\x1bListUploadedSourcesResponse\x12$\n\x07sources\x18\x01 \x03(\x0b\x32\x13.geo.UploadedSource\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"5\n\x0eUploadedSource\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rfeature_count\x18\x02 \x01(\x05\"+\n\x1b\x44\x65leteUploadedSourceRequest\x12\x0c\n\x04name\x18\x01 \x01(\t2\xcf\x10\n\x0eGeoDataService\x12\x31\n\x06Health\x12\x12.geo.HealthRequest\x1a\x13.geo.HealthResponse\x12=\n\rEnrichPolygon\x12\x13.geo.PolygonRequest\x1a\x17.geo.EnrichmentResponse\x12H\n\x11\x45nsureUserProject\x12\x1d.geo.EnsureUserProjectRequest\x1a\x14.geo.ProjectResponse\x12O\n\x10ListUserProjects\x12\x1c.geo.ListUserProjectsRequest\x1a\x1d.geo.ListUserProjectsResponse\x12U\n\x12\x43heckProjectAccess\x12\x1e.geo.CheckProjectAccessRequest\x1a\x1f.geo.CheckProjectAccessResponse\x12\x46\n\rCreateProject\x12\x19.geo.CreateProjectRequest\x1a\x1a.geo.CreateProjectResponse\x12\x46\n\rDeleteProject\x12\x19.geo.DeleteProjectRequest\x1a\x1a.geo.DeleteProjectResponse\x12L\n\x10\x41\x64\x64ProjectMember\x12\x1c.geo.AddProjectMemberRequest\x1a\x1a.geo.ProjectMemberResponse\x12R\n\x13RemoveProjectMember\x12\x1f.geo.RemoveProjectMemberRequest\x1a\x1a.geo.ProjectMemberResponse\x12U\n\x12ListProjectMembers\x12\x1e.geo.ListProjectMembersRequest\x1a\x1f.geo.ListProjectMembersResponse\x12R\n\x13PromoteProjectOwner\x12\x1f.geo.PromoteProjectOwnerRequest\x1a\x1a.geo.ProjectMemberResponse\x12L\n\x13WatchProjectChanges\x12\x1f.geo.WatchProjectChangesRequest\x1a\x12.geo.ProjectChange0\x01\x12@\n\x0c\x41\x64\x64\x43ustomPOI\x12\x18.geo.AddCustomPOIRequest\x1a\x16.geo.CustomPOIResponse\x12\x46\n\x0fUpdateCustomPOI\x12\x1b.geo.UpdateCustomPOIRequest\x1a\x16.geo.CustomPOIResponse\x12\x43\n\x0f\x44\x65leteCustomPOI\x12\x1b.geo.DeleteCustomPOIRequest\x1a\x13.geo.DeleteResponse\x12I\n\x0eListCustomPOIs\x12\x1a.geo.ListCustomPOIsRequest\x1a\x1b.geo.ListCustomPOIsResponse\x12\x43\n\rAddCustomArea\x12\x19.geo.AddCustomAreaRequest\x1a\x17.geo.CustomAreaResponse\x12I\n\x10UpdateCustomArea\x12\x1c.geo.UpdateCustomAreaRequest\x1a\x17.geo.CustomAreaResponse\x12\x45\n\x10\x44\x65leteCustomArea\x12\x1c.geo.DeleteCustomAreaRequest\x1a\x13.geo.DeleteResponse\x12L\n\x0fListCustomAreas\x12\x1b.geo.ListCustomAreasRequest\x1a\x1c.geo.ListCustomAreasResponse\x12J\n\x15ListIntersectingAreas\x12\x13.geo.PolygonRequest\x1a\x1c.geo.ListCustomAreasResponse\x12\x34\n\x08\x41\x64\x64Route\x12\x14.geo.AddRouteRequest\x1a\x12.geo.RouteResponse\x12=\n\nListRoutes\x12\x16.geo.ListRoutesRequest\x1a\x17.geo.ListRoutesResponse\x12;\n\x0b\x44\x65leteRoute\x12\x17.geo.DeleteRouteRequest\x1a\x13.geo.DeleteResponse\x12\x43\n\x0cUploadSource\x12\x18.geo.UploadSourceRequest\x1a\x19.geo.UploadSourceResponse\x12I\n\x12UploadSourceStream\x12\x16.geo.UploadSourceChunk\x1a\x19.geo.UploadSourceResponse(\x01\x12\x38\n\x0cGetUploadJob\x12\x18.geo.GetUploadJobRequest\x1a\x0e.geo.UploadJob\x12X\n\x13ListUploadedSources\x12\x1f.geo.ListUploadedSourcesRequest\x1a .geo.ListUploadedSourcesResponse\x12M\n\x14\x44\x65leteUploadedSource\x12 .geo.DeleteUploadedSourceRequest\x1a\x13.geo.DeleteResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,100 +33,118 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_COORDINATE']._serialized_start=18
   _globals['_COORDINATE']._serialized_end=56
-  _globals['_POLYGONREQUEST']._serialized_start=58
-  _globals['_POLYGONREQUEST']._serialized_end=149
-  _globals['_BUSINESS']._serialized_start=152
-  _globals['_BUSINESS']._serialized_end=329
-  _globals['_ENRICHMENTRESPONSE']._serialized_start=332
-  _globals['_ENRICHMENTRESPONSE']._serialized_end=496
-  _globals['_ADDCUSTOMPOIREQUEST']._serialized_start=499
-  _globals['_ADDCUSTOMPOIREQUEST']._serialized_end=670
-  _globals['_CUSTOMPOIRESPONSE']._serialized_start=673
-  _globals['_CUSTOMPOIRESPONSE']._serialized_end=849
-  _globals['_UPDATECUSTOMPOIREQUEST']._serialized_start=852
-  _globals['_UPDATECUSTOMPOIREQUEST']._serialized_end=993
-  _globals['_DELETECUSTOMPOIREQUEST']._serialized_start=995
-  _globals['_DELETECUSTOMPOIREQUEST']._serialized_end=1051
-  _globals['_DELETERESPONSE']._serialized_start=1053
-  _globals['_DELETERESPONSE']._serialized_end=1101
-  _globals['_LISTCUSTOMPOISREQUEST']._serialized_start=1103
-  _globals['_LISTCUSTOMPOISREQUEST']._serialized_end=1214
-  _globals['_LISTCUSTOMPOISRESPONSE']._serialized_start=1216
-  _globals['_LISTCUSTOMPOISRESPONSE']._serialized_end=1293
-  _globals['_ADDCUSTOMAREAREQUEST']._serialized_start=1296
-  _globals['_ADDCUSTOMAREAREQUEST']._serialized_end=1434
-  _globals['_CUSTOMAREARESPONSE']._serialized_start=1437
-  _globals['_CUSTOMAREARESPONSE']._serialized_end=1580
-  _globals['_UPDATECUSTOMAREAREQUEST']._serialized_start=1582
-  _globals['_UPDATECUSTOMAREAREQUEST']._serialized_end=1674
-  _globals['_DELETECUSTOMAREAREQUEST']._serialized_start=1676
-  _globals['_DELETECUSTOMAREAREQUEST']._serialized_end=1733
-  _globals['_LISTCUSTOMAREASREQUEST']._serialized_start=1735
-  _globals['_LISTCUSTOMAREASREQUEST']._serialized_end=1779
-  _globals['_ENSUREUSERPROJECTREQUEST']._serialized_start=1781
-  _globals['_ENSUREUSERPROJECTREQUEST']._serialized_end=1825
-  _globals['_PROJECTRESPONSE']._serialized_start=1827
-  _globals['_PROJECTRESPONSE']._serialized_end=1911
-  _globals['_PROJECTSUMMARY']._serialized_start=1913
-  _globals['_PROJECTSUMMARY']._serialized_end=1969
-  _globals['_LISTUSERPROJECTSREQUEST']._serialized_start=1971
-  _globals['_LISTUSERPROJECTSREQUEST']._serialized_end=2014
-  _globals['_LISTUSERPROJECTSRESPONSE']._serialized_start=2016
-  _globals['_LISTUSERPROJECTSRESPONSE']._serialized_end=2096
-  _globals['_CHECKPROJECTACCESSREQUEST']._serialized_start=2098
-  _globals['_CHECKPROJECTACCESSREQUEST']._serialized_end=2163
-  _globals['_CHECKPROJECTACCESSRESPONSE']._serialized_start=2165
-  _globals['_CHECKPROJECTACCESSRESPONSE']._serialized_end=2225
-  _globals['_CREATEPROJECTREQUEST']._serialized_start=2227
-  _globals['_CREATEPROJECTREQUEST']._serialized_end=2281
-  _globals['_CREATEPROJECTRESPONSE']._serialized_start=2283
-  _globals['_CREATEPROJECTRESPONSE']._serialized_end=2347
-  _globals['_DELETEPROJECTREQUEST']._serialized_start=2349
-  _globals['_DELETEPROJECTREQUEST']._serialized_end=2409
-  _globals['_DELETEPROJECTRESPONSE']._serialized_start=2411
-  _globals['_DELETEPROJECTRESPONSE']._serialized_end=2466
-  _globals['_ADDPROJECTMEMBERREQUEST']._serialized_start=2468
-  _globals['_ADDPROJECTMEMBERREQUEST']._serialized_end=2564
-  _globals['_REMOVEPROJECTMEMBERREQUEST']._serialized_start=2566
-  _globals['_REMOVEPROJECTMEMBERREQUEST']._serialized_end=2651
-  _globals['_PROJECTMEMBERRESPONSE']._serialized_start=2653
-  _globals['_PROJECTMEMBERRESPONSE']._serialized_end=2708
-  _globals['_PROMOTEPROJECTOWNERREQUEST']._serialized_start=2710
-  _globals['_PROMOTEPROJECTOWNERREQUEST']._serialized_end=2796
-  _globals['_LISTPROJECTMEMBERSREQUEST']._serialized_start=2798
-  _globals['_LISTPROJECTMEMBERSREQUEST']._serialized_end=2864
-  _globals['_PROJECTMEMBER']._serialized_start=2866
-  _globals['_PROJECTMEMBER']._serialized_end=2913
-  _globals['_LISTPROJECTMEMBERSRESPONSE']._serialized_start=2915
-  _globals['_LISTPROJECTMEMBERSRESPONSE']._serialized_end=2995
-  _globals['_LISTCUSTOMAREASRESPONSE']._serialized_start=2997
-  _globals['_LISTCUSTOMAREASRESPONSE']._serialized_end=3077
-  _globals['_ADDROUTEREQUEST']._serialized_start=3079
-  _globals['_ADDROUTEREQUEST']._serialized_end=3150
-  _globals['_ROUTERESPONSE']._serialized_start=3152
-  _globals['_ROUTERESPONSE']._serialized_end=3268
-  _globals['_LISTROUTESREQUEST']._serialized_start=3270
-  _globals['_LISTROUTESREQUEST']._serialized_end=3289
-  _globals['_LISTROUTESRESPONSE']._serialized_start=3291
-  _globals['_LISTROUTESRESPONSE']._serialized_end=3362
-  _globals['_DELETEROUTEREQUEST']._serialized_start=3364
-  _globals['_DELETEROUTEREQUEST']._serialized_end=3396
-  _globals['_HEALTHREQUEST']._serialized_start=3398
-  _globals['_HEALTHREQUEST']._serialized_end=3413
-  _globals['_HEALTHRESPONSE']._serialized_start=3415
-  _globals['_HEALTHRESPONSE']._serialized_end=3464
-  _globals['_UPLOADSOURCEREQUEST']._serialized_start=3466
-  _globals['_UPLOADSOURCEREQUEST']._serialized_end=3538
-  _globals['_UPLOADSOURCERESPONSE']._serialized_start=3540
-  _globals['_UPLOADSOURCERESPONSE']._serialized_end=3614
-  _globals['_LISTUPLOADEDSOURCESREQUEST']._serialized_start=3616
-  _globals['_LISTUPLOADEDSOURCESREQUEST']._serialized_end=3664
-  _globals['_LISTUPLOADEDSOURCESRESPONSE']._serialized_start=3666
-  _globals['_LISTUPLOADEDSOURCESRESPONSE']._serialized_end=3733
-  _globals['_UPLOADEDSOURCE']._serialized_start=3735
-  _globals['_UPLOADEDSOURCE']._serialized_end=3788
-  _globals['_DELETEUPLOADEDSOURCEREQUEST']._serialized_start=3790
-  _globals['_DELETEUPLOADEDSOURCEREQUEST']._serialized_end=3833
-  _globals['_GEODATASERVICE']._serialized_start=3836
-  _globals['_GEODATASERVICE']._serialized_end=5752
+  _globals['_POLYGONREQUEST']._serialized_start=59
+  _globals['_POLYGONREQUEST']._serialized_end=316
+  _globals['_BUSINESS']._serialized_start=319
+  _globals['_BUSINESS']._serialized_end=496
+  _globals['_ENRICHMENTRESPONSE']._serialized_start=499
+  _globals['_ENRICHMENTRESPONSE']._serialized_end=711
+  _globals['_BUSINESSCOLUMNS']._serialized_start=714
+  _globals['_BUSINESSCOLUMNS']._serialized_end=954
+  _globals['_ADDCUSTOMPOIREQUEST']._serialized_start=957
+  _globals['_ADDCUSTOMPOIREQUEST']._serialized_end=1128
+  _globals['_CUSTOMPOIRESPONSE']._serialized_start=1131
+  _globals['_CUSTOMPOIRESPONSE']._serialized_end=1307
+  _globals['_UPDATECUSTOMPOIREQUEST']._serialized_start=1310
+  _globals['_UPDATECUSTOMPOIREQUEST']._serialized_end=1451
+  _globals['_DELETECUSTOMPOIREQUEST']._serialized_start=1453
+  _globals['_DELETECUSTOMPOIREQUEST']._serialized_end=1509
+  _globals['_DELETERESPONSE']._serialized_start=1511
+  _globals['_DELETERESPONSE']._serialized_end=1559
+  _globals['_LISTCUSTOMPOISREQUEST']._serialized_start=1562
+  _globals['_LISTCUSTOMPOISREQUEST']._serialized_end=1712
+  _globals['_LISTCUSTOMPOISRESPONSE']._serialized_start=1714
+  _globals['_LISTCUSTOMPOISRESPONSE']._serialized_end=1816
+  _globals['_ADDCUSTOMAREAREQUEST']._serialized_start=1819
+  _globals['_ADDCUSTOMAREAREQUEST']._serialized_end=1957
+  _globals['_CUSTOMAREARESPONSE']._serialized_start=1960
+  _globals['_CUSTOMAREARESPONSE']._serialized_end=2131
+  _globals['_UPDATECUSTOMAREAREQUEST']._serialized_start=2133
+  _globals['_UPDATECUSTOMAREAREQUEST']._serialized_end=2225
+  _globals['_DELETECUSTOMAREAREQUEST']._serialized_start=2227
+  _globals['_DELETECUSTOMAREAREQUEST']._serialized_end=2284
+  _globals['_LISTCUSTOMAREASREQUEST']._serialized_start=2287
+  _globals['_LISTCUSTOMAREASREQUEST']._serialized_end=2442
+  _globals['_ENSUREUSERPROJECTREQUEST']._serialized_start=2444
+  _globals['_ENSUREUSERPROJECTREQUEST']._serialized_end=2488
+  _globals['_PROJECTRESPONSE']._serialized_start=2490
+  _globals['_PROJECTRESPONSE']._serialized_end=2574
+  _globals['_PROJECTSUMMARY']._serialized_start=2576
+  _globals['_PROJECTSUMMARY']._serialized_end=2632
+  _globals['_LISTUSERPROJECTSREQUEST']._serialized_start=2634
+  _globals['_LISTUSERPROJECTSREQUEST']._serialized_end=2677
+  _globals['_LISTUSERPROJECTSRESPONSE']._serialized_start=2679
+  _globals['_LISTUSERPROJECTSRESPONSE']._serialized_end=2759
+  _globals['_CHECKPROJECTACCESSREQUEST']._serialized_start=2761
+  _globals['_CHECKPROJECTACCESSREQUEST']._serialized_end=2826
+  _globals['_CHECKPROJECTACCESSRESPONSE']._serialized_start=2828
+  _globals['_CHECKPROJECTACCESSRESPONSE']._serialized_end=2888
+  _globals['_WATCHPROJECTCHANGESREQUEST']._serialized_start=2890
+  _globals['_WATCHPROJECTCHANGESREQUEST']._serialized_end=2918
+  _globals['_PROJECTCHANGE']._serialized_start=2920
+  _globals['_PROJECTCHANGE']._serialized_end=2974
+  _globals['_CREATEPROJECTREQUEST']._serialized_start=2976
+  _globals['_CREATEPROJECTREQUEST']._serialized_end=3030
+  _globals['_CREATEPROJECTRESPONSE']._serialized_start=3032
+  _globals['_CREATEPROJECTRESPONSE']._serialized_end=3096
+  _globals['_DELETEPROJECTREQUEST']._serialized_start=3098
+  _globals['_DELETEPROJECTREQUEST']._serialized_end=3158
+  _globals['_DELETEPROJECTRESPONSE']._serialized_start=3160
+  _globals['_DELETEPROJECTRESPONSE']._serialized_end=3215
+  _globals['_ADDPROJECTMEMBERREQUEST']._serialized_start=3217
+  _globals['_ADDPROJECTMEMBERREQUEST']._serialized_end=3313
+  _globals['_REMOVEPROJECTMEMBERREQUEST']._serialized_start=3315
+  _globals['_REMOVEPROJECTMEMBERREQUEST']._serialized_end=3400
+  _globals['_PROJECTMEMBERRESPONSE']._serialized_start=3402
+  _globals['_PROJECTMEMBERRESPONSE']._serialized_end=3457
+  _globals['_PROMOTEPROJECTOWNERREQUEST']._serialized_start=3459
+  _globals['_PROMOTEPROJECTOWNERREQUEST']._serialized_end=3545
+  _globals['_LISTPROJECTMEMBERSREQUEST']._serialized_start=3547
+  _globals['_LISTPROJECTMEMBERSREQUEST']._serialized_end=3613
+  _globals['_PROJECTMEMBER']._serialized_start=3615
+  _globals['_PROJECTMEMBER']._serialized_end=3662
+  _globals['_LISTPROJECTMEMBERSRESPONSE']._serialized_start=3664
+  _globals['_LISTPROJECTMEMBERSRESPONSE']._serialized_end=3744
+  _globals['_LISTCUSTOMAREASRESPONSE']._serialized_start=3746
+  _globals['_LISTCUSTOMAREASRESPONSE']._serialized_end=3851
+  _globals['_ADDROUTEREQUEST']._serialized_start=3853
+  _globals['_ADDROUTEREQUEST']._serialized_end=3924
+  _globals['_ROUTERESPONSE']._serialized_start=3926
+  _globals['_ROUTERESPONSE']._serialized_end=4042
+  _globals['_LISTROUTESREQUEST']._serialized_start=4044
+  _globals['_LISTROUTESREQUEST']._serialized_end=4102
+  _globals['_LISTROUTESRESPONSE']._serialized_start=4104
+  _globals['_LISTROUTESRESPONSE']._serialized_end=4200
+  _globals['_DELETEROUTEREQUEST']._serialized_start=4202
+  _globals['_DELETEROUTEREQUEST']._serialized_end=4234
+  _globals['_HEALTHREQUEST']._serialized_start=4236
+  _globals['_HEALTHREQUEST']._serialized_end=4278
+  _globals['_HEALTHRESPONSE']._serialized_start=4281
+  _globals['_HEALTHRESPONSE']._serialized_end=4452
+  _globals['_DATASOURCEHEALTH']._serialized_start=4454
+  _globals['_DATASOURCEHEALTH']._serialized_end=4539
+  _globals['_BULKHEADSTATS']._serialized_start=4542
+  _globals['_BULKHEADSTATS']._serialized_end=4817
+  _globals['_UPLOADSOURCEREQUEST']._serialized_start=4819
+  _globals['_UPLOADSOURCEREQUEST']._serialized_end=4912
+  _globals['_UPLOADSOURCERESPONSE']._serialized_start=4915
+  _globals['_UPLOADSOURCERESPONSE']._serialized_end=5076
+  _globals['_UPLOADFEATURE']._serialized_start=5079
+  _globals['_UPLOADFEATURE']._serialized_end=5267
+  _globals['_UPLOADSOURCECHUNK']._serialized_start=5270
+  _globals['_UPLOADSOURCECHUNK']._serialized_end=5398
+  _globals['_GETUPLOADJOBREQUEST']._serialized_start=5400
+  _globals['_GETUPLOADJOBREQUEST']._serialized_end=5457
+  _globals['_UPLOADJOB']._serialized_start=5460
+  _globals['_UPLOADJOB']._serialized_end=5589
+  _globals['_LISTUPLOADEDSOURCESREQUEST']._serialized_start=5591
+  _globals['_LISTUPLOADEDSOURCESREQUEST']._serialized_end=5678
+  _globals['_LISTUPLOADEDSOURCESRESPONSE']._serialized_start=5680
+  _globals['_LISTUPLOADEDSOURCESRESPONSE']._serialized_end=5787
+  _globals['_UPLOADEDSOURCE']._serialized_start=5789
+  _globals['_UPLOADEDSOURCE']._serialized_end=5842
+  _globals['_DELETEUPLOADEDSOURCEREQUEST']._serialized_start=5844
+  _globals['_DELETEUPLOADEDSOURCEREQUEST']._serialized_end=5887
+  _globals['_GEODATASERVICE']._serialized_start=5890
+  _globals['_GEODATASERVICE']._serialized_end=8017
 # @@protoc_insertion_point(module_scope)
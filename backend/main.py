@@ -1,7 +1,8 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, File, Form, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
+from starlette.datastructures import MutableHeaders
 from pydantic import BaseModel
 import uvicorn
 import grpc
@@ -10,10 +11,37 @@ import geo_pb2_grpc
 import recon_pb2
 import recon_pb2_grpc
 import httpx
+import ijson
 import json
 import asyncio
+import brotli
+import collections
+import contextlib
+import csv
+import functools
+import zlib
+import itertools
 import logging
+import math
+import os
+import shutil
+import socket
+import tempfile
 import time
+import typing
+import uuid
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pyogrio
+import pyogrio.errors
+import pyogrio.raw
+import pyproj
+import shapely
+from compression import zstd
 from config import settings
 
 logging.basicConfig(level=logging.INFO)
@@ -54,6 +82,19 @@ tags_metadata = [
     },
 ]
 
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    await update_targets()
+    watcher = asyncio.create_task(watch_project_changes()) if settings.project_cache_watch else None
+    resolver = asyncio.create_task(refresh_targets())
+    prober = asyncio.create_task(health_monitor.run())
+    yield
+    prober.cancel()
+    resolver.cancel()
+    if watcher:
+        watcher.cancel()
+    await close_channels()
+
 app = FastAPI(
     title=f"{settings.app_name} API",
     description=(
@@ -63,47 +104,805 @@ app = FastAPI(
     ),
     version="1.0.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
 
+class AdmissionRejected(Exception):
+    """The admission queue is full (or the wait timed out); retry after the given seconds."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+
+class AdmissionController:
+    """Global and per-user concurrency caps for one class of expensive endpoints.
+
+    Requests over a cap wait in per-user FIFO queues that are served round-robin, so a
+    user with 50 queued enrichments gets one slot per turn like everybody else instead
+    of holding the whole queue. Full queues are rejected at once (429 + Retry-After)
+    rather than piling up work the services cannot absorb.
+    """
+
+    def __init__(self, name: str, limit: int, per_user: int):
+        self.name = name
+        self.limit = limit
+        self.per_user = per_user
+        self.in_flight = 0
+        self.user_in_flight: collections.Counter = collections.Counter()
+        self.waiters: dict[str, collections.deque[asyncio.Future]] = {}
+        self.turns: collections.deque[str] = collections.deque()  # users with waiters
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_times = collections.deque(maxlen=1024)
+        self.service_time = 1.0  # moving average of request duration, for Retry-After
+
+    def retry_after(self, user: str) -> int:
+        """Rough seconds until this user could get a slot."""
+        ahead = len(self.waiters.get(user, ())) + self.user_in_flight[user]
+        return max(1, min(60, math.ceil(self.service_time * (ahead + 1) / self.per_user)))
+
+    async def acquire(self, user: str):
+        if user not in self.waiters and self.in_flight < self.limit and self.user_in_flight[user] < self.per_user:
+            self._admit(user)
+            self.wait_times.append(0.0)
+            return
+        queue = self.waiters.get(user, ())
+        if self.queued >= settings.admission_queue_max or len(queue) >= settings.admission_queue_per_user:
+            self.rejected += 1
+            raise AdmissionRejected(self.retry_after(user))
+
+        future = asyncio.get_running_loop().create_future()
+        if user not in self.waiters:
+            self.waiters[user] = collections.deque()
+            self.turns.append(user)
+        self.waiters[user].append(future)
+        self.queued += 1
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(settings.admission_queue_timeout):
+                await future
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                self.release(user, 0.0)  # granted just as the wait ended
+            else:
+                self._forget(user, future)
+            if isinstance(e, TimeoutError):
+                self.rejected += 1
+                raise AdmissionRejected(self.retry_after(user)) from None
+            raise
+        self.wait_times.append(time.monotonic() - start)
+
+    def release(self, user: str, duration: float):
+        self.in_flight -= 1
+        self.user_in_flight[user] -= 1
+        if not self.user_in_flight[user]:
+            del self.user_in_flight[user]
+        if duration:
+            self.service_time += 0.1 * (duration - self.service_time)
+        self._dispatch()
+
+    def _admit(self, user: str):
+        self.in_flight += 1
+        self.user_in_flight[user] += 1
+        self.admitted += 1
+
+    def _forget(self, user: str, future: asyncio.Future):
+        queue = self.waiters.get(user)
+        if queue is None or future not in queue:
+            return
+        queue.remove(future)
+        self.queued -= 1
+        if not queue:
+            del self.waiters[user]
+            self.turns.remove(user)
+
+    def _dispatch(self):
+        """Hand free slots to waiting users in round-robin order."""
+        skipped = 0
+        while self.turns and self.in_flight < self.limit and skipped < len(self.turns):
+            user = self.turns[0]
+            self.turns.rotate(-1)
+            if self.user_in_flight[user] >= self.per_user:
+                skipped += 1
+                continue
+            queue = self.waiters[user]
+            future = queue.popleft()
+            self.queued -= 1
+            if not queue:
+                del self.waiters[user]
+                self.turns.pop()
+            if future.done():  # cancelled, its waiter has not cleaned up yet
+                continue
+            self._admit(user)
+            future.set_result(None)
+            skipped = 0
+
+    def stats(self) -> dict:
+        wait_ms = sorted(t * 1000 for t in self.wait_times)
+        return {
+            "limit": self.limit,
+            "per_user_limit": self.per_user,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "users_active": len(self.user_in_flight),
+            "users_waiting": len(self.waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_ms_p50": round(wait_ms[len(wait_ms) // 2], 1) if wait_ms else 0.0,
+            "wait_ms_p99": round(wait_ms[int(len(wait_ms) * 0.99)], 1) if wait_ms else 0.0,
+            "wait_ms_max": round(wait_ms[-1], 1) if wait_ms else 0.0,
+            "avg_duration_ms": round(self.service_time * 1000, 1),
+        }
+
+# Admission per backend process; /api/enrich* and /api/recon* (incl. the SSE stream)
+ADMISSION = {
+    'enrich': AdmissionController('enrich', settings.enrich_admission_limit, settings.enrich_admission_per_user),
+    'recon': AdmissionController('recon', settings.recon_admission_limit, settings.recon_admission_per_user),
+}
+
+def admission_class(path: str) -> str | None:
+    if path.startswith(('/api/enrich', '/api/map/enrich')):
+        return 'enrich'
+    if path.startswith('/api/recon'):
+        return 'recon'
+    return None
+
+class AdmissionMiddleware:
+    """Admit expensive requests through their AdmissionController.
+
+    Plain ASGI (inside CORS, so a 429 is readable cross-origin, and inside auth, which
+    puts the user in the scope state): the slot is held until the response has been
+    sent completely, streamed SSE responses included.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        name = admission_class(scope['path']) if scope['type'] == 'http' and scope['method'] != 'OPTIONS' else None
+        user = scope.get('state', {}).get('user')
+        if name is None or user is None:
+            await self.app(scope, receive, send)
+            return
+        controller = ADMISSION[name]
+        try:
+            await controller.acquire(user)
+        except AdmissionRejected as e:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": f"Too many {name} requests in progress, retry later"},
+                headers={"Retry-After": str(e.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        start = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(user, time.monotonic() - start)
+
+# Added first so it ends up innermost (add_middleware wraps the existing stack)
+app.add_middleware(AdmissionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Page-Token"],
 )
 
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Preferred content coding of COMPRESSION_ENCODINGS that Accept-Encoding allows.
+
+    The client's q-values rank first, the configured order breaks ties; `*` stands for
+    every coding the header does not name.
+    """
+    quality = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if coding:
+            quality[coding.lower()] = q
+    ranked = [
+        (quality.get(coding, quality.get("*", 0.0)), -i, coding)
+        for i, coding in enumerate(settings.compression_encodings)
+    ]
+    q, _, coding = max(ranked, default=(0.0, 0, None))
+    return coding if q > 0 else None
+
+def make_compressor(encoding: str):
+    """(compress, flush) of a streaming compressor for a content coding."""
+    if encoding == "gzip":
+        compressor = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress, compressor.flush
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.compression_brotli_quality)
+        return compressor.process, compressor.finish
+    if encoding == "zstd":
+        compressor = zstd.ZstdCompressor(level=settings.compression_zstd_level)
+        return compressor.compress, compressor.flush
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+# Bodies from here on are compressed in a worker thread, so a multi-MB enrichment
+# does not hold the event loop
+COMPRESS_IN_THREAD_BYTES = 256 * 1024
+
+class CompressionMiddleware:
+    """Compress responses with the best coding the client accepts (zstd, br or gzip).
+
+    Plain ASGI so streamed bodies are compressed chunk by chunk as they are sent, never
+    buffered whole. Responses below COMPRESSION_MIN_SIZE, already encoded ones and SSE
+    streams (whose events must arrive as they happen) pass through unchanged.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not settings.compression_encodings:
+            await self.app(scope, receive, send)
+            return
+        accept = next((v.decode('latin-1') for k, v in scope['headers'] if k == b'accept-encoding'), '')
+        encoding = negotiate_encoding(accept)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compress = flush = None
+
+        async def compressed_send(message):
+            nonlocal start, compress, flush
+            if message['type'] == 'http.response.start':
+                start = message
+                MutableHeaders(raw=start['headers']).add_vary_header('Accept-Encoding')
+                return
+            if message['type'] != 'http.response.body':
+                # e.g. http.response.pathsend, whose body bypasses this middleware: the
+                # held start must go out first, unchanged
+                if start is not None:
+                    await send(start)
+                    start = None
+                await send(message)
+                return
+            body = message.get('body', b'')
+            more = message.get('more_body', False)
+            if start is not None:
+                headers = MutableHeaders(raw=start['headers'])
+                skip = (
+                    'content-encoding' in headers
+                    or headers.get('content-type', '').startswith('text/event-stream')
+                    or (not more and len(body) < settings.compression_min_size)
+                )
+                if not skip:
+                    compress, flush = make_compressor(encoding)
+                    headers['Content-Encoding'] = encoding
+                    del headers['Content-Length']
+                await send(start)
+                start = None
+            if compress is None:
+                await send(message)
+                return
+            if len(body) >= COMPRESS_IN_THREAD_BYTES:
+                body = await asyncio.to_thread(compress, body)
+            else:
+                body = compress(body)
+            if not more:
+                body += flush()
+            if body or not more:
+                await send({'type': 'http.response.body', 'body': body, 'more_body': more})
+
+        await self.app(scope, receive, compressed_send)
+
+app.add_middleware(CompressionMiddleware)
+
 AUTH_USER_HEADER = settings.auth_user_header
 DEV_IMPERSONATE_HEADER = settings.dev_impersonate_header
 
+def grpc_replicas(hosts: str, port: int) -> list[tuple[str, int]]:
+    """(host, port) of each entry of GEO_HOST / RECON_HOST.
+
+    Entries are host, host:port, an IPv6 address, or [IPv6 address]:port.
+    """
+    replicas = []
+    for replica in (h.strip() for h in hosts.split(',')):
+        if not replica:
+            continue
+        if replica.startswith('['):
+            host, _, rest = replica[1:].partition(']')
+            replicas.append((host, int(rest.removeprefix(':') or port)))
+        elif replica.count(':') == 1:
+            host, _, replica_port = replica.partition(':')
+            replicas.append((host, int(replica_port)))
+        else:
+            replicas.append((replica, port))
+    return replicas
+
+def host_port(host: str, port: int) -> str:
+    return f'[{host}]:{port}' if ':' in host else f'{host}:{port}'
+
+async def resolve_target(hosts: str, port: int) -> str:
+    """Channel target for a single DNS name, or a static comma-separated replica list.
+
+    A DNS name is re-resolved by gRPC and balanced over all its addresses. The names of
+    a static list are resolved here, in the loop's resolver thread, into an ipv4: (or,
+    with only IPv6 addresses, ipv6:) address list; refresh_targets repeats that.
+    """
+    replicas = grpc_replicas(hosts, port)
+    if len(replicas) == 1:
+        return f'dns:///{host_port(*replicas[0])}'
+    loop = asyncio.get_running_loop()
+    addresses = {socket.AF_INET: [], socket.AF_INET6: []}
+    for host, replica_port in replicas:
+        try:
+            infos = await loop.getaddrinfo(host, replica_port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            logger.warning("Cannot resolve gRPC replica %s: %s", host, e)
+            continue
+        for family, *_, sockaddr in infos:
+            address = host_port(sockaddr[0], sockaddr[1])
+            if family in addresses and address not in addresses[family]:
+                addresses[family].append(address)
+    # An ipv4:/ipv6: target holds one address family
+    if addresses[socket.AF_INET]:
+        return 'ipv4:' + ','.join(addresses[socket.AF_INET])
+    if addresses[socket.AF_INET6]:
+        return 'ipv6:' + ','.join(addresses[socket.AF_INET6])
+    # Nothing resolvable yet: let gRPC's resolver retry the first replica until the next refresh
+    return f'dns:///{host_port(*replicas[0])}'
+
+# RPCs that are safe to replay after the server may already have run them
+READ_RPCS = {
+    'geo.GeoDataService': (
+        'Health', 'EnrichPolygon', 'EnsureUserProject', 'ListUserProjects',
+        'CheckProjectAccess', 'ListProjectMembers', 'ListCustomPOIs', 'ListCustomAreas',
+        'ListIntersectingAreas', 'ListRoutes', 'GetUploadJob', 'ListUploadedSources',
+    ),
+    'recon.ReconService': ('Health', 'RunRecon', 'RunReconStream'),
+}
+
+def grpc_channel_options(service: str) -> list[tuple]:
+    """Keepalive, load-balancing, retry and outlier-ejection options for a service channel."""
+    lb_policy = {settings.grpc_lb_policy: {}}
+    if settings.grpc_outlier_failure_percent:
+        lb_policy = {"outlier_detection_experimental": {
+            "interval": "10s",
+            "baseEjectionTime": f"{settings.grpc_outlier_ejection_seconds}s",
+            "maxEjectionPercent": 50,
+            "failurePercentageEjection": {
+                "threshold": settings.grpc_outlier_failure_percent,
+                "enforcementPercentage": 100,
+                "minimumHosts": 2,
+                "requestVolume": settings.grpc_outlier_min_requests,
+            },
+            "childPolicy": [lb_policy],
+        }}
+    service_config = {"loadBalancingConfig": [lb_policy]}
+    if settings.grpc_retry_max_attempts > 1:
+        def method_config(names, codes):
+            return {
+                "name": names,
+                "retryPolicy": {
+                    "maxAttempts": settings.grpc_retry_max_attempts,
+                    "initialBackoff": "0.1s",
+                    "maxBackoff": "2s",
+                    "backoffMultiplier": 2,
+                    "retryableStatusCodes": codes,
+                },
+            }
+        service_config["methodConfig"] = [
+            # CANCELLED: calls refused by a draining geo worker (rolling restart). The
+            # worker may already have acted on the call, so only reads are replayed.
+            method_config([{"service": service, "method": m} for m in READ_RPCS.get(service, ())],
+                          ["UNAVAILABLE", "CANCELLED"]),
+            method_config([{"service": service}], ["UNAVAILABLE"]),
+        ]
+    return [
+        ('grpc.service_config', json.dumps(service_config)),
+        ('grpc.enable_retries', 1),
+        ('grpc.keepalive_time_ms', settings.grpc_keepalive_time_ms),
+        ('grpc.keepalive_timeout_ms', settings.grpc_keepalive_timeout_ms),
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.max_pings_without_data', 0),
+        ('grpc.max_receive_message_length', settings.grpc_max_receive_mb * 1024 * 1024),
+    ]
+
+_channels: dict[str, list[grpc.aio.Channel]] = {}
+_channel_turn = itertools.count()
+_targets: dict[str, str] = {}
+_retiring: set[asyncio.Task] = set()
+
+def grpc_services() -> dict[str, tuple[str, int]]:
+    """Hosts and port of each service the backend calls, by gRPC service name."""
+    return {
+        'geo.GeoDataService': (settings.geo_host, settings.geo_port),
+        'recon.ReconService': (settings.recon_host, settings.recon_port),
+    }
+
+async def update_targets():
+    """Resolve every service's target; channels whose target changed are replaced.
+
+    Replaced channels are closed in the background once their in-flight calls had
+    the longest call deadline to finish.
+    """
+    grace = max(settings.grpc_call_timeout, settings.enrich_timeout,
+                settings.recon_timeout, settings.upload_timeout)
+    for service, (hosts, port) in grpc_services().items():
+        target = await resolve_target(hosts, port)
+        if _targets.get(service) == target:
+            continue
+        if service in _targets:
+            logger.info("gRPC target of %s changed to %s", service, target)
+        _targets[service] = target
+        for channel in _channels.pop(service, []):
+            task = asyncio.create_task(channel.close(grace))
+            _retiring.add(task)
+            task.add_done_callback(_retiring.discard)
+
+async def refresh_targets():
+    """Re-resolve static replica lists every grpc_resolve_interval seconds."""
+    while True:
+        await asyncio.sleep(settings.grpc_resolve_interval)
+        try:
+            await update_targets()
+        except Exception:
+            logger.exception("Re-resolving gRPC targets failed")
+
+def shared_channel(service: str) -> grpc.aio.Channel:
+    """Process-wide grpc.aio channel for a service, created on first use (inside the
+    event loop) and never closed per request.
+
+    There are grpc_connections_per_host channels per service, each with its own
+    subchannels (and so its own TCP connections); calls rotate over them. A geo server
+    running several SO_REUSEPORT workers only balances per connection, so a single
+    connection would pin every call to one worker.
+    """
+    channels = _channels.get(service)
+    if channels is None:
+        options = [*grpc_channel_options(service), ('grpc.use_local_subchannel_pool', 1)]
+        channels = _channels[service] = [
+            grpc.aio.insecure_channel(_targets[service], options=options)
+            for _ in range(max(1, settings.grpc_connections_per_host))
+        ]
+    return channels[next(_channel_turn) % len(channels)]
+
+@contextlib.contextmanager
 def get_geo_channel():
-    """Create a gRPC channel to the geo service."""
-    return grpc.insecure_channel(f'{settings.geo_host}:{settings.geo_port}')
+    """Shared gRPC channel to the geo service (left open after the with block)."""
+    yield shared_channel('geo.GeoDataService')
 
+@contextlib.contextmanager
 def get_recon_channel():
-    """Create a gRPC channel to the recon service."""
-    return grpc.insecure_channel(f'{settings.recon_host}:{settings.recon_port}')
+    """Shared gRPC channel to the recon service (left open after the with block)."""
+    yield shared_channel('recon.ReconService')
+
+async def close_channels():
+    """Close the shared gRPC channels (on application shutdown)."""
+    channels = [channel for pool in _channels.values() for channel in pool]
+    _channels.clear()
+    for task in list(_retiring):
+        task.cancel()
+    for channel in channels:
+        await channel.close()
+
+def grpc_error_status(e: grpc.RpcError) -> int:
+    """HTTP status for a failed service call: 504 once its deadline passed, else 503."""
+    return 504 if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED else 503
+
+# nginx's "client closed request", returned (and logged) for calls cancelled because
+# the client went away
+CLIENT_CLOSED_REQUEST = 499
+
+class ClientDisconnected(Exception):
+    """The HTTP client disconnected before the service call finished."""
+
+async def unless_disconnected(request: Request, call):
+    """Await a gRPC call, cancelling it as soon as the HTTP client disconnects.
+
+    A closed tab or a redrawn polygon then stops the work in the service (Overpass
+    query, PostGIS statements, recon lookups) instead of leaving it to run to its
+    deadline for nobody.
+    """
+    async def disconnected():
+        while (await request.receive())['type'] != 'http.disconnect':
+            pass
+
+    pending = asyncio.ensure_future(call)
+    watcher = asyncio.ensure_future(disconnected())
+    try:
+        await asyncio.wait({pending, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+    if not pending.done():
+        call.cancel()
+        pending.cancel()
+        raise ClientDisconnected()
+    return pending.result()
+
+NEXT_PAGE_TOKEN_HEADER = "X-Next-Page-Token"
+
+# Page size the backend asks for when it walks all pages itself (geo clamps it to LIST_MAX_PAGE_SIZE)
+UNPAGED_PAGE_SIZE = 5000
+
+# Error geo returns for a page_token it cannot decode
+INVALID_PAGE_TOKEN = 'invalid page_token'
+
+async def list_pages(method, message, field: str, timeout: float):
+    """Call a List* RPC; paging is opt-in for API clients.
 
-def ensure_user_project_id(username: str) -> str:
+    With page_size or page_token set in message this returns that one page. Otherwise
+    pages are fetched, following next_page_token, and merged into one response until
+    list_max_items rows are collected; the result then keeps the cursor of the rest.
+    """
+    if message.page_size or message.page_token:
+        return await method(message, timeout=timeout)
+    message.page_size = UNPAGED_PAGE_SIZE
+    result = await method(message, timeout=timeout)
+    items = getattr(result, field)
+    while result.next_page_token and not result.error and len(items) < settings.list_max_items:
+        message.page_token = result.next_page_token
+        page = await method(message, timeout=timeout)
+        if page.error:
+            return page
+        items.extend(getattr(page, field))
+        result.next_page_token = page.next_page_token
+    return result
+
+def list_error_status(error: str, default: int = 500) -> int:
+    """HTTP status for a List* error: 400 for a bad page_token, else the endpoint's default."""
+    return 400 if error == INVALID_PAGE_TOKEN else default
+
+def set_next_page_token(response: Response, token: str):
+    """Expose the keyset cursor for the following page (list bodies stay plain arrays)."""
+    if token:
+        response.headers[NEXT_PAGE_TOKEN_HEADER] = token
+
+# Fixed-point scale of the geo service's packed_coordinates (1e-7 degrees)
+COORD_PACK_SCALE = 10_000_000
+
+def pack_coordinates(coordinates) -> list[int]:
+    """Delta-encode API coordinates into PolygonRequest.packed_coordinates."""
+    xy = np.array([(c.lng, c.lat) for c in coordinates], dtype=np.float64).reshape(-1, 2)
+    fixed = np.rint(xy * COORD_PACK_SCALE).astype(np.int64)
+    return np.diff(fixed, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel().tolist()
+
+def area_points(area) -> list:
+    """(lng, lat) pairs of a geo CustomAreaResponse, decoding packed_coordinates when present."""
+    if area.packed_coordinates:
+        deltas = np.asarray(area.packed_coordinates, dtype=np.int64).reshape(-1, 2)
+        return (np.cumsum(deltas, axis=0) / COORD_PACK_SCALE).tolist()
+    return [(c.lng, c.lat) for c in area.coordinates]
+
+def area_coordinates(area) -> list:
+    """Coordinates of a geo CustomAreaResponse, decoding packed_coordinates when present."""
+    return [Coordinate(lng=lng, lat=lat) for lng, lat in area_points(area)]
+
+def area_dict(area) -> dict:
+    """CustomAreaResponse-shaped dict of a geo area, for responses that skip pydantic."""
+    return {
+        "id": area.id, "name": area.name, "description": area.description,
+        "coordinates": [{"lat": lat, "lng": lng} for lng, lat in area_points(area)],
+        "metadata": json.loads(area.metadata_json) if area.metadata_json else {},
+        "error": area.error
+    }
+
+def poi_dict(poi) -> dict:
+    """CustomPOIResponse-shaped dict of a geo POI, for responses that skip pydantic."""
+    return {
+        "id": poi.id, "name": poi.name, "category": poi.category,
+        "description": poi.description, "phone": poi.phone, "website": poi.website,
+        "lat": poi.lat, "lng": poi.lng,
+        "tags": json.loads(poi.tags_json) if poi.tags_json else {}, "error": ""
+    }
+
+BUSINESS_FIELDS = ('name', 'lat', 'lng', 'type', 'address', 'phone', 'website', 'email', 'source', 'id', 'description')
+
+def business_columns(response) -> dict:
+    """BusinessColumns fields of a geo EnrichmentResponse as plain lists (encoding row-form businesses)."""
+    if response.HasField('business_columns') or not response.businesses:
+        columns = response.business_columns
+        return {field.name: list(getattr(columns, field.name)) for field in columns.DESCRIPTOR.fields}
+    columns = {f: [getattr(b, f) for b in response.businesses] for f in BUSINESS_FIELDS}
+    for field in ('type', 'source'):
+        codes = {}
+        columns[f'{field}_index'] = [codes.setdefault(v, len(codes)) for v in columns.pop(field)]
+        columns[f'{field}_values'] = list(codes)
+    return columns
+
+def iter_business_rows(columns: dict):
+    """Expand business_columns into Business-shaped row dicts, one at a time."""
+    types = map(columns['type_values'].__getitem__, columns['type_index'])
+    sources = map(columns['source_values'].__getitem__, columns['source_index'])
+    for row in zip(
+        columns['name'], columns['lat'], columns['lng'], types, columns['address'], columns['phone'],
+        columns['website'], columns['email'], sources, columns['id'], columns['description']
+    ):
+        yield dict(zip(BUSINESS_FIELDS, row))
+
+def business_rows(columns: dict) -> list[dict]:
+    """Expand business_columns into Business-shaped row dicts."""
+    return list(iter_business_rows(columns))
+
+ARROW_STREAM_MEDIA_TYPE = 'application/vnd.apache.arrow.stream'
+ARROW_RESPONSE_DOC = {200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}, "description": "JSON, or an Arrow IPC stream when requested via Accept"}}
+
+def wants_arrow(request: Request) -> bool:
+    """Whether the client asked for an Arrow IPC stream in Accept (JSON stays the default)."""
+    return ARROW_STREAM_MEDIA_TYPE in request.headers.get('accept', '')
+
+def arrow_response(table: pa.Table, metadata: dict | None = None) -> Response:
+    """Serialise a table as an Arrow IPC stream; metadata values go JSON-encoded into the schema."""
+    if metadata:
+        table = table.replace_schema_metadata({k: json.dumps(v) for k, v in metadata.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+def business_table(columns: dict) -> pa.Table:
+    """Arrow table of business_columns; type and source stay dictionary-encoded."""
+    arrays = {}
+    for field in BUSINESS_FIELDS:
+        if field in ('type', 'source'):
+            arrays[field] = pa.DictionaryArray.from_arrays(
+                pa.array(columns[f'{field}_index'], pa.int32()),
+                pa.array(columns[f'{field}_values'], pa.string())
+            )
+        else:
+            arrays[field] = pa.array(columns[field], pa.float64() if field in ('lat', 'lng') else pa.string())
+    return pa.table(arrays)
+
+def fast_json_response(content) -> Response:
+    """JSON response encoded with orjson, skipping response_model validation.
+
+    Only for content already shaped like the endpoint's response_model (e.g. built by
+    proto_encoder); the model still drives the OpenAPI schema.
+    """
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+def should_stream_json(item_count: int) -> bool:
+    return 0 < settings.json_stream_min_items <= item_count
+
+def iter_json_array(items):
+    """A JSON array of items, encoded JSON_STREAM_BATCH_ITEMS at a time."""
+    yield b'['
+    separator = b''
+    for batch in itertools.batched(items, settings.json_stream_batch_items):
+        yield separator + orjson.dumps(batch)[1:-1]
+        separator = b','
+    yield b']'
+
+def streaming_json_response(items, envelope: dict | None = None, key: str = '') -> StreamingResponse:
+    """Like fast_json_response, but items are converted and sent in batches.
+
+    The body is the array of items, or the envelope object with the array under key.
+    Items may be a lazy iterable: the generator runs in Starlette's threadpool, so
+    neither the event loop nor a full serialised body is held while it runs (the
+    compression middleware compresses each batch as it passes).
+    """
+    def body():
+        if envelope is not None:
+            yield b'{' + orjson.dumps(key) + b':'
+        yield from iter_json_array(items)
+        if envelope is not None:
+            rest = orjson.dumps(envelope)
+            yield b',' + rest[1:] if len(rest) > 2 else b'}'
+    return StreamingResponse(body(), media_type="application/json")
+
+def proto_encoder(model: type[BaseModel]):
+    """Build a function turning a proto message into a dict shaped like `model`.
+
+    Fields are read by name from the message, recursing into nested models, so the
+    output matches what response_model would serialise without building models.
+    Each field's converter is resolved once, here; scalars are copied as they are.
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        item = typing.get_args(annotation)[0] if typing.get_origin(annotation) is list else None
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            convert = proto_encoder(annotation)
+        elif isinstance(item, type) and issubclass(item, BaseModel):
+            convert = functools.partial(encode_each, proto_encoder(item))
+        elif item is not None:
+            convert = list
+        else:
+            convert = None
+        fields.append((name, convert))
+
+    def encode(m):
+        return {name: getattr(m, name) if convert is None else convert(getattr(m, name))
+                for name, convert in fields}
+    return encode
+
+def encode_each(encode, messages) -> list:
+    return [encode(m) for m in messages]
+
+# ('default', user) -> project id and ('access', user, project) -> bool, each with an expiry
+_project_cache: dict[tuple, tuple[float, str | bool]] = {}
+
+def project_cache_get(key: tuple):
+    entry = _project_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def project_cache_put(key: tuple, value: str | bool):
+    if settings.project_cache_ttl <= 0:
+        return
+    _project_cache.pop(key, None)
+    if len(_project_cache) >= settings.project_cache_max_entries:
+        # Insertion order: the first entry is the one closest to expiry
+        del _project_cache[next(iter(_project_cache))]
+    _project_cache[key] = (time.monotonic() + settings.project_cache_ttl, value)
+
+def invalidate_project_cache(project_id: str = '', usernames=()):
+    """Drop cached lookups a project or membership change may have made stale.
+
+    That is every entry of the given users, access entries for the project, and
+    defaults pointing at it.
+    """
+    usernames = set(usernames)
+    for key, (_, value) in list(_project_cache.items()):
+        if key[1] in usernames or (project_id and project_id in (key[-1], value)):
+            del _project_cache[key]
+
+async def watch_project_changes():
+    """Invalidate cached lookups on geo's change notifications, resubscribing after errors."""
+    while True:
+        try:
+            with get_geo_channel() as channel:
+                stub = geo_pb2_grpc.GeoDataServiceStub(channel)
+                async for change in stub.WatchProjectChanges(geo_pb2.WatchProjectChangesRequest()):
+                    invalidate_project_cache(change.project_id, change.usernames)
+        except grpc.RpcError as e:
+            logger.warning(f"Project change watch interrupted: {e.details()}")
+        except Exception:
+            # Anything else must not end the task, or invalidation stops until restart
+            logger.exception("Project change watch failed")
+        # Changes may have been missed while disconnected
+        _project_cache.clear()
+        await asyncio.sleep(5)
+
+async def ensure_user_project_id(username: str) -> str:
+    project_id = project_cache_get(('default', username))
+    if project_id is not None:
+        return project_id
     with get_geo_channel() as channel:
         stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-        resp = stub.EnsureUserProject(geo_pb2.EnsureUserProjectRequest(username=username))
+        resp = await stub.EnsureUserProject(geo_pb2.EnsureUserProjectRequest(username=username), timeout=settings.grpc_call_timeout)
         if resp.error:
             raise RuntimeError(resp.error)
+        project_cache_put(('default', username), resp.id)
         return resp.id
 
-def check_project_access(username: str, project_id: str) -> bool:
+async def check_project_access(username: str, project_id: str) -> bool:
+    allowed = project_cache_get(('access', username, project_id))
+    if allowed is not None:
+        return allowed
     with get_geo_channel() as channel:
         stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-        resp = stub.CheckProjectAccess(geo_pb2.CheckProjectAccessRequest(username=username, project_id=project_id))
+        resp = await stub.CheckProjectAccess(geo_pb2.CheckProjectAccessRequest(username=username, project_id=project_id), timeout=settings.grpc_call_timeout)
         if resp.error:
             raise RuntimeError(resp.error)
+        # Only grants are cached: a user just added on another worker must not stay
+        # locked out until a cached denial expires
+        if resp.allowed:
+            project_cache_put(('access', username, project_id), True)
         return bool(resp.allowed)
 
-def resolve_project_id(request: Request, override: str | None) -> str:
+async def resolve_project_id(request: Request, override: str | None) -> str:
     project_id = request.state.project_id
     if override and override != project_id:
-        if not check_project_access(request.state.user, override):
+        if not await check_project_access(request.state.user, override):
             raise HTTPException(status_code=403, detail="Not a member of that project")
         project_id = override
     return project_id
@@ -128,7 +927,7 @@ async def auth_and_log(request: Request, call_next):
     if user:
         request.state.user = user
         try:
-            request.state.project_id = ensure_user_project_id(user)
+            request.state.project_id = await ensure_user_project_id(user)
         except Exception as e:
             duration_ms = int((time.perf_counter() - start) * 1000)
             logger.exception(
@@ -170,6 +969,7 @@ class PolygonRequest(BaseModel):
     coordinates: list[Coordinate]
     sources: list[str] = []
     project_id: str | None = None
+    columnar: bool = False  # /api/enrich: return business_columns instead of businesses
 
     model_config = {
         "json_schema_extra": {
@@ -198,12 +998,29 @@ class Business(BaseModel):
     id: str = ''
     description: str = ''
 
+class BusinessColumns(BaseModel):
+    """Businesses as parallel columns; type and source are dictionary-encoded."""
+    lat: list[float]
+    lng: list[float]
+    type_values: list[str]
+    type_index: list[int]
+    source_values: list[str]
+    source_index: list[int]
+    name: list[str]
+    address: list[str]
+    phone: list[str]
+    website: list[str]
+    email: list[str]
+    id: list[str]
+    description: list[str]
+
 class EnrichmentResponse(BaseModel):
     area_km2: float
     estimated_population: int
     region_type: str
     nearby_features: list[str]
     businesses: list[Business]
+    business_columns: BusinessColumns | None = None
     error: str = ''
 
 class CreateProjectRequest(BaseModel):
@@ -287,6 +1104,8 @@ class DomainRecon(BaseModel):
 class ReconResponse(BaseModel):
     results: list[DomainRecon]
 
+encode_domain_recon = proto_encoder(DomainRecon)
+
 # Nominatim models
 class NominatimResult(BaseModel):
     place_id: int
@@ -409,6 +1228,7 @@ class UploadSourceRequest(BaseModel):
     name: str
     geojson: str
     project_id: str | None = None
+    id_property: str = ''
 
     model_config = {
         "json_schema_extra": {
@@ -423,6 +1243,20 @@ class UploadSourceResponse(BaseModel):
     name: str
     feature_count: int
     error: str = ''
+    job_id: str = ''
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    duplicate_locations: int = 0
+
+class UploadJobResponse(BaseModel):
+    job_id: str
+    source_name: str
+    status: str
+    features_received: int
+    feature_count: int
+    error: str = ''
 
 class UploadedSource(BaseModel):
     name: str
@@ -468,121 +1302,182 @@ class SavedRouteResponse(BaseModel):
     stops: list[RouteStop]
     created_at: str
 
+class ProjectSummary(BaseModel):
+    id: str
+    name: str
+    role: str
+
+class BootstrapResponse(BaseModel):
+    user: str
+    project_id: str  # default project, as in /api/me
+    dev_mode: bool
+    # Sections not in include= are absent; a section is null when its geo call
+    # failed, and errors[section] says why
+    health: dict | None = None
+    projects: list[ProjectSummary] | None = None
+    pois: list[CustomPOIResponse] | None = None
+    areas: list[CustomAreaResponse] | None = None
+    datasources: list[UploadedSource] | None = None
+    # First page only: continue with page_token on /api/pois, /api/areas(/intersect), /api/datasources
+    next_page_tokens: dict[str, str] = {}
+    errors: dict[str, str] = {}
+
 @app.get("/", tags=["system"], include_in_schema=False)
 async def root():
     return {"message": f"Welcome to {settings.app_name} API"}
 
-@app.get("/api/health", tags=["system"], summary="Service health")
-async def health_check(request: Request, project_id: str | None = None):
-    """Health check endpoint that tests all services"""
-    health_status = {
-        "status": "healthy",
-        "services": {
-            "backend": {"status": "healthy", "message": "Backend API operational"},
-            "geo": {"status": "unknown", "message": "Not checked"},
-            "recon": {"status": "unknown", "message": "Not checked"}
-        }
-    }
+class HealthMonitor:
+    """Background prober behind /api/health.
 
-    # Check geo service
-    try:
-        with get_geo_channel() as channel:
-            stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            response = stub.Health(
-                geo_pb2.HealthRequest(),
-                timeout=2.0
-            )
-            health_status["services"]["geo"] = {
-                "status": response.status,
-                "message": response.message
-            }
-    except grpc.RpcError as e:
-        health_status["services"]["geo"] = {
-            "status": "unhealthy",
-            "message": f"gRPC error: {e.code().name}"
-        }
-        health_status["status"] = "degraded"
-    except Exception as e:
-        health_status["services"]["geo"] = {
-            "status": "unhealthy",
-            "message": f"Connection failed: {str(e)}"
-        }
-        health_status["status"] = "degraded"
+    Every HEALTH_PROBE_INTERVAL seconds geo (asked to run SELECT 1 through its primary
+    and additional PostGIS pools) and recon are probed concurrently. /api/health serves
+    the latest snapshot instantly instead of probing on every topbar poll; each
+    dependency keeps its last HEALTH_HISTORY_SIZE probe latencies (None = failed).
+    """
 
-    # Check recon service
-    try:
-        with get_recon_channel() as channel:
-            stub = recon_pb2_grpc.ReconServiceStub(channel)
-            # Call health check endpoint (doesn't hit external services)
-            response = stub.Health(
-                recon_pb2.HealthRequest(),
-                timeout=2.0
-            )
-            health_status["services"]["recon"] = {
-                "status": response.status,
-                "message": response.message
-            }
-    except grpc.RpcError as e:
-        health_status["services"]["recon"] = {
-            "status": "unhealthy",
-            "message": f"gRPC error: {e.code().name}"
-        }
-        health_status["status"] = "degraded"
-    except Exception as e:
-        health_status["services"]["recon"] = {
-            "status": "unhealthy",
-            "message": f"Connection failed: {str(e)}"
-        }
-        health_status["status"] = "degraded"
+    def __init__(self):
+        self.snapshot: dict | None = None
+        self.history: dict[str, collections.deque] = {}
+        self._first_probe = asyncio.Lock()
 
-    # Probe additional PostGIS datasources via TCP
-    import socket
-    from urllib.parse import urlparse as _urlparse
+    def _record(self, key: str, entry: dict, latency_ms: float | None) -> dict:
+        history = self.history.setdefault(key, collections.deque(maxlen=settings.health_history_size))
+        history.append(None if latency_ms is None else round(latency_ms, 1))
+        entry["latency_ms"] = history[-1]
+        entry["latency_history_ms"] = list(history)
+        return entry
 
-    datasources = [
-        {
-            "name": "Primary (PostGIS)",
-            "status": "online" if health_status["services"]["geo"]["status"] == "healthy" else "error",
-            "message": health_status["services"]["geo"]["message"]
+    async def probe_geo(self) -> tuple[dict, float | None, list]:
+        start = time.perf_counter()
+        try:
+            with get_geo_channel() as channel:
+                stub = geo_pb2_grpc.GeoDataServiceStub(channel)
+                response = await stub.Health(
+                    geo_pb2.HealthRequest(check_datasources=True),
+                    timeout=settings.health_probe_timeout
+                )
+        except grpc.RpcError as e:
+            return {"status": "unhealthy", "message": f"gRPC error: {e.code().name}"}, None, []
+        except Exception as e:
+            return {"status": "unhealthy", "message": f"Connection failed: {str(e)}"}, None, []
+        service = {
+            "status": response.status,
+            "message": response.message,
+            "worker_id": response.worker_id,
+            # Per-RPC-class load of the answering geo worker (slots, queue times, DB pool partition)
+            "bulkheads": [
+                {field: getattr(b, field) for field in b.DESCRIPTOR.fields_by_name}
+                for b in response.bulkheads
+            ]
         }
-    ]
+        return service, (time.perf_counter() - start) * 1000, list(response.datasources)
 
-    try:
-        additional = json.loads(settings.geo_additional_dbs)
-    except Exception:
-        additional = []
-
-    for db in additional:
+    async def probe_recon(self) -> tuple[dict, float | None]:
+        start = time.perf_counter()
         try:
-            parsed = _urlparse(db.get("url", ""))
-            host = parsed.hostname or "localhost"
-            port = parsed.port or 5432
-            sock = socket.create_connection((host, port), timeout=2.0)
-            sock.close()
-            datasources.append({"name": db["name"], "status": "online", "message": "reachable"})
+            with get_recon_channel() as channel:
+                stub = recon_pb2_grpc.ReconServiceStub(channel)
+                # Health doesn't hit external services
+                response = await stub.Health(recon_pb2.HealthRequest(), timeout=settings.health_probe_timeout)
+        except grpc.RpcError as e:
+            return {"status": "unhealthy", "message": f"gRPC error: {e.code().name}"}, None
         except Exception as e:
-            datasources.append({"name": db.get("name", "unknown"), "status": "error", "message": str(e)})
+            return {"status": "unhealthy", "message": f"Connection failed: {str(e)}"}, None
+        return {"status": response.status, "message": response.message}, (time.perf_counter() - start) * 1000
 
-    # Add uploaded sources (in-memory)
-    try:
-        effective_project_id = resolve_project_id(request, project_id)
-        with get_geo_channel() as channel:
-            stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            response = stub.ListUploadedSources(
-                geo_pb2.ListUploadedSourcesRequest(project_id=effective_project_id)
-            )
-            for src in response.sources:
-                datasources.append({
-                    "name": src.name,
-                    "status": "online",
-                    "message": f"{src.feature_count} features (uploaded)"
-                })
-    except Exception:
-        pass  # Silently skip if geo service unavailable
+    async def refresh(self):
+        (geo, geo_ms, checks), (recon, recon_ms) = await asyncio.gather(self.probe_geo(), self.probe_recon())
+        checks = {check.name: check for check in checks}
+
+        try:
+            additional = [db["name"] for db in json.loads(settings.geo_additional_dbs)]
+        except Exception:
+            additional = []
+        datasources = []
+        for key, name in [("primary", "Primary (PostGIS)"), *((db, db) for db in additional)]:
+            check = checks.get(key)
+            if check is None:
+                message = geo["message"] if geo["status"] != "healthy" else "not configured in geo"
+                entry, latency = {"name": name, "status": "error", "message": message}, None
+            else:
+                entry = {"name": name, "status": check.status, "message": check.message}
+                latency = check.latency_ms if check.status == "online" else None
+            datasources.append(self._record(f"datasource:{key}", entry, latency))
+
+        self.snapshot = {
+            "status": "healthy" if geo["status"] == recon["status"] == "healthy" else "degraded",
+            "checked_at": time.time(),
+            "services": {
+                "backend": {"status": "healthy", "message": "Backend API operational"},
+                "geo": self._record("geo", geo, geo_ms),
+                "recon": self._record("recon", recon, recon_ms),
+            },
+            "datasources": datasources,
+        }
+
+    async def run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Health probe failed")
+            await asyncio.sleep(settings.health_probe_interval)
+
+    async def current(self) -> dict:
+        if self.snapshot is None:  # first request before the first probe finished
+            async with self._first_probe:
+                if self.snapshot is None:
+                    await self.refresh()
+        return self.snapshot
+
+health_monitor = HealthMonitor()
+
+# project_id -> (expires, uploaded source entries) for /api/health
+_uploaded_datasources: dict[str, tuple[float, list[dict]]] = {}
+
+async def uploaded_datasources(project_id: str) -> list[dict]:
+    """Uploaded sources of a project as health datasource entries, cached for one probe interval."""
+    cached = _uploaded_datasources.get(project_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    with get_geo_channel() as channel:
+        stub = geo_pb2_grpc.GeoDataServiceStub(channel)
+        response = await list_pages(
+            stub.ListUploadedSources, geo_pb2.ListUploadedSourcesRequest(project_id=project_id),
+            'sources', settings.health_probe_timeout
+        )
+    entries = [
+        {"name": src.name, "status": "online", "message": f"{src.feature_count} features (uploaded)"}
+        for src in response.sources
+    ]
+    if len(_uploaded_datasources) >= settings.project_cache_max_entries:
+        del _uploaded_datasources[next(iter(_uploaded_datasources))]
+    _uploaded_datasources[project_id] = (time.monotonic() + settings.health_probe_interval, entries)
+    return entries
+
+def invalidate_uploaded_datasources(project_id: str):
+    _uploaded_datasources.pop(project_id, None)
 
-    health_status["datasources"] = datasources
+def health_payload(snapshot: dict, uploaded: list[dict]) -> dict:
+    return {
+        **snapshot,
+        "datasources": snapshot["datasources"] + uploaded,
+        # Admission queues of this backend process
+        "admission": {name: controller.stats() for name, controller in ADMISSION.items()},
+    }
 
-    return health_status
+@app.get("/api/health", tags=["system"], summary="Service health")
+async def health_check(request: Request, project_id: str | None = None):
+    """Latest background health snapshot of all services and datasources, plus the
+    project's uploaded sources and this process's admission queues."""
+    snapshot = await health_monitor.current()
+    uploaded = []
+    if snapshot["services"]["geo"]["status"] == "healthy":
+        try:
+            uploaded = await uploaded_datasources(await resolve_project_id(request, project_id))
+        except Exception:
+            pass  # Silently skip if geo service unavailable
+    return health_payload(snapshot, uploaded)
 
 @app.get("/api/me", tags=["auth"], summary="Current user identity")
 async def get_current_user(request: Request):
@@ -598,12 +1493,145 @@ async def list_projects(request: Request):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            resp = stub.ListUserProjects(geo_pb2.ListUserProjectsRequest(username=request.state.user))
+            resp = await stub.ListUserProjects(geo_pb2.ListUserProjectsRequest(username=request.state.user), timeout=settings.grpc_call_timeout)
             if resp.error:
                 raise HTTPException(status_code=500, detail=resp.error)
             return [{"id": p.id, "name": p.name, "role": p.role} for p in resp.projects]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
+
+# Sections /api/bootstrap can return, selected with include=
+BOOTSTRAP_SECTIONS = ("projects", "health", "pois", "areas", "datasources")
+
+@app.get("/api/bootstrap", response_model=BootstrapResponse, tags=["system"], summary="Everything the app needs on load")
+async def bootstrap(
+    request: Request,
+    project_id: str | None = None,
+    include: str = ",".join(BOOTSTRAP_SECTIONS),
+    min_lat: float | None = None,
+    min_lng: float | None = None,
+    max_lat: float | None = None,
+    max_lng: float | None = None,
+    zoom: int | None = None,
+    page_size: int | None = None
+):
+    """
+    `/api/me`, `/api/projects`, `/api/health`, `/api/pois`, `/api/areas` and
+    `/api/datasources` in one request. The user and project are resolved once and
+    the geo calls run concurrently, and the one body is compressed like any other.
+    `user` / `project_id` (the default project) are those of `/api/me`; the other
+    sections belong to the `project_id` query parameter, as on the single endpoints.
+
+    `include` is a comma-separated subset of `projects`, `health`, `pois`, `areas`
+    and `datasources` (default: all); sections left out are not queried and are
+    absent from the response.
+
+    With all four bbox parameters, POIs and areas are limited to the bbox (areas that
+    intersect it). `zoom` simplifies area rings as on `GET /api/areas`. Lists are
+    complete unless `page_size` is given; then they hold their first page and
+    `next_page_tokens` has the cursor of each list with more rows.
+    A failed geo call leaves its section `null` with the reason in `errors`, so the
+    rest of the app still loads.
+    """
+    wanted = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = wanted.difference(BOOTSTRAP_SECTIONS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown bootstrap sections: {', '.join(sorted(unknown))}")
+    effective_project_id = await resolve_project_id(request, project_id)
+    bbox = (min_lat, min_lng, max_lat, max_lng)
+    has_bbox = None not in bbox
+    result = {
+        "user": request.state.user,
+        "project_id": request.state.project_id,
+        "dev_mode": settings.dev_mode,
+        "next_page_tokens": {},
+        "errors": {},
+    }
+
+    with get_geo_channel() as channel:
+        stub = geo_pb2_grpc.GeoDataServiceStub(channel)
+
+        async def section(name: str, call, convert):
+            try:
+                response = await call
+            except grpc.RpcError as e:
+                result["errors"][name] = f"Geo service error: {e.details() or e.code().name}"
+                result[name] = None
+                return
+            if response.error:
+                result["errors"][name] = response.error
+                result[name] = None
+                return
+            result[name] = convert(response)
+            if getattr(response, 'next_page_token', ''):
+                result["next_page_tokens"][name] = response.next_page_token
+
+        def areas_call():
+            if has_bbox:
+                ring = [Coordinate(lat=lat, lng=lng) for lat, lng in (
+                    (min_lat, min_lng), (min_lat, max_lng), (max_lat, max_lng), (max_lat, min_lng), (min_lat, min_lng)
+                )]
+                return list_pages(stub.ListIntersectingAreas, geo_pb2.PolygonRequest(
+                    packed_coordinates=pack_coordinates(ring),
+                    project_id=effective_project_id,
+                    page_size=page_size or 0,
+                    zoom=zoom,
+                    packed_response=True
+                ), 'areas', settings.grpc_call_timeout)
+            return list_pages(stub.ListCustomAreas, geo_pb2.ListCustomAreasRequest(
+                project_id=effective_project_id,
+                page_size=page_size or 0,
+                zoom=zoom,
+                packed_response=True
+            ), 'areas', settings.grpc_call_timeout)
+
+        async def health():
+            snapshot = await health_monitor.current()
+            uploaded = []
+            # Without the datasources section, uploaded sources come from the health cache
+            if "datasources" not in wanted and snapshot["services"]["geo"]["status"] == "healthy":
+                try:
+                    uploaded = await uploaded_datasources(effective_project_id)
+                except Exception:
+                    pass  # Silently skip if geo service unavailable
+            return snapshot, uploaded
+
+        # name -> (start the geo call, convert its response); calls start only when included
+        sections = {
+            "projects": (lambda: stub.ListUserProjects(
+                geo_pb2.ListUserProjectsRequest(username=request.state.user),
+                timeout=settings.grpc_call_timeout
+            ), lambda r: [{"id": p.id, "name": p.name, "role": p.role} for p in r.projects]),
+            "pois": (lambda: list_pages(stub.ListCustomPOIs, geo_pb2.ListCustomPOIsRequest(
+                min_lat=min_lat or 0.0,
+                min_lng=min_lng or 0.0,
+                max_lat=max_lat or 0.0,
+                max_lng=max_lng or 0.0,
+                project_id=effective_project_id,
+                page_size=page_size or 0
+            ), 'pois', settings.grpc_call_timeout), lambda r: list(map(poi_dict, r.pois))),
+            "areas": (areas_call, lambda r: list(map(area_dict, r.areas))),
+            "datasources": (lambda: list_pages(
+                stub.ListUploadedSources,
+                geo_pb2.ListUploadedSourcesRequest(project_id=effective_project_id, page_size=page_size or 0),
+                'sources', settings.grpc_call_timeout
+            ), lambda r: [{"name": src.name, "feature_count": src.feature_count} for src in r.sources]),
+        }
+        health_result, *_ = await asyncio.gather(
+            health() if "health" in wanted else asyncio.sleep(0),
+            *(section(name, start(), convert) for name, (start, convert) in sections.items() if name in wanted)
+        )
+
+    if "health" in wanted:
+        snapshot, uploaded = health_result
+        if "datasources" in wanted:
+            # The health datasources list the uploaded sources already fetched above
+            uploaded = [
+                {"name": src["name"], "status": "online", "message": f"{src['feature_count']} features (uploaded)"}
+                for src in result["datasources"] or ()
+            ]
+        result["health"] = health_payload(snapshot, uploaded)
+    return fast_json_response(result)
 
 @app.post("/api/projects", tags=["auth"], summary="Create project")
 async def create_project(payload: CreateProjectRequest, request: Request):
@@ -613,32 +1641,36 @@ async def create_project(payload: CreateProjectRequest, request: Request):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            resp = stub.CreateProject(
-                geo_pb2.CreateProjectRequest(name=name, username=request.state.user)
+            resp = await stub.CreateProject(
+                geo_pb2.CreateProjectRequest(name=name, username=request.state.user),
+                timeout=settings.grpc_call_timeout
             )
             if resp.error:
                 logger.error(f'[PROJECT CREATE] user="{request.state.user}" name="{name}" error="{resp.error}"')
                 raise HTTPException(status_code=400, detail=resp.error)
+            invalidate_project_cache(resp.id, [request.state.user])
             logger.info(f'[PROJECT CREATE] user="{request.state.user}" project_id="{resp.id}" name="{resp.name}"')
             return {"id": resp.id, "name": resp.name, "role": "owner"}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.delete("/api/projects/{project_id}", tags=["auth"], summary="Delete project")
 async def delete_project(project_id: str, request: Request):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            resp = stub.DeleteProject(
-                geo_pb2.DeleteProjectRequest(project_id=project_id, username=request.state.user)
+            resp = await stub.DeleteProject(
+                geo_pb2.DeleteProjectRequest(project_id=project_id, username=request.state.user),
+                timeout=settings.grpc_call_timeout
             )
             if not resp.success:
                 logger.error(f'[PROJECT DELETE] user="{request.state.user}" project_id="{project_id}" error="{resp.error}"')
                 raise HTTPException(status_code=400, detail=resp.error or "Delete failed")
+            invalidate_project_cache(project_id, [request.state.user])
             logger.info(f'[PROJECT DELETE] user="{request.state.user}" project_id="{project_id}"')
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.post("/api/projects/{project_id}/members", tags=["auth"], summary="Add project members")
 async def add_project_members(project_id: str, payload: ProjectMembersRequest, request: Request):
@@ -652,41 +1684,45 @@ async def add_project_members(project_id: str, payload: ProjectMembersRequest, r
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
             for username in usernames:
-                resp = stub.AddProjectMember(
+                resp = await stub.AddProjectMember(
                     geo_pb2.AddProjectMemberRequest(
                         project_id=project_id,
                         username=username,
                         requester=request.state.user,
                         role=role
-                    )
+                    ),
+                    timeout=settings.grpc_call_timeout
                 )
                 if not resp.success:
                     logger.error(f'[PROJECT MEMBER ADD] user="{request.state.user}" project_id="{project_id}" target="{username}" role="{role}" error="{resp.error}"')
                     raise HTTPException(status_code=400, detail=resp.error)
+                invalidate_project_cache(project_id, [username])
                 logger.info(f'[PROJECT MEMBER ADD] user="{request.state.user}" project_id="{project_id}" target="{username}" role="{role}"')
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.delete("/api/projects/{project_id}/members/{username}", tags=["auth"], summary="Remove project member")
 async def remove_project_member(project_id: str, username: str, request: Request):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            resp = stub.RemoveProjectMember(
+            resp = await stub.RemoveProjectMember(
                 geo_pb2.RemoveProjectMemberRequest(
                     project_id=project_id,
                     username=username,
                     requester=request.state.user
-                )
+                ),
+                timeout=settings.grpc_call_timeout
             )
             if not resp.success:
                 logger.error(f'[PROJECT MEMBER REMOVE] user="{request.state.user}" project_id="{project_id}" target="{username}" error="{resp.error}"')
                 raise HTTPException(status_code=400, detail=resp.error)
+            invalidate_project_cache(project_id, [username])
             logger.info(f'[PROJECT MEMBER REMOVE] user="{request.state.user}" project_id="{project_id}" target="{username}"')
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.post("/api/projects/{project_id}/owner", tags=["auth"], summary="Transfer project ownership")
 async def transfer_project_owner(project_id: str, payload: ProjectMembersRequest, request: Request):
@@ -698,36 +1734,39 @@ async def transfer_project_owner(project_id: str, payload: ProjectMembersRequest
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            resp = stub.PromoteProjectOwner(
+            resp = await stub.PromoteProjectOwner(
                 geo_pb2.PromoteProjectOwnerRequest(
                     project_id=project_id,
                     new_owner=new_owner,
                     requester=request.state.user
-                )
+                ),
+                timeout=settings.grpc_call_timeout
             )
             if not resp.success:
                 logger.error(f'[PROJECT OWNER TRANSFER] user="{request.state.user}" project_id="{project_id}" new_owner="{new_owner}" error="{resp.error}"')
                 raise HTTPException(status_code=400, detail=resp.error)
+            invalidate_project_cache(project_id, [request.state.user, new_owner])
             logger.info(f'[PROJECT OWNER TRANSFER] user="{request.state.user}" project_id="{project_id}" new_owner="{new_owner}"')
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.get("/api/projects/{project_id}/members", tags=["auth"], summary="List project members")
 async def list_project_members(project_id: str, request: Request):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            resp = stub.ListProjectMembers(
-                geo_pb2.ListProjectMembersRequest(project_id=project_id, requester=request.state.user)
+            resp = await stub.ListProjectMembers(
+                geo_pb2.ListProjectMembersRequest(project_id=project_id, requester=request.state.user),
+                timeout=settings.grpc_call_timeout
             )
             if resp.error:
                 raise HTTPException(status_code=400, detail=resp.error)
             return [{"username": m.username, "role": m.role} for m in resp.members]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
-@app.post("/api/enrich", response_model=EnrichmentResponse, tags=["geo"], summary="Enrich polygon with OSM data")
+@app.post("/api/enrich", response_model=EnrichmentResponse, responses=ARROW_RESPONSE_DOC, tags=["geo"], summary="Enrich polygon with OSM data")
 @app.post("/api/map/enrich", response_model=EnrichmentResponse, tags=["geo"], include_in_schema=False)
 async def enrich_polygon(payload: PolygonRequest, request: Request):
     """
@@ -735,51 +1774,54 @@ async def enrich_polygon(payload: PolygonRequest, request: Request):
 
     Returns area statistics (km², estimated population, region type) and a
     blended list of OSM and custom POIs with `source` tagged as `"osm"` or `"custom"`.
+
+    With `Accept: application/vnd.apache.arrow.stream` the businesses come back as
+    an Arrow IPC stream instead; the area statistics are in the schema metadata.
     """
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
 
-            proto_coords = [
-                geo_pb2.Coordinate(lat=coord.lat, lng=coord.lng)
-                for coord in payload.coordinates
-            ]
-
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.EnrichPolygon(
-                geo_pb2.PolygonRequest(coordinates=proto_coords, sources=payload.sources, project_id=project_id)
-            )
-
-            businesses = [
-                Business(
-                    name=b.name,
-                    lat=b.lat,
-                    lng=b.lng,
-                    type=b.type,
-                    address=b.address,
-                    phone=b.phone,
-                    website=b.website,
-                    email=b.email,
-                    source=b.source,
-                    id=b.id,
-                    description=b.description
-                )
-                for b in response.businesses
-            ]
+            project_id = await resolve_project_id(request, payload.project_id)
+            response = await unless_disconnected(request, stub.EnrichPolygon(
+                geo_pb2.PolygonRequest(
+                    packed_coordinates=pack_coordinates(payload.coordinates),
+                    sources=payload.sources,
+                    project_id=project_id,
+                    columnar_response=True
+                ),
+                timeout=settings.enrich_timeout
+            ))
 
-            return EnrichmentResponse(
-                area_km2=response.area_km2,
-                estimated_population=response.estimated_population,
-                region_type=response.region_type,
-                nearby_features=list(response.nearby_features),
-                businesses=businesses,
-                error=response.error
-            )
+            columns = business_columns(response)
+            result = {
+                'area_km2': response.area_km2,
+                'estimated_population': response.estimated_population,
+                'region_type': response.region_type,
+                'nearby_features': list(response.nearby_features),
+                'businesses': [],
+                'business_columns': None,
+                'error': response.error
+            }
+            if wants_arrow(request):
+                del result['businesses'], result['business_columns']
+                return arrow_response(business_table(columns), metadata=result)
+            if payload.columnar:
+                result['business_columns'] = columns
+            elif should_stream_json(len(columns['name'])):
+                del result['businesses']
+                return streaming_json_response(iter_business_rows(columns), envelope=result, key='businesses')
+            else:
+                result['businesses'] = business_rows(columns)
+            return fast_json_response(result)
+    except ClientDisconnected:
+        logger.info('[ENRICH] client disconnected, cancelled the geo call')
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.post("/api/recon", response_model=ReconResponse, tags=["recon"], summary="Run domain reconnaissance")
-async def run_recon(request: ReconRequest):
+async def run_recon(request: ReconRequest, http_request: Request):
     """
     Perform full reconnaissance on one or more domains.
 
@@ -792,88 +1834,19 @@ async def run_recon(request: ReconRequest):
         with get_recon_channel() as channel:
             stub = recon_pb2_grpc.ReconServiceStub(channel)
 
-            # Make RPC call
-            response = stub.RunRecon(
-                recon_pb2.ReconRequest(domains=request.domains, silent_mode=request.silent_mode)
-            )
-
-            # Convert proto response to pydantic
-            results = []
-            for domain_recon in response.results:
-                # Convert DNS records
-                dns_records = [
-                    DNSRecord(type=r.type, value=r.value, ttl=r.ttl)
-                    for r in domain_recon.dns_records
-                ]
-
-                # Convert SSL certificates
-                ssl_certificates = [
-                    SSLCertificate(
-                        issuer=cert.issuer,
-                        subject=cert.subject,
-                        not_before=cert.not_before,
-                        not_after=cert.not_after,
-                        san_domains=list(cert.san_domains)
-                    )
-                    for cert in domain_recon.ssl_certificates
-                ]
-
-                # Convert security headers
-                sec_headers = SecurityHeaders(
-                    strict_transport_security=domain_recon.security_headers.strict_transport_security,
-                    content_security_policy=domain_recon.security_headers.content_security_policy,
-                    x_frame_options=domain_recon.security_headers.x_frame_options,
-                    x_content_type_options=domain_recon.security_headers.x_content_type_options,
-                    referrer_policy=domain_recon.security_headers.referrer_policy,
-                    permissions_policy=domain_recon.security_headers.permissions_policy
-                )
-
-                # Convert WHOIS data
-                whois = WhoisData(
-                    registrar=domain_recon.whois.registrar,
-                    creation_date=domain_recon.whois.creation_date,
-                    expiration_date=domain_recon.whois.expiration_date,
-                    name_servers=list(domain_recon.whois.name_servers),
-                    registrant_org=domain_recon.whois.registrant_org,
-                    status=domain_recon.whois.status
-                )
-
-                # Convert ASN info
-                asn = ASNInfo(
-                    asn=domain_recon.asn_info.asn,
-                    organization=domain_recon.asn_info.organization,
-                    ip_ranges=list(domain_recon.asn_info.ip_ranges),
-                    country=domain_recon.asn_info.country,
-                    prefixes_v4=list(domain_recon.asn_info.prefixes_v4),
-                    prefixes_v6=list(domain_recon.asn_info.prefixes_v6),
-                    prefix_count_v4=domain_recon.asn_info.prefix_count_v4,
-                    prefix_count_v6=domain_recon.asn_info.prefix_count_v6,
-                    peers=list(domain_recon.asn_info.peers),
-                    upstreams=list(domain_recon.asn_info.upstreams),
-                    downstreams=list(domain_recon.asn_info.downstreams),
-                    peering_policy=domain_recon.asn_info.peering_policy,
-                    network_type=domain_recon.asn_info.network_type,
-                    peering_facilities=list(domain_recon.asn_info.peering_facilities),
-                    rir=domain_recon.asn_info.rir,
-                    abuse_contacts=list(domain_recon.asn_info.abuse_contacts),
-                    bgp_prefix=domain_recon.asn_info.bgp_prefix
-                )
-
-                results.append(DomainRecon(
-                    domain=domain_recon.domain,
-                    dns_records=dns_records,
-                    ssl_certificates=ssl_certificates,
-                    security_headers=sec_headers,
-                    whois=whois,
-                    asn_info=asn,
-                    subdomains=list(domain_recon.subdomains),
-                    error=domain_recon.error
-                ))
+            # Make RPC call (cancelled if the client disconnects)
+            response = await unless_disconnected(http_request, stub.RunRecon(
+                recon_pb2.ReconRequest(domains=request.domains, silent_mode=request.silent_mode),
+                timeout=settings.recon_timeout
+            ))
 
-            return ReconResponse(results=results)
+            return fast_json_response({'results': [encode_domain_recon(r) for r in response.results]})
 
+    except ClientDisconnected:
+        logger.info('[RECON] client disconnected, cancelled the recon call')
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Recon service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Recon service error: {e.details()}")
 
 @app.post("/api/recon/stream", tags=["recon"], summary="Stream recon progress (SSE)")
 async def run_recon_stream(request: ReconRequest):
@@ -889,88 +1862,36 @@ async def run_recon_stream(request: ReconRequest):
             with get_recon_channel() as channel:
                 stub = recon_pb2_grpc.ReconServiceStub(channel)
 
-                # Call streaming RPC
-                for update in stub.RunReconStream(recon_pb2.ReconRequest(domains=request.domains, silent_mode=request.silent_mode)):
-                    # Convert update type
-                    update_type = "log" if update.type == recon_pb2.ReconUpdate.LOG else \
-                                  "result" if update.type == recon_pb2.ReconUpdate.RESULT else \
-                                  "complete"
-
-                    # Prepare event data
-                    event_data = {
-                        "type": update_type,
-                        "message": update.message
-                    }
-
-                    # Include result if it's a RESULT update
-                    if update.type == recon_pb2.ReconUpdate.RESULT and update.HasField('result'):
-                        domain_recon = update.result
-
-                        # Convert proto result to dict (similar to non-streaming endpoint)
-                        dns_records = [
-                            {"type": r.type, "value": r.value, "ttl": r.ttl}
-                            for r in domain_recon.dns_records
-                        ]
-
-                        ssl_certificates = [
-                            {
-                                "issuer": cert.issuer,
-                                "subject": cert.subject,
-                                "not_before": cert.not_before,
-                                "not_after": cert.not_after,
-                                "san_domains": list(cert.san_domains)
-                            }
-                            for cert in domain_recon.ssl_certificates
-                        ]
-
-                        event_data["result"] = {
-                            "domain": domain_recon.domain,
-                            "dns_records": dns_records,
-                            "ssl_certificates": ssl_certificates,
-                            "security_headers": {
-                                "strict_transport_security": domain_recon.security_headers.strict_transport_security,
-                                "content_security_policy": domain_recon.security_headers.content_security_policy,
-                                "x_frame_options": domain_recon.security_headers.x_frame_options,
-                                "x_content_type_options": domain_recon.security_headers.x_content_type_options,
-                                "referrer_policy": domain_recon.security_headers.referrer_policy,
-                                "permissions_policy": domain_recon.security_headers.permissions_policy
-                            },
-                            "whois": {
-                                "registrar": domain_recon.whois.registrar,
-                                "creation_date": domain_recon.whois.creation_date,
-                                "expiration_date": domain_recon.whois.expiration_date,
-                                "name_servers": list(domain_recon.whois.name_servers),
-                                "registrant_org": domain_recon.whois.registrant_org,
-                                "status": domain_recon.whois.status
-                            },
-                            "asn_info": {
-                                "asn": domain_recon.asn_info.asn,
-                                "organization": domain_recon.asn_info.organization,
-                                "ip_ranges": list(domain_recon.asn_info.ip_ranges),
-                                "country": domain_recon.asn_info.country,
-                                "prefixes_v4": list(domain_recon.asn_info.prefixes_v4),
-                                "prefixes_v6": list(domain_recon.asn_info.prefixes_v6),
-                                "prefix_count_v4": domain_recon.asn_info.prefix_count_v4,
-                                "prefix_count_v6": domain_recon.asn_info.prefix_count_v6,
-                                "peers": list(domain_recon.asn_info.peers),
-                                "upstreams": list(domain_recon.asn_info.upstreams),
-                                "downstreams": list(domain_recon.asn_info.downstreams),
-                                "peering_policy": domain_recon.asn_info.peering_policy,
-                                "network_type": domain_recon.asn_info.network_type,
-                                "peering_facilities": list(domain_recon.asn_info.peering_facilities),
-                                "rir": domain_recon.asn_info.rir,
-                                "abuse_contacts": list(domain_recon.asn_info.abuse_contacts),
-                                "bgp_prefix": domain_recon.asn_info.bgp_prefix
-                            },
-                            "subdomains": list(domain_recon.subdomains),
-                            "error": domain_recon.error
+                # Call streaming RPC; when the client disconnects Starlette cancels this
+                # generator and the finally below cancels the stream in the recon service
+                call = stub.RunReconStream(
+                    recon_pb2.ReconRequest(domains=request.domains, silent_mode=request.silent_mode),
+                    timeout=settings.recon_timeout
+                )
+                try:
+                    async for update in call:
+                        # Convert update type
+                        update_type = "log" if update.type == recon_pb2.ReconUpdate.LOG else \
+                                      "result" if update.type == recon_pb2.ReconUpdate.RESULT else \
+                                      "complete"
+
+                        # Prepare event data
+                        event_data = {
+                            "type": update_type,
+                            "message": update.message
                         }
 
-                    # Send Server-Sent Event
-                    yield f"data: {json.dumps(event_data)}\n\n"
+                        # Include result if it's a RESULT update
+                        if update.type == recon_pb2.ReconUpdate.RESULT and update.HasField('result'):
+                            event_data["result"] = encode_domain_recon(update.result)
+
+                        # Send Server-Sent Event
+                        yield f"data: {orjson.dumps(event_data).decode()}\n\n"
 
-                    # Small delay to ensure events are sent
-                    await asyncio.sleep(0.01)
+                        # Small delay to ensure events are sent
+                        await asyncio.sleep(0.01)
+                finally:
+                    call.cancel()
 
         except grpc.RpcError as e:
             error_event = {
@@ -995,8 +1916,8 @@ async def add_custom_poi(payload: CustomPOIRequest, request: Request):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.AddCustomPOI(geo_pb2.AddCustomPOIRequest(
+            project_id = await resolve_project_id(request, payload.project_id)
+            response = await stub.AddCustomPOI(geo_pb2.AddCustomPOIRequest(
                 name=payload.name,
                 category=payload.category,
                 description=payload.description,
@@ -1006,7 +1927,7 @@ async def add_custom_poi(payload: CustomPOIRequest, request: Request):
                 lng=payload.lng,
                 tags_json=json.dumps(payload.tags),
                 project_id=project_id
-            ))
+            ), timeout=settings.grpc_call_timeout)
             if response.error:
                 logger.error(f"[POI CREATE] gRPC error: {response.error}")
                 raise HTTPException(status_code=400, detail=response.error)
@@ -1024,33 +1945,58 @@ async def add_custom_poi(payload: CustomPOIRequest, request: Request):
             return result
     except grpc.RpcError as e:
         logger.error(f"[POI CREATE] gRPC exception: {e.code()} {e.details()}")
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
-@app.get("/api/pois", response_model=list[CustomPOIResponse], tags=["custom-pois"], summary="List custom POIs")
+@app.get("/api/pois", response_model=list[CustomPOIResponse], responses=ARROW_RESPONSE_DOC, tags=["custom-pois"], summary="List custom POIs")
 async def list_custom_pois(
     request: Request,
+    response: Response,
     min_lat: float | None = None,
     min_lng: float | None = None,
     max_lat: float | None = None,
     max_lng: float | None = None,
-    project_id: str | None = None
+    project_id: str | None = None,
+    page_size: int | None = None,
+    page_token: str | None = None
 ):
     """
-    List all custom POIs. Optionally filter by bounding box by providing all four
+    List custom POIs, newest first. Optionally filter by bounding box by providing all four
     `min_lat`, `min_lng`, `max_lat`, `max_lng` query parameters.
+
+    All matching POIs are returned unless `page_size` is given. Then the result is one
+    page: pass the `X-Next-Page-Token` response header as `page_token` to continue.
+
+    With `Accept: application/vnd.apache.arrow.stream` the page is an Arrow IPC
+    stream with `tags` as a JSON string column.
     """
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            effective_project_id = resolve_project_id(request, project_id)
-            response = stub.ListCustomPOIs(geo_pb2.ListCustomPOIsRequest(
+            effective_project_id = await resolve_project_id(request, project_id)
+            result = await list_pages(stub.ListCustomPOIs, geo_pb2.ListCustomPOIsRequest(
                 min_lat=min_lat or 0.0,
                 min_lng=min_lng or 0.0,
                 max_lat=max_lat or 0.0,
                 max_lng=max_lng or 0.0,
-                project_id=effective_project_id
-            ))
+                project_id=effective_project_id,
+                page_size=page_size or 0,
+                page_token=page_token or ''
+            ), 'pois', settings.grpc_call_timeout)
+            if result.error:
+                raise HTTPException(status_code=400, detail=result.error)
+            if wants_arrow(request):
+                response = arrow_response(pa.table({
+                    field: pa.array([getattr(p, field) for p in result.pois], pa.float64() if field in ('lat', 'lng') else pa.string())
+                    for field in ('id', 'name', 'category', 'description', 'phone', 'website', 'lat', 'lng', 'tags_json')
+                }))
+                set_next_page_token(response, result.next_page_token)
+                return response
+            if should_stream_json(len(result.pois)):
+                response = streaming_json_response(map(poi_dict, result.pois))
+                set_next_page_token(response, result.next_page_token)
+                return response
+            set_next_page_token(response, result.next_page_token)
             return [
                 CustomPOIResponse(
                     id=p.id, name=p.name, category=p.category,
@@ -1058,10 +2004,10 @@ async def list_custom_pois(
                     lat=p.lat, lng=p.lng,
                     tags=json.loads(p.tags_json) if p.tags_json else {}
                 )
-                for p in response.pois
+                for p in result.pois
             ]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.patch("/api/pois/{poi_id}", response_model=CustomPOIResponse, tags=["custom-pois"], summary="Update custom POI")
@@ -1070,8 +2016,8 @@ async def update_custom_poi(poi_id: str, payload: UpdateCustomPOIRequest, reques
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.UpdateCustomPOI(geo_pb2.UpdateCustomPOIRequest(
+            project_id = await resolve_project_id(request, payload.project_id)
+            response = await stub.UpdateCustomPOI(geo_pb2.UpdateCustomPOIRequest(
                 id=poi_id,
                 name=payload.name,
                 category=payload.category,
@@ -1079,7 +2025,7 @@ async def update_custom_poi(poi_id: str, payload: UpdateCustomPOIRequest, reques
                 phone=payload.phone,
                 website=payload.website,
                 project_id=project_id
-            ))
+            ), timeout=settings.grpc_call_timeout)
             if response.error:
                 raise HTTPException(status_code=404, detail=response.error)
             return CustomPOIResponse(
@@ -1094,7 +2040,7 @@ async def update_custom_poi(poi_id: str, payload: UpdateCustomPOIRequest, reques
                 tags=json.loads(response.tags_json) if response.tags_json else {}
             )
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.delete("/api/pois/{poi_id}", tags=["custom-pois"], summary="Delete custom POI")
@@ -1103,13 +2049,13 @@ async def delete_custom_poi(poi_id: str, request: Request, project_id: str | Non
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            effective_project_id = resolve_project_id(request, project_id)
-            response = stub.DeleteCustomPOI(geo_pb2.DeleteCustomPOIRequest(id=poi_id, project_id=effective_project_id))
+            effective_project_id = await resolve_project_id(request, project_id)
+            response = await stub.DeleteCustomPOI(geo_pb2.DeleteCustomPOIRequest(id=poi_id, project_id=effective_project_id), timeout=settings.grpc_call_timeout)
             if not response.success:
                 raise HTTPException(status_code=404, detail=response.error)
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.post("/api/datasources", response_model=UploadSourceResponse, tags=["datasources"], summary="Upload GeoJSON datasource")
@@ -1120,32 +2066,467 @@ async def upload_datasource(payload: UploadSourceRequest, request: Request):
     Required GeoJSON properties per feature: name (string)
     Optional properties: category, description, phone, website
 
+    Re-uploading an existing name applies only the delta. Features are matched by
+    the `id_property` property if given, otherwise by a hash of geometry and properties;
+    the response reports inserted / updated / deleted / unchanged counts.
+
     Future: add authentication check before upload
     """
     # TODO: check authentication when auth is implemented
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.UploadSource(geo_pb2.UploadSourceRequest(
+            project_id = await resolve_project_id(request, payload.project_id)
+            response = await stub.UploadSource(geo_pb2.UploadSourceRequest(
                 name=payload.name,
                 geojson=payload.geojson,
-                project_id=project_id
-            ))
+                project_id=project_id,
+                id_property=payload.id_property
+            ), timeout=settings.upload_timeout)
             if response.error:
                 raise HTTPException(status_code=400, detail=response.error)
-            return UploadSourceResponse(
-                name=response.name,
-                feature_count=response.feature_count
+            invalidate_uploaded_datasources(project_id)
+            return upload_response(response)
+    except grpc.RpcError as e:
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
+
+
+def upload_response(response) -> UploadSourceResponse:
+    """Map a geo UploadSourceResponse (including the re-upload delta) onto the API model."""
+    return UploadSourceResponse(
+        name=response.name,
+        feature_count=response.feature_count,
+        job_id=response.job_id,
+        inserted=response.inserted,
+        updated=response.updated,
+        deleted=response.deleted,
+        unchanged=response.unchanged
+    )
+
+UPLOAD_FORMATS = {
+    '.geojson': 'geojson',
+    '.json': 'geojson',
+    '.parquet': 'geoparquet',
+    '.geoparquet': 'geoparquet',
+    '.fgb': 'flatgeobuf',
+    '.csv': 'csv',
+}
+# Columns mapped onto UploadFeature fields (matched case-insensitively); everything
+# else ends up in properties_json, like non-standard GeoJSON properties
+UPLOAD_POI_COLUMNS = ('name', 'category', 'description', 'phone', 'website', 'email')
+CSV_LAT_COLUMNS = ('lat', 'latitude', 'y')
+CSV_LNG_COLUMNS = ('lng', 'lon', 'long', 'longitude', 'x')
+
+def detect_upload_format(filename: str, declared: str = '') -> str:
+    """Resolve the upload format from an explicit `format` field or the file extension."""
+    if declared:
+        if declared not in UPLOAD_FORMATS.values():
+            raise ValueError(f'Unsupported format "{declared}" (expected one of {sorted(set(UPLOAD_FORMATS.values()))})')
+        return declared
+    ext = os.path.splitext(filename or '')[1].lower()
+    if ext not in UPLOAD_FORMATS:
+        raise ValueError(f'Cannot detect format from file name "{filename}"; pass `format`')
+    return UPLOAD_FORMATS[ext]
+
+def find_column(names: list[str], candidates: tuple[str, ...], explicit: str = '') -> str | None:
+    """Return the column matching `explicit` or the first of `candidates` (case-insensitive)."""
+    by_lower = {n.lower(): n for n in names}
+    if explicit:
+        if explicit.lower() not in by_lower:
+            raise ValueError(f'Column "{explicit}" not found')
+        return by_lower[explicit.lower()]
+    return next((by_lower[c] for c in candidates if c in by_lower), None)
+
+WGS84 = pyproj.CRS.from_epsg(4326)
+
+def make_transformer(crs: str | dict | None) -> pyproj.Transformer | None:
+    """Build a transformer to WGS84 lng/lat, or None when the data already is WGS84."""
+    if not crs:
+        return None
+    try:
+        source = pyproj.CRS.from_user_input(crs)
+    except pyproj.exceptions.CRSError as e:
+        raise ValueError(f'Unknown CRS {crs!r}: {e}')
+    if source.equals(WGS84, ignore_axis_order=True):
+        return None
+    return pyproj.Transformer.from_crs(source, WGS84, always_xy=True)
+
+def detect_crs(fmt: str, source) -> str | dict | None:
+    """Read the CRS a file declares about itself (None = undeclared, treated as WGS84)."""
+    if fmt == 'geojson':
+        # Legacy GeoJSON (2008) `crs` member; only the part before `features` is scanned
+        for prefix, event, value in ijson.parse(source):
+            if prefix == 'crs.properties.name':
+                source.seek(0)
+                return value
+            if prefix == 'features' and event == 'start_array':
+                break
+        source.seek(0)
+        return None
+    if fmt == 'geoparquet':
+        metadata = (pq.read_schema(source, memory_map=True).metadata or {}).get(b'geo')
+        geo_meta = json.loads(metadata) if metadata else {}
+        column = geo_meta.get('columns', {}).get(geo_meta.get('primary_column', 'geometry'), {})
+        # Absent means OGC:CRS84 per the GeoParquet spec; PROJJSON otherwise
+        return column.get('crs')
+    if fmt == 'flatgeobuf':
+        return pyogrio.read_info(source).get('crs')
+    return None
+
+# Shapely type ids accepted in uploads; non-Points are stored with their full shape
+UPLOAD_GEOMETRY_TYPES = {0: 'Point', 1: 'LineString', 3: 'Polygon', 6: 'MultiPolygon'}
+
+def prepare_geometries(geoms: np.ndarray, offset: int, transformer: pyproj.Transformer | None = None) -> tuple:
+    """
+    Reproject a batch of geometries to WGS84 if needed and validate it as whole arrays.
+
+    Returns (lng, lat, wkb): a representative point per feature (the Point itself, or a
+    point on the shape) and WKB for non-Point features (b'' for Points).
+    """
+    type_ids = shapely.get_type_id(geoms)
+    unsupported = ~np.isin(type_ids, list(UPLOAD_GEOMETRY_TYPES))
+    if unsupported.any():
+        raise ValueError(
+            f'Feature {offset + int(unsupported.argmax())}: unsupported geometry '
+            f'(expected {", ".join(UPLOAD_GEOMETRY_TYPES.values())})'
+        )
+    shapes = type_ids != 0
+    if shapes.any():
+        if transformer is not None:
+            geoms = shapely.transform(geoms, lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1])))
+        bounds = shapely.bounds(geoms)
+    else:
+        # Point-only batch: work on the coordinate arrays without rebuilding geometries
+        lng, lat = shapely.get_x(geoms), shapely.get_y(geoms)
+        if transformer is not None:
+            lng, lat = transformer.transform(lng, lat)
+        bounds = np.column_stack([lng, lat, lng, lat])
+    invalid = ~np.isfinite(bounds).all(axis=1)
+    if invalid.any():
+        raise ValueError(f'Feature {offset + int(invalid.argmax())}: missing or invalid coordinates')
+    outside = (bounds[:, 0] < -180) | (bounds[:, 2] > 180) | (bounds[:, 1] < -90) | (bounds[:, 3] > 90)
+    if outside.any():
+        i = int(outside.argmax())
+        hint = '' if transformer is not None else '; declare the dataset\'s `crs` (e.g. EPSG:3006)'
+        raise ValueError(f'Feature {offset + i}: coordinates ({bounds[i, 0]}, {bounds[i, 1]}) outside WGS84 bounds{hint}')
+    wkb = np.full(len(geoms), b'', dtype=object)
+    if not shapes.any():
+        return lng, lat, wkb
+    broken = shapes & ~shapely.is_valid(geoms)
+    if broken.any():
+        i = int(broken.argmax())
+        raise ValueError(f'Feature {offset + i}: invalid geometry ({shapely.is_valid_reason(geoms[i])})')
+    anchors = geoms.copy()
+    anchors[shapes] = shapely.point_on_surface(geoms[shapes])
+    wkb[shapes] = shapely.to_wkb(geoms[shapes])
+    return shapely.get_x(anchors), shapely.get_y(anchors), wkb
+
+def count_duplicate_locations(locations: list) -> int:
+    """Number of features sharing an exact location with an earlier feature."""
+    if not locations:
+        return 0
+    points = np.concatenate(locations)
+    return len(points) - len(np.unique(points))
+
+def read_geojson_batches(stream):
+    """Yield (property dicts, geometries) from a GeoJSON FeatureCollection, parsed incrementally."""
+    if next(ijson.items(stream, 'type'), None) != 'FeatureCollection':
+        raise ValueError('GeoJSON must be a FeatureCollection')
+    stream.seek(0)
+    features = ijson.items(stream, 'features.item', use_float=True)
+    offset = 0
+    while batch := list(itertools.islice(features, settings.upload_batch_rows)):
+        rows = []
+        geoms = np.empty(len(batch), dtype=object)
+        point_index, point_coords = [], []
+        for i, feature in enumerate(batch):
+            geometry = feature.get('geometry') or {}
+            props = feature.get('properties') or {}
+            if 'name' not in props:
+                raise ValueError(f'Feature {offset + i}: missing required "name" property')
+            rows.append(props)
+            if geometry.get('type') == 'Point':
+                # Points are by far the common case: build them in one vectorised call below
+                c = geometry.get('coordinates') or []
+                point_index.append(i)
+                point_coords.append((c[0], c[1]) if len(c) >= 2 else (None, None))
+            elif geometry.get('type') in UPLOAD_GEOMETRY_TYPES.values():
+                try:
+                    geoms[i] = shapely.geometry.shape(geometry)
+                except (ValueError, TypeError, IndexError, shapely.errors.GEOSException) as e:
+                    raise ValueError(f'Feature {offset + i}: invalid {geometry["type"]}: {e}')
+            else:
+                raise ValueError(
+                    f'Feature {offset + i}: unsupported geometry '
+                    f'(expected {", ".join(UPLOAD_GEOMETRY_TYPES.values())})'
+                )
+        if point_index:
+            geoms[point_index] = shapely.points(np.array(point_coords, dtype=np.float64))
+        yield rows, geoms
+        offset += len(batch)
+
+def geometries_from_wkb(column: pa.Array) -> np.ndarray:
+    """Decode a WKB geometry column into a shapely geometry array."""
+    return shapely.from_wkb(column.to_numpy(zero_copy_only=False))
+
+def read_geoparquet_batches(path: str):
+    """Yield (batch, geometries) from a memory-mapped GeoParquet file, one row group slice at a time."""
+    parquet = pq.ParquetFile(path, memory_map=True)
+    metadata = (parquet.schema_arrow.metadata or {}).get(b'geo')
+    geo_meta = json.loads(metadata) if metadata else {}
+    geom_col = geo_meta.get('primary_column', 'geometry')
+    encoding = geo_meta.get('columns', {}).get(geom_col, {}).get('encoding', 'WKB')
+    if geom_col not in parquet.schema_arrow.names:
+        raise ValueError(f'GeoParquet geometry column "{geom_col}" not found')
+    for batch in parquet.iter_batches(batch_size=settings.upload_batch_rows):
+        geom = batch.column(geom_col)
+        if encoding.lower() == 'point':
+            # GeoArrow native encoding: struct<x, y>. Null points (or coordinates) become
+            # NaN, which prepare_geometries rejects as missing coordinates
+            missing = geom.is_null().to_numpy(zero_copy_only=False)
+            x, y = (np.where(missing, np.nan, geom.field(f).to_numpy(zero_copy_only=False)) for f in 'xy')
+            geoms = shapely.points(x, y)
+        else:
+            geoms = geometries_from_wkb(geom)
+        yield batch.drop_columns([geom_col]), geoms
+
+def read_flatgeobuf_batches(path: str):
+    """Yield (batch, geometries) from a FlatGeobuf file via GDAL's Arrow stream."""
+    with pyogrio.raw.open_arrow(path, batch_size=settings.upload_batch_rows, use_pyarrow=True) as (meta, reader):
+        geom_col = meta.get('geometry_name') or 'wkb_geometry'
+        for batch in reader:
+            yield batch.drop_columns([geom_col]), geometries_from_wkb(batch.column(geom_col))
+
+def read_csv_batches(stream, lat_column: str = '', lng_column: str = ''):
+    """Yield (batch, point geometries) from a CSV with latitude/longitude columns, streamed block by block."""
+    header = next(csv.reader([stream.readline().decode('utf-8-sig')]), [])
+    stream.seek(0)
+    lat_col = find_column(header, CSV_LAT_COLUMNS, lat_column)
+    lng_col = find_column(header, CSV_LNG_COLUMNS, lng_column)
+    if not lat_col or not lng_col:
+        raise ValueError('CSV needs latitude and longitude columns (e.g. lat/lng); pass lat_column/lng_column')
+    # Keep every other column as text: phone numbers and ids must not lose leading zeros
+    column_types = {c: pa.string() for c in header}
+    column_types.update({lat_col: pa.float64(), lng_col: pa.float64()})
+    reader = pa_csv.open_csv(
+        stream,
+        read_options=pa_csv.ReadOptions(block_size=8 << 20),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types)
+    )
+    for batch in reader:
+        lat = batch.column(lat_col).to_numpy(zero_copy_only=False)
+        lng = batch.column(lng_col).to_numpy(zero_copy_only=False)
+        yield batch.drop_columns([lat_col, lng_col]), shapely.points(lng, lat)
+
+# Shared encoder: json.dumps(default=...) would build a new JSONEncoder per feature
+encode_properties = json.JSONEncoder(default=str).encode
+
+def batches_to_upload_features(batches, transformer: pyproj.Transformer | None = None,
+                               locations: list | None = None):
+    """
+    Map (batch, geometries) pairs onto UploadFeature messages, batch by batch.
+
+    A batch is either an Arrow record batch (columns matched case-insensitively) or a
+    list of GeoJSON property dicts. Geometries are reprojected and validated per batch
+    as arrays; when `locations` is given, each batch's representative points are
+    appended to it.
+    """
+    offset = 0
+    for batch, geoms in batches:
+        lng, lat, wkb = prepare_geometries(geoms, offset, transformer)
+        if locations is not None:
+            locations.append(lng + 1j * lat)
+        if isinstance(batch, pa.RecordBatch):
+            columns = {c: find_column(batch.schema.names, (c,)) for c in UPLOAD_POI_COLUMNS}
+            if not columns['name']:
+                raise ValueError('missing required "name" column')
+            names = batch.column(columns['name'])
+            empty = pc.is_null(names)
+            if pa.types.is_string(names.type) or pa.types.is_large_string(names.type):
+                empty = pc.or_kleene(empty, pc.equal(names, ''))
+            first_empty = pc.index(empty, True).as_py()
+            if first_empty >= 0:
+                raise ValueError(f'Feature {offset + first_empty}: missing required "name" property')
+            rows = batch.to_pylist()
+        else:
+            columns = {c: c for c in UPLOAD_POI_COLUMNS}
+            rows = batch
+        fields = [(field, col) for field, col in columns.items() if col and field != 'name']
+        for row, x, y, shape_wkb in zip(rows, lng.tolist(), lat.tolist(), wkb):
+            yield geo_pb2.UploadFeature(
+                name=str(row.get(columns['name']) or 'Unnamed'),
+                lat=y,
+                lng=x,
+                geometry_wkb=shape_wkb,
+                properties_json=encode_properties({k: v for k, v in row.items() if v is not None}),
+                **{field: str(row.get(col) or '') for field, col in fields}
+            )
+        offset += len(rows)
+
+async def iter_in_thread(iterator, errors: list):
+    """Drive a blocking iterator from worker threads, yielding its items on the event loop.
+
+    An exception from the iterator is appended to `errors` before it propagates; grpc.aio
+    then cancels the call being fed, and the caller re-raises it from there.
+    """
+    done = object()
+    try:
+        while (item := await asyncio.to_thread(next, iterator, done)) is not done:
+            yield item
+    except Exception as e:
+        errors.append(e)
+        raise
+
+def iter_upload_chunks(features, name: str, project_id: str, job_id: str, id_property: str, failure: list):
+    """
+    Batch UploadFeature messages into UploadSourceChunk messages for UploadSourceStream.
+
+    Validation errors raised while reading the file are recorded in `failure` and
+    re-raised, which cancels the RPC so the geo service rolls back the partially
+    staged upload.
+    """
+    chunk = geo_pb2.UploadSourceChunk(
+        name=name, project_id=project_id, job_id=job_id, id_property=id_property
+    )
+    try:
+        for feature in features:
+            chunk.features.append(feature)
+            if len(chunk.features) >= settings.upload_chunk_features:
+                yield chunk
+                chunk = geo_pb2.UploadSourceChunk()
+    except (ValueError, TypeError, ijson.JSONError, shapely.errors.GEOSException,
+            pyogrio.errors.DataSourceError, pyogrio.errors.DataLayerError) as e:
+        failure.append(str(e))
+        raise
+    yield chunk
+
+
+@app.post("/api/datasources/upload", response_model=UploadSourceResponse, tags=["datasources"], summary="Stream-upload datasource file")
+async def upload_datasource_file(
+    request: Request,
+    file: UploadFile = File(...),
+    name: str = Form(...),
+    id_property: str = Form(''),
+    file_format: str = Form('', alias='format'),
+    crs: str = Form(''),
+    lat_column: str = Form(''),
+    lng_column: str = Form(''),
+    project_id: str | None = None,
+    job_id: str | None = None
+):
+    """
+    Upload a datasource **file** (`multipart/form-data`, fields `file` and `name`).
+
+    Supported formats: GeoJSON FeatureCollection, GeoParquet, FlatGeobuf and CSV with
+    latitude/longitude columns. The format is taken from `format` or the file extension;
+    for CSV, `lat_column` / `lng_column` override the detected coordinate columns.
+    Coordinates in another CRS (e.g. `EPSG:3006`) are reprojected to WGS84; the CRS is
+    taken from `crs` or from the file itself (GeoParquet/FlatGeobuf metadata, legacy
+    GeoJSON `crs` member), defaulting to WGS84.
+    Columns named name/category/description/phone/website/email map onto the POI fields,
+    all other columns are kept as properties.
+
+    Unlike `POST /api/datasources`, the file is never held in memory as one string:
+    GeoJSON is parsed incrementally and columnar files are read in record batches
+    (memory-mapped for GeoParquet), then streamed to the geo service in chunks, where
+    they are bulk-loaded and the delta against the previous upload is applied atomically
+    (see `id_property` on `POST /api/datasources`). Pass your own `job_id` to poll
+    `GET /api/datasources/jobs/{job_id}` for progress while the upload runs.
+    """
+    # TODO: check authentication when auth is implemented
+    effective_project_id = await resolve_project_id(request, project_id)
+    job_id = job_id or str(uuid.uuid4())
+    failure = []
+    try:
+        fmt = detect_upload_format(file.filename, file_format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    locations = []
+    errors = []
+    files = contextlib.ExitStack()
+
+    def open_features():
+        if fmt == 'geojson':
+            source, batches = file.file, read_geojson_batches(file.file)
+        elif fmt == 'csv':
+            source, batches = file.file, read_csv_batches(file.file, lat_column, lng_column)
+        else:
+            # GeoParquet and FlatGeobuf need random access: spill to a real file and map it
+            tmp = files.enter_context(tempfile.NamedTemporaryFile(suffix=f'.{fmt}'))
+            shutil.copyfileobj(file.file, tmp, 8 << 20)
+            tmp.flush()
+            reader = read_geoparquet_batches if fmt == 'geoparquet' else read_flatgeobuf_batches
+            source, batches = tmp.name, reader(tmp.name)
+        transformer = make_transformer(crs or detect_crs(fmt, source))
+        return batches_to_upload_features(batches, transformer, locations)
+
+    try:
+        with files, get_geo_channel() as channel:
+            stub = geo_pb2_grpc.GeoDataServiceStub(channel)
+            # Parsing a large file is slow; it runs in worker threads, off the event loop
+            features = await asyncio.to_thread(open_features)
+            chunks = iter_upload_chunks(features, name, effective_project_id, job_id, id_property, failure)
+            try:
+                response = await stub.UploadSourceStream(iter_in_thread(chunks, errors), timeout=settings.upload_timeout)
+            except asyncio.CancelledError:
+                # grpc.aio cancels the stream (and geo rolls back) when the chunk iterator raises
+                if failure:
+                    raise HTTPException(status_code=400, detail=failure[0])
+                if errors:
+                    raise errors[0]
+                raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ijson.JSONError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    except (pyogrio.errors.DataSourceError, pyogrio.errors.DataLayerError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid {fmt} file: {e}")
+    except grpc.RpcError as e:
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
+    if response.error:
+        raise HTTPException(status_code=400, detail=response.error)
+    invalidate_uploaded_datasources(effective_project_id)
+    result = upload_response(response)
+    # Co-located POIs are legitimate (same building), so duplicates are reported, not rejected
+    result.duplicate_locations = count_duplicate_locations(locations)
+    return result
+
+
+@app.get("/api/datasources/jobs/{job_id}", response_model=UploadJobResponse, tags=["datasources"], summary="Datasource upload progress")
+async def get_upload_job(job_id: str, request: Request, project_id: str | None = None):
+    """Report the phase (`receiving`, `swapping`, `analyzing`, `done`, `failed`) and row counts of an upload."""
+    try:
+        with get_geo_channel() as channel:
+            stub = geo_pb2_grpc.GeoDataServiceStub(channel)
+            effective_project_id = await resolve_project_id(request, project_id)
+            response = await stub.GetUploadJob(geo_pb2.GetUploadJobRequest(job_id=job_id, project_id=effective_project_id), timeout=settings.grpc_call_timeout)
+            if not response.status:
+                raise HTTPException(status_code=404, detail=response.error or "Upload job not found")
+            if response.status == 'done':
+                invalidate_uploaded_datasources(effective_project_id)
+            return UploadJobResponse(
+                job_id=response.job_id,
+                source_name=response.source_name,
+                status=response.status,
+                features_received=response.features_received,
+                feature_count=response.feature_count,
+                error=response.error
             )
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.get("/api/datasources", response_model=list[UploadedSource], tags=["datasources"], summary="List uploaded datasources")
-async def list_datasources(request: Request, project_id: str | None = None):
+async def list_datasources(
+    request: Request,
+    response: Response,
+    project_id: str | None = None,
+    page_size: int | None = None,
+    page_token: str | None = None
+):
     """
-    List all uploaded datasources currently stored in PostGIS.
+    List uploaded datasources stored in PostGIS, by name (paginated like `/api/pois`).
 
     Future: add authentication check to filter by user
     """
@@ -1153,14 +2534,21 @@ async def list_datasources(request: Request, project_id: str | None = None):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            effective_project_id = resolve_project_id(request, project_id)
-            response = stub.ListUploadedSources(geo_pb2.ListUploadedSourcesRequest(project_id=effective_project_id))
+            effective_project_id = await resolve_project_id(request, project_id)
+            result = await list_pages(stub.ListUploadedSources, geo_pb2.ListUploadedSourcesRequest(
+                project_id=effective_project_id,
+                page_size=page_size or 0,
+                page_token=page_token or ''
+            ), 'sources', settings.grpc_call_timeout)
+            if result.error:
+                raise HTTPException(status_code=400, detail=result.error)
+            set_next_page_token(response, result.next_page_token)
             return [
                 UploadedSource(name=src.name, feature_count=src.feature_count)
-                for src in response.sources
+                for src in result.sources
             ]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.delete("/api/datasources/{name}", tags=["datasources"], summary="Delete uploaded datasource")
@@ -1174,13 +2562,14 @@ async def delete_datasource(name: str, request: Request, project_id: str | None
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            effective_project_id = resolve_project_id(request, project_id)
-            response = stub.DeleteUploadedSource(geo_pb2.DeleteUploadedSourceRequest(name=name, project_id=effective_project_id))
+            effective_project_id = await resolve_project_id(request, project_id)
+            response = await stub.DeleteUploadedSource(geo_pb2.DeleteUploadedSourceRequest(name=name, project_id=effective_project_id), timeout=settings.grpc_call_timeout)
             if not response.success:
                 raise HTTPException(status_code=404, detail=response.error)
+            invalidate_uploaded_datasources(effective_project_id)
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.post("/api/areas", response_model=CustomAreaResponse, tags=["custom-areas"], summary="Create custom area")
@@ -1190,79 +2579,129 @@ async def add_custom_area(payload: CustomAreaRequest, request: Request):
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
             proto_coords = [geo_pb2.Coordinate(lat=c.lat, lng=c.lng) for c in payload.coordinates]
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.AddCustomArea(geo_pb2.AddCustomAreaRequest(
+            project_id = await resolve_project_id(request, payload.project_id)
+            response = await stub.AddCustomArea(geo_pb2.AddCustomAreaRequest(
                 name=payload.name,
                 description=payload.description,
                 coordinates=proto_coords,
                 metadata_json=json.dumps(payload.metadata),
                 project_id=project_id
-            ))
+            ), timeout=settings.grpc_call_timeout)
             if response.error:
                 raise HTTPException(status_code=400, detail=response.error)
             return CustomAreaResponse(
                 id=response.id,
                 name=response.name,
                 description=response.description,
-                coordinates=[Coordinate(lat=c.lat, lng=c.lng) for c in response.coordinates],
+                coordinates=area_coordinates(response),
                 metadata=json.loads(response.metadata_json) if response.metadata_json else {}
             )
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.get("/api/areas", response_model=list[CustomAreaResponse], tags=["custom-areas"], summary="List custom areas")
-async def list_custom_areas(request: Request, project_id: str | None = None):
-    """List all custom polygon areas with their coordinate rings and metadata."""
+async def list_custom_areas(
+    request: Request,
+    response: Response,
+    project_id: str | None = None,
+    page_size: int | None = None,
+    page_token: str | None = None,
+    tolerance: float | None = None,
+    zoom: int | None = None
+):
+    """
+    List custom polygon areas with their coordinate rings and metadata (paginated like `/api/pois`).
+
+    Pass the map `zoom` (or a `tolerance` in degrees) to get rings simplified with
+    `ST_SimplifyPreserveTopology` to roughly what the viewport can render.
+    """
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            effective_project_id = resolve_project_id(request, project_id)
-            response = stub.ListCustomAreas(geo_pb2.ListCustomAreasRequest(project_id=effective_project_id))
+            effective_project_id = await resolve_project_id(request, project_id)
+            result = await list_pages(stub.ListCustomAreas, geo_pb2.ListCustomAreasRequest(
+                project_id=effective_project_id,
+                page_size=page_size or 0,
+                page_token=page_token or '',
+                tolerance=tolerance or 0,
+                zoom=zoom,
+                packed_response=True
+            ), 'areas', settings.grpc_call_timeout)
+            if result.error:
+                raise HTTPException(status_code=400, detail=result.error)
+            if should_stream_json(len(result.areas)):
+                response = streaming_json_response(map(area_dict, result.areas))
+                set_next_page_token(response, result.next_page_token)
+                return response
+            set_next_page_token(response, result.next_page_token)
             return [
                 CustomAreaResponse(
                     id=a.id, name=a.name, description=a.description,
-                    coordinates=[Coordinate(lat=c.lat, lng=c.lng) for c in a.coordinates],
+                    coordinates=area_coordinates(a),
                     metadata=json.loads(a.metadata_json) if a.metadata_json else {}
                 )
-                for a in response.areas
+                for a in result.areas
             ]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 @app.post("/api/areas/intersect", response_model=list[CustomAreaResponse], tags=["custom-areas"], summary="List custom areas intersecting polygon")
-async def list_intersecting_custom_areas(payload: PolygonRequest, request: Request):
-    """Return only custom areas that intersect the provided polygon."""
+async def list_intersecting_custom_areas(
+    payload: PolygonRequest,
+    request: Request,
+    response: Response,
+    page_size: int | None = None,
+    page_token: str | None = None,
+    tolerance: float | None = None,
+    zoom: int | None = None
+):
+    """
+    Return only custom areas that intersect the provided polygon (paginated like `/api/pois`).
+
+    `zoom` / `tolerance` simplify the returned rings as on `GET /api/areas`.
+    """
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
 
-            proto_coords = [
-                geo_pb2.Coordinate(lat=coord.lat, lng=coord.lng)
-                for coord in payload.coordinates
-            ]
-
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.ListIntersectingAreas(
-                geo_pb2.PolygonRequest(coordinates=proto_coords, sources=payload.sources, project_id=project_id)
+            project_id = await resolve_project_id(request, payload.project_id)
+            result = await list_pages(
+                stub.ListIntersectingAreas,
+                geo_pb2.PolygonRequest(
+                    packed_coordinates=pack_coordinates(payload.coordinates),
+                    sources=payload.sources,
+                    project_id=project_id,
+                    page_size=page_size or 0,
+                    page_token=page_token or '',
+                    tolerance=tolerance or 0,
+                    zoom=zoom,
+                    packed_response=True
+                ),
+                'areas', settings.grpc_call_timeout
             )
 
-            if response.error:
-                raise HTTPException(status_code=500, detail=response.error)
+            if result.error:
+                raise HTTPException(status_code=list_error_status(result.error), detail=result.error)
 
+            if should_stream_json(len(result.areas)):
+                response = streaming_json_response(map(area_dict, result.areas))
+                set_next_page_token(response, result.next_page_token)
+                return response
+            set_next_page_token(response, result.next_page_token)
             return [
                 CustomAreaResponse(
                     id=a.id,
                     name=a.name,
                     description=a.description,
-                    coordinates=[Coordinate(lat=c.lat, lng=c.lng) for c in a.coordinates],
+                    coordinates=area_coordinates(a),
                     metadata=json.loads(a.metadata_json) if a.metadata_json else {},
                     error=a.error
                 )
-                for a in response.areas
+                for a in result.areas
             ]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.patch("/api/areas/{area_id}", response_model=CustomAreaResponse, tags=["custom-areas"], summary="Update custom area")
@@ -1271,24 +2710,24 @@ async def update_custom_area(area_id: str, payload: UpdateCustomAreaRequest, req
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            project_id = resolve_project_id(request, payload.project_id)
-            response = stub.UpdateCustomArea(geo_pb2.UpdateCustomAreaRequest(
+            project_id = await resolve_project_id(request, payload.project_id)
+            response = await stub.UpdateCustomArea(geo_pb2.UpdateCustomAreaRequest(
                 id=area_id,
                 name=payload.name,
                 description=payload.description,
                 project_id=project_id
-            ))
+            ), timeout=settings.grpc_call_timeout)
             if response.error:
                 raise HTTPException(status_code=404, detail=response.error)
             return CustomAreaResponse(
                 id=response.id,
                 name=response.name,
                 description=response.description,
-                coordinates=[Coordinate(lat=c.lat, lng=c.lng) for c in response.coordinates],
+                coordinates=area_coordinates(response),
                 metadata=json.loads(response.metadata_json) if response.metadata_json else {}
             )
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.delete("/api/areas/{area_id}", tags=["custom-areas"], summary="Delete custom area")
@@ -1297,13 +2736,13 @@ async def delete_custom_area(area_id: str, request: Request, project_id: str | N
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            effective_project_id = resolve_project_id(request, project_id)
-            response = stub.DeleteCustomArea(geo_pb2.DeleteCustomAreaRequest(id=area_id, project_id=effective_project_id))
+            effective_project_id = await resolve_project_id(request, project_id)
+            response = await stub.DeleteCustomArea(geo_pb2.DeleteCustomAreaRequest(id=area_id, project_id=effective_project_id), timeout=settings.grpc_call_timeout)
             if not response.success:
                 raise HTTPException(status_code=404, detail=response.error)
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.get("/api/search", response_model=NominatimSearchResponse, tags=["geo"], summary="Geocode location")
@@ -1406,11 +2845,11 @@ async def save_route(request: SaveRouteRequest):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            response = stub.AddRoute(geo_pb2.AddRouteRequest(
+            response = await stub.AddRoute(geo_pb2.AddRouteRequest(
                 name=request.name,
                 route_type=request.route_type,
                 stops_json=json.dumps([s.model_dump() for s in request.stops])
-            ))
+            ), timeout=settings.grpc_call_timeout)
             if response.error:
                 raise HTTPException(status_code=400, detail=response.error)
             return SavedRouteResponse(
@@ -1419,27 +2858,31 @@ async def save_route(request: SaveRouteRequest):
                 created_at=response.created_at
             )
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.get("/api/routes/saved", response_model=list[SavedRouteResponse], tags=["routing"], summary="List saved routes")
-async def list_saved_routes():
-    """List all saved routes ordered by creation date descending."""
+async def list_saved_routes(response: Response, page_size: int | None = None, page_token: str | None = None):
+    """List saved routes ordered by creation date descending (paginated like `/api/pois`)."""
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            response = stub.ListRoutes(geo_pb2.ListRoutesRequest())
-            if response.error:
-                raise HTTPException(status_code=500, detail=response.error)
+            result = await list_pages(stub.ListRoutes, geo_pb2.ListRoutesRequest(
+                page_size=page_size or 0,
+                page_token=page_token or ''
+            ), 'routes', settings.grpc_call_timeout)
+            if result.error:
+                raise HTTPException(status_code=list_error_status(result.error), detail=result.error)
+            set_next_page_token(response, result.next_page_token)
             return [
                 SavedRouteResponse(
                     id=r.id, name=r.name, route_type=r.route_type,
                     stops=[RouteStop(**s) for s in json.loads(r.stops_json)],
                     created_at=r.created_at
-                ) for r in response.routes
+                ) for r in result.routes
             ]
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 @app.delete("/api/routes/saved/{route_id}", tags=["routing"], summary="Delete saved route")
@@ -1448,12 +2891,12 @@ async def delete_saved_route(route_id: str):
     try:
         with get_geo_channel() as channel:
             stub = geo_pb2_grpc.GeoDataServiceStub(channel)
-            response = stub.DeleteRoute(geo_pb2.DeleteRouteRequest(id=route_id))
+            response = await stub.DeleteRoute(geo_pb2.DeleteRouteRequest(id=route_id), timeout=settings.grpc_call_timeout)
             if not response.success:
                 raise HTTPException(status_code=400, detail=response.error)
             return {"success": True}
     except grpc.RpcError as e:
-        raise HTTPException(status_code=503, detail=f"Geo service error: {e.details()}")
+        raise HTTPException(status_code=grpc_error_status(e), detail=f"Geo service error: {e.details()}")
 
 
 def main():
@@ -26,8 +26,54 @@ class Settings(BaseSettings):
     # Rate Limiting
     overpass_rate_limit: int = 120
 
+    # Concurrency (the server is asyncio-based; these replace the old 10-thread pool)
+    max_concurrent_rpcs: int = 1000     # in-flight RPCs before RESOURCE_EXHAUSTED (0 = unlimited)
+    overpass_max_concurrency: int = 10  # simultaneous Overpass queries
+    wiki_max_concurrency: int = 10      # simultaneous Wikidata/Wikipedia requests
+
+    # Overpass responses with at least this many elements are classified in a process
+    # pool, in chunks, instead of on the event loop (0 processes = always inline)
+    overpass_offload_min_elements: int = 5000
+    overpass_offload_chunk_size: int = 5000
+    overpass_offload_processes: int = 2
+
+    # Bulkheads: per RPC class, in-flight RPCs and connections of its own PostGIS pool
+    acl_max_concurrency: int = 100      # project/membership RPCs (CheckProjectAccess, ...)
+    acl_db_pool_size: int = 4
+    crud_max_concurrency: int = 50      # POI/area/route CRUD and listings, upload job status
+    crud_db_pool_size: int = 6
+    enrich_max_concurrency: int = 20    # EnrichPolygon
+    enrich_db_pool_size: int = 8
+    upload_max_concurrency: int = 2     # UploadSource / UploadSourceStream
+    upload_db_pool_size: int = 2
+    bulkhead_queue_timeout: float = 10.0  # seconds an RPC waits for a slot before RESOURCE_EXHAUSTED
+    bulkhead_queue_samples: int = 1024    # recent queue times kept per class for percentiles
+
+    # Worker processes sharing geo_port via SO_REUSEPORT, each with its own event loop
+    # and DB pools (1 = serve in this process, 0 = one per CPU core). SIGHUP restarts
+    # them one at a time; SIGTERM drains them.
+    geo_workers: int = 1
+    worker_start_timeout: float = 60.0    # seconds a new worker has to start listening
+    worker_shutdown_grace: float = 30.0   # seconds in-flight RPCs get to finish on stop/restart
+
     # Database
     geo_db_url: str = ""
+    db_pool_timeout: float = 30.0       # seconds an RPC waits for a free connection
+    health_check_timeout: float = 2.0   # per-database limit of Health(check_datasources)
+
+    # List RPC pagination (keyset cursors on created_at, id)
+    list_default_page_size: int = 500
+    list_max_page_size: int = 5000
+
+    # Re-uploads: default feature property used as a stable id for diffing
+    # (empty = key features by a hash of geometry and properties)
+    upload_id_property: str = ""
+
+    # Max vertices per ST_Subdivide piece in spatial shadow tables
+    subdivide_max_vertices: int = 256
+
+    # Area listings requested with a zoom level are simplified to this many screen pixels
+    simplify_pixel_tolerance: float = 1.0
 
     # Additional PostGIS sources (JSON array of AdditionalDB configs)
     geo_additional_dbs: str = "[]"
@@ -89,6 +89,11 @@ class GeoDataServiceStub(object):
                 request_serializer=geo__pb2.PromoteProjectOwnerRequest.SerializeToString,
                 response_deserializer=geo__pb2.ProjectMemberResponse.FromString,
                 _registered_method=True)
+        self.WatchProjectChanges = channel.unary_stream(
+                '/geo.GeoDataService/WatchProjectChanges',
+                request_serializer=geo__pb2.WatchProjectChangesRequest.SerializeToString,
+                response_deserializer=geo__pb2.ProjectChange.FromString,
+                _registered_method=True)
         self.AddCustomPOI = channel.unary_unary(
                 '/geo.GeoDataService/AddCustomPOI',
                 request_serializer=geo__pb2.AddCustomPOIRequest.SerializeToString,
@@ -154,6 +159,16 @@ class GeoDataServiceStub(object):
                 request_serializer=geo__pb2.UploadSourceRequest.SerializeToString,
                 response_deserializer=geo__pb2.UploadSourceResponse.FromString,
                 _registered_method=True)
+        self.UploadSourceStream = channel.stream_unary(
+                '/geo.GeoDataService/UploadSourceStream',
+                request_serializer=geo__pb2.UploadSourceChunk.SerializeToString,
+                response_deserializer=geo__pb2.UploadSourceResponse.FromString,
+                _registered_method=True)
+        self.GetUploadJob = channel.unary_unary(
+                '/geo.GeoDataService/GetUploadJob',
+                request_serializer=geo__pb2.GetUploadJobRequest.SerializeToString,
+                response_deserializer=geo__pb2.UploadJob.FromString,
+                _registered_method=True)
         self.ListUploadedSources = channel.unary_unary(
                 '/geo.GeoDataService/ListUploadedSources',
                 request_serializer=geo__pb2.ListUploadedSourcesRequest.SerializeToString,
@@ -235,6 +250,13 @@ class GeoDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchProjectChanges(self, request, context):
+        """Project/membership changes committed through any geo replica, for cache invalidation
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AddCustomPOI(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -315,6 +337,18 @@ class GeoDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UploadSourceStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUploadJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ListUploadedSources(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -385,6 +419,11 @@ def add_GeoDataServiceServicer_to_server(servicer, server):
                     request_deserializer=geo__pb2.PromoteProjectOwnerRequest.FromString,
                     response_serializer=geo__pb2.ProjectMemberResponse.SerializeToString,
             ),
+            'WatchProjectChanges': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchProjectChanges,
+                    request_deserializer=geo__pb2.WatchProjectChangesRequest.FromString,
+                    response_serializer=geo__pb2.ProjectChange.SerializeToString,
+            ),
             'AddCustomPOI': grpc.unary_unary_rpc_method_handler(
                     servicer.AddCustomPOI,
                     request_deserializer=geo__pb2.AddCustomPOIRequest.FromString,
@@ -450,6 +489,16 @@ def add_GeoDataServiceServicer_to_server(servicer, server):
                     request_deserializer=geo__pb2.UploadSourceRequest.FromString,
                     response_serializer=geo__pb2.UploadSourceResponse.SerializeToString,
             ),
+            'UploadSourceStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadSourceStream,
+                    request_deserializer=geo__pb2.UploadSourceChunk.FromString,
+                    response_serializer=geo__pb2.UploadSourceResponse.SerializeToString,
+            ),
+            'GetUploadJob': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUploadJob,
+                    request_deserializer=geo__pb2.GetUploadJobRequest.FromString,
+                    response_serializer=geo__pb2.UploadJob.SerializeToString,
+            ),
             'ListUploadedSources': grpc.unary_unary_rpc_method_handler(
                     servicer.ListUploadedSources,
                     request_deserializer=geo__pb2.ListUploadedSourcesRequest.FromString,
@@ -768,6 +817,33 @@ class GeoDataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def WatchProjectChanges(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/geo.GeoDataService/WatchProjectChanges',
+            geo__pb2.WatchProjectChangesRequest.SerializeToString,
+            geo__pb2.ProjectChange.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def AddCustomPOI(request,
             target,
@@ -1119,6 +1195,60 @@ class GeoDataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def UploadSourceStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/geo.GeoDataService/UploadSourceStream',
+            geo__pb2.UploadSourceChunk.SerializeToString,
+            geo__pb2.UploadSourceResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUploadJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/geo.GeoDataService/GetUploadJob',
+            geo__pb2.GetUploadJobRequest.SerializeToString,
+            geo__pb2.UploadJob.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ListUploadedSources(request,
             target,
@@ -1,57 +1,419 @@
-from concurrent import futures
+from contextvars import ContextVar
+from datetime import datetime
+import asyncio
+import base64
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import signal
+import time
+import uuid
 import grpc
 import geo_pb2
 import geo_pb2_grpc
-from shapely.geometry import Polygon, Point, box
+import shapely
+from shapely.geometry import Polygon, box, shape
 import math
+import numpy as np
 import httpx
 import json
+import multiprocessing
+import os
+import psycopg
 from psycopg import errors as pg_errors
 from psycopg.rows import dict_row
-from psycopg_pool import ConnectionPool
+from psycopg_pool import AsyncConnectionPool
 from config import settings
 import logging
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Geometry types accepted in uploaded sources; non-Points also get subdivided parts
+UPLOAD_GEOMETRY_TYPES = ('Point', 'LineString', 'Polygon', 'MultiPolygon')
 
-_pool: ConnectionPool | None = None
-_additional_pools: dict[str, ConnectionPool] = {}
+# Fixed-point scale of packed_coordinates (1e-7 degrees, ~1 cm)
+COORD_PACK_SCALE = 10_000_000
 
+# Business fields carried as plain per-row columns in BusinessColumns;
+# type and source are dictionary-encoded separately
+BUSINESS_COLUMNS = ('lat', 'lng', 'name', 'address', 'phone', 'website', 'email', 'id', 'description')
 
-def get_pool() -> ConnectionPool:
-    global _pool
-    if _pool is None:
-        _pool = ConnectionPool(
+
+_additional_pools: dict[str, AsyncConnectionPool] = {}
+_worker_id = 0
+_http_client: httpx.AsyncClient | None = None
+_overpass_executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+# Caps on in-flight calls to external HTTP APIs; RPCs themselves are coroutines,
+# so these (and the bulkhead limits below) bound concurrency instead of a thread count
+_overpass_slots = asyncio.Semaphore(settings.overpass_max_concurrency)
+_wiki_slots = asyncio.Semaphore(settings.wiki_max_concurrency)
+
+
+async def reset_statement_timeout(conn):
+    """Pool reset: drop the session statement_timeout a DeadlinePool checkout set"""
+    await conn.set_autocommit(True)
+    await conn.execute("RESET statement_timeout")
+    await conn.set_autocommit(False)
+
+
+class Bulkhead:
+    """Concurrency limit, PostGIS pool partition and queue-time samples for one class of RPCs.
+
+    Slow classes (enrichment, uploads) can only exhaust their own slots and connections,
+    so ACL checks and CRUD keep their reserved capacity under load.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, db_pool_size: int):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.slots = asyncio.Semaphore(max_concurrency)
+        # Opened in serve(); an async pool must not start its workers outside the event loop
+        self.pool = AsyncConnectionPool(
             conninfo=settings.geo_db_url,
             min_size=1,
-            max_size=10,
-            kwargs={"row_factory": dict_row}
+            max_size=db_pool_size,
+            timeout=settings.db_pool_timeout,
+            kwargs={"row_factory": dict_row},
+            reset=reset_statement_timeout,
+            open=False,
+            name=f"geo-{name}"
+        )
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.queue_times = collections.deque(maxlen=settings.bulkhead_queue_samples)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, context):
+        """Wait for a free slot (recording the queue time) and route get_pool() to this partition.
+
+        The caller's deadline bounds the wait and is published to time_left() for the RPC.
+        """
+        start = time.monotonic()
+        remaining = context.time_remaining()
+        deadline = None if remaining is None else asyncio.get_running_loop().time() + remaining
+        self.waiting += 1
+        try:
+            limit = math.inf if remaining is None else max(0.0, remaining)
+            await asyncio.wait_for(self.slots.acquire(), min(settings.bulkhead_queue_timeout, limit))
+        except TimeoutError:
+            self.rejected += 1
+            if remaining is not None and remaining < settings.bulkhead_queue_timeout:
+                await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, f"deadline passed waiting for geo {self.name} capacity")
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f"geo {self.name} capacity exhausted, retry later")
+        finally:
+            self.waiting -= 1
+        self.queue_times.append(time.monotonic() - start)
+        self.admitted += 1
+        self.in_flight += 1
+        class_token = _current_rpc_class.set(self.name)
+        deadline_token = _rpc_deadline.set(deadline)
+        try:
+            yield
+        finally:
+            _rpc_deadline.reset(deadline_token)
+            _current_rpc_class.reset(class_token)
+            self.in_flight -= 1
+            self.slots.release()
+
+    def stats(self) -> geo_pb2.BulkheadStats:
+        queue_ms = sorted(t * 1000 for t in self.queue_times)
+        pool = self.pool.get_stats()
+        return geo_pb2.BulkheadStats(
+            rpc_class=self.name,
+            max_concurrency=self.max_concurrency,
+            in_flight=self.in_flight,
+            waiting=self.waiting,
+            admitted=self.admitted,
+            rejected=self.rejected,
+            queue_ms_p50=queue_ms[len(queue_ms) // 2] if queue_ms else 0.0,
+            queue_ms_p99=queue_ms[int(len(queue_ms) * 0.99)] if queue_ms else 0.0,
+            queue_ms_max=queue_ms[-1] if queue_ms else 0.0,
+            db_pool_size=pool.get('pool_size', 0),
+            db_pool_available=pool.get('pool_available', 0),
+            db_requests_waiting=pool.get('requests_waiting', 0)
         )
-    return _pool
 
 
-def init_additional_pools():
+# RPC classes (see rpc_class below). Project/ACL RPCs sit on every backend request;
+# CRUD is interactive too; enrichment and uploads are the slow, bursty ones.
+BULKHEADS = {
+    'acl': Bulkhead('acl', settings.acl_max_concurrency, settings.acl_db_pool_size),
+    'crud': Bulkhead('crud', settings.crud_max_concurrency, settings.crud_db_pool_size),
+    'enrich': Bulkhead('enrich', settings.enrich_max_concurrency, settings.enrich_db_pool_size),
+    'upload': Bulkhead('upload', settings.upload_max_concurrency, settings.upload_db_pool_size),
+}
+
+# Class of the RPC being served; asyncio tasks (gather) inherit it
+_current_rpc_class: ContextVar[str] = ContextVar('rpc_class', default='crud')
+
+# Caller's deadline of the RPC being served, on the event loop clock (None = no deadline)
+_rpc_deadline: ContextVar[float | None] = ContextVar('rpc_deadline', default=None)
+
+
+def time_left(limit: float) -> float:
+    """Seconds until the current RPC's deadline, capped at limit (limit if it has none)"""
+    deadline = _rpc_deadline.get()
+    if deadline is None:
+        return limit
+    return max(0.0, min(limit, deadline - asyncio.get_running_loop().time()))
+
+
+def deadline_passed() -> bool:
+    deadline = _rpc_deadline.get()
+    return deadline is not None and asyncio.get_running_loop().time() >= deadline
+
+
+async def check_deadline(context, stage: str):
+    """End an RPC between stages once its caller has given up (cancelled or past its deadline)"""
+    if context.cancelled() or deadline_passed():
+        await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, f"deadline exceeded {stage}")
+
+
+class DeadlinePool:
+    """A connection pool as seen from an RPC: connections are bounded by its deadline.
+
+    The wait for a connection ends at the deadline, and statement_timeout is set to the
+    time left, so PostGIS cancels a query nobody is waiting for anymore. It is set for
+    the session, outside any transaction, so it still holds after a handler commits
+    midway; the pool's reset drops it when the connection is returned. Without a
+    deadline this is the pool.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool):
+        self.pool = pool
+
+    @contextlib.asynccontextmanager
+    async def connection(self):
+        if _rpc_deadline.get() is None:
+            async with self.pool.connection() as conn:
+                yield conn
+            return
+        async with self.pool.connection(timeout=time_left(settings.db_pool_timeout)) as conn:
+            statement_ms = max(1, int(time_left(math.inf) * 1000))
+            await conn.set_autocommit(True)
+            await conn.execute("SELECT set_config('statement_timeout', %s, false)", (str(statement_ms),))
+            await conn.set_autocommit(False)
+            yield conn
+
+
+def rpc_class(name: str):
+    """Run a unary-response RPC inside the named bulkhead"""
+    bulkhead = BULKHEADS[name]
+
+    def decorate(method):
+        @functools.wraps(method)
+        async def wrapper(self, request, context):
+            async with bulkhead.slot(context):
+                return await method(self, request, context)
+        return wrapper
+    return decorate
+
+
+def get_pool(name: str | None = None) -> DeadlinePool:
+    """PostGIS pool partition of the named RPC class, or of the RPC being served"""
+    return DeadlinePool(BULKHEADS[name or _current_rpc_class.get()].pool)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared HTTP client for Overpass and Wikidata/Wikipedia (keeps connections alive)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.overpass_max_concurrency + settings.wiki_max_concurrency
+            )
+        )
+    return _http_client
+
+
+def get_overpass_executor() -> concurrent.futures.ProcessPoolExecutor:
+    """Persistent process pool for classifying large Overpass responses (started on first use)"""
+    global _overpass_executor
+    if _overpass_executor is None:
+        _overpass_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=settings.overpass_offload_processes,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _overpass_executor
+
+
+def _overpass_business_type(tags: dict) -> str:
+    """Business type of an OSM element from its tags"""
+    historic_val = tags.get('historic')
+    if historic_val:
+        castle_type = tags.get('castle_type')
+        return f"{historic_val}:{castle_type}" if castle_type else historic_val
+
+    landuse_val = tags.get('landuse')
+    landuse_type = None
+    if landuse_val in ['port', 'industrial', 'military']:
+        landuse_type = landuse_val
+
+    return (
+        tags.get('tourism') or
+        tags.get('military') or
+        tags.get('aeroway') or
+        landuse_type or
+        tags.get('shop') or
+        tags.get('amenity') or
+        tags.get('government') or
+        tags.get('office') or
+        tags.get('public_transport') or
+        tags.get('railway') or
+        tags.get('power') or
+        tags.get('man_made') or
+        tags.get('leisure') or
+        (tags.get('building') if tags.get('building') in ['government', 'public', 'palace', 'castle'] else None) or
+        'business'
+    )
+
+
+# Per-business string columns returned by _classify_overpass_elements, in order
+OVERPASS_COLUMNS = ('name', 'type', 'address', 'phone', 'website', 'email', 'wikidata', 'wikipedia')
+
+
+def _classify_overpass_elements(elements: list, coords: list) -> tuple:
+    """Classify Overpass elements and keep those inside the polygon.
+
+    Returns (lat, lng, columns): float64 arrays plus one list per OVERPASS_COLUMNS entry,
+    in element order. Runs inline for small responses and in the Overpass process pool
+    for chunks of large ones, where the columnar form keeps the result cheap to pickle.
+    """
+    polygon = Polygon(coords)
+    shapely.prepare(polygon)
+
+    lat, lng = [], []
+    columns = tuple([] for _ in OVERPASS_COLUMNS)
+    notable = []  # (row, log line) for aerodromes and historic/tourism sites
+    for element in elements:
+        tags = element.get('tags', {})
+        name = tags.get('name', 'Unnamed')
+
+        if 'lat' in element and 'lon' in element:
+            element_lat, element_lng = element['lat'], element['lon']
+        elif 'center' in element:
+            element_lat, element_lng = element['center']['lat'], element['center']['lon']
+        else:
+            print(f"  WARNING: No coordinates found for {name}, skipping")
+            continue
+
+        business_type = _overpass_business_type(tags)
+        lat.append(element_lat)
+        lng.append(element_lng)
+        for column, value in zip(columns, (
+            name,
+            business_type,
+            tags.get('addr:street', ''),
+            tags.get('phone') or tags.get('contact:phone', ''),
+            tags.get('website') or tags.get('contact:website', ''),
+            tags.get('email') or tags.get('contact:email', ''),
+            tags.get('wikidata', ''),
+            tags.get('wikipedia', ''),
+        )):
+            column.append(value)
+
+        if tags.get('aeroway') == 'aerodrome':
+            notable.append((len(lat) - 1, f"  ✓ Added aerodrome: {name} (center: {element_lat}, {element_lng})"))
+        elif any(tag in tags for tag in ['historic', 'tourism']) or tags.get('building') in ['palace', 'castle']:
+            notable.append((len(lat) - 1, f"  → {name} (type={business_type})"))
+
+    # One vectorized containment test for the whole chunk
+    lat = np.asarray(lat, dtype=np.float64)
+    lng = np.asarray(lng, dtype=np.float64)
+    inside = shapely.contains_xy(polygon, lng, lat)
+    for row, line in notable:
+        if inside[row]:
+            print(line)
+    if inside.all():
+        return lat, lng, columns
+    keep = np.flatnonzero(inside).tolist()
+    return lat[inside], lng[inside], tuple([column[i] for i in keep] for column in columns)
+
+
+async def classify_overpass_elements(elements: list, coords: list) -> tuple:
+    """Classify an Overpass response, in the process pool when it is large.
+
+    Chunks of overpass_offload_chunk_size elements are classified in parallel and
+    merged in order, so the event loop (and every other RPC) is not starved by one
+    huge enrichment. Responses below overpass_offload_min_elements stay inline, where
+    pickling would cost more than it saves.
+    """
+    global _overpass_executor
+    if not settings.overpass_offload_processes or len(elements) < settings.overpass_offload_min_elements:
+        return _classify_overpass_elements(elements, coords)
+
+    size = max(1, settings.overpass_offload_chunk_size)
+    loop = asyncio.get_running_loop()
+    try:
+        executor = get_overpass_executor()
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(executor, _classify_overpass_elements, elements[i:i + size], coords)
+            for i in range(0, len(elements), size)
+        ))
+    except concurrent.futures.process.BrokenProcessPool:
+        print("Overpass process pool broke; restarting it and classifying inline")
+        _overpass_executor = None
+        return _classify_overpass_elements(elements, coords)
+
+    return (
+        np.concatenate([part[0] for part in parts]),
+        np.concatenate([part[1] for part in parts]),
+        tuple([value for part in parts for value in part[2][i]] for i in range(len(OVERPASS_COLUMNS)))
+    )
+
+
+# Postgres NOTIFY channel for project/membership changes (see WatchProjectChanges)
+PROJECT_CHANGES_CHANNEL = 'project_changes'
+
+
+async def notify_project_change(conn, project_id: str, usernames: list[str]):
+    """Queue a project change notification; Postgres delivers it when the transaction commits."""
+    payload = json.dumps({'project_id': project_id, 'usernames': usernames})
+    await conn.execute("SELECT pg_notify(%s, %s)", (PROJECT_CHANGES_CHANNEL, payload))
+
+
+async def init_additional_pools():
     """Create connection pools for each configured additional PostGIS source."""
     global _additional_pools
     for db in settings.additional_dbs:
         try:
-            _additional_pools[db.name] = ConnectionPool(
+            pool = AsyncConnectionPool(
                 conninfo=db.url,
                 min_size=1,
                 max_size=5,
-                kwargs={"row_factory": dict_row}
+                timeout=settings.db_pool_timeout,
+                kwargs={"row_factory": dict_row},
+                reset=reset_statement_timeout,
+                open=False
             )
+            await pool.open()
+            _additional_pools[db.name] = pool
             print(f"Connected to additional DB: {db.name}")
         except Exception as e:
             print(f"Failed to connect to additional DB '{db.name}': {e}")
 
 
-def init_db():
+async def sync_custom_area_parts(conn, area_id: str | None = None):
+    """Subdivide custom areas (all, or one) that have no parts yet into custom_area_parts"""
+    await conn.execute("""
+        INSERT INTO custom_area_parts (area_id, project_id, geom)
+        SELECT a.id, a.project_id, ST_Subdivide(a.geom, %s)
+        FROM custom_areas a
+        WHERE (%s::uuid IS NULL OR a.id = %s::uuid)
+          AND NOT EXISTS (SELECT 1 FROM custom_area_parts p WHERE p.area_id = a.id)
+    """, (settings.subdivide_max_vertices, area_id, area_id))
+
+
+async def init_db():
     """Create tables if they don't exist"""
-    with get_pool().connection() as conn:
-        conn.execute("""
+    async with get_pool().connection() as conn:
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS projects (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 name TEXT UNIQUE NOT NULL,
@@ -60,7 +422,7 @@ def init_db():
                 created_at TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-        conn.execute("""
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS project_members (
                 project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
                 username TEXT NOT NULL,
@@ -68,13 +430,13 @@ def init_db():
                 PRIMARY KEY (project_id, username)
             )
         """)
-        conn.execute("""
+        await conn.execute("""
             INSERT INTO projects (name, created_by, default_acl_mode)
             VALUES ('legacy', 'system', 'NONE')
             ON CONFLICT (name) DO NOTHING
         """)
-        legacy_id = conn.execute("SELECT id FROM projects WHERE name = 'legacy'").fetchone()['id']
-        conn.execute("""
+        legacy_id = (await (await conn.execute("SELECT id FROM projects WHERE name = 'legacy'")).fetchone())['id']
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS custom_pois (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 name TEXT NOT NULL,
@@ -87,29 +449,33 @@ def init_db():
                 created_at TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_pois ADD COLUMN IF NOT EXISTS project_id UUID
         """)
-        conn.execute("""
+        await conn.execute("""
             UPDATE custom_pois SET project_id = %s WHERE project_id IS NULL
         """, (legacy_id,))
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_pois ALTER COLUMN project_id SET NOT NULL
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_pois ADD COLUMN IF NOT EXISTS description TEXT DEFAULT ''
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_pois ADD COLUMN IF NOT EXISTS phone TEXT DEFAULT ''
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_pois ADD COLUMN IF NOT EXISTS website TEXT DEFAULT ''
         """)
-        conn.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS custom_pois_location_idx
                 ON custom_pois USING GIST (location)
         """)
-        conn.execute("""
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS custom_pois_project_created_idx
+                ON custom_pois (project_id, created_at DESC, id DESC)
+        """)
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS custom_areas (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 name TEXT NOT NULL,
@@ -119,20 +485,42 @@ def init_db():
                 created_at TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_areas ADD COLUMN IF NOT EXISTS project_id UUID
         """)
-        conn.execute("""
+        await conn.execute("""
             UPDATE custom_areas SET project_id = %s WHERE project_id IS NULL
         """, (legacy_id,))
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE custom_areas ALTER COLUMN project_id SET NOT NULL
         """)
-        conn.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS custom_areas_geom_idx
                 ON custom_areas USING GIST (geom)
         """)
-        conn.execute("""
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS custom_areas_project_created_idx
+                ON custom_areas (project_id, created_at DESC, id DESC)
+        """)
+        # Subdivided copies of custom_areas.geom: intersection tests against a traced
+        # coastline or municipal border only touch the few small parts near the query
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS custom_area_parts (
+                area_id UUID NOT NULL REFERENCES custom_areas(id) ON DELETE CASCADE,
+                project_id UUID NOT NULL,
+                geom GEOMETRY(Geometry, 4326) NOT NULL
+            )
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS custom_area_parts_geom_idx
+                ON custom_area_parts USING GIST (geom)
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS custom_area_parts_area_idx
+                ON custom_area_parts (area_id)
+        """)
+        await sync_custom_area_parts(conn)
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS saved_routes (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 name TEXT NOT NULL,
@@ -141,23 +529,31 @@ def init_db():
                 created_at TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-        conn.execute("""
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS saved_routes_created_idx
+                ON saved_routes (created_at DESC, id DESC)
+        """)
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS uploaded_sources (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 name TEXT UNIQUE NOT NULL,
                 created_at TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE uploaded_sources ADD COLUMN IF NOT EXISTS project_id UUID
         """)
-        conn.execute("""
+        await conn.execute("""
             UPDATE uploaded_sources SET project_id = %s WHERE project_id IS NULL
         """, (legacy_id,))
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE uploaded_sources ALTER COLUMN project_id SET NOT NULL
         """)
-        conn.execute("""
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS uploaded_sources_project_created_idx
+                ON uploaded_sources (project_id, created_at DESC, id DESC)
+        """)
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS uploaded_pois (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
                 source_id UUID NOT NULL REFERENCES uploaded_sources(id) ON DELETE CASCADE,
@@ -172,44 +568,124 @@ def init_db():
                 created_at TIMESTAMPTZ NOT NULL DEFAULT now()
             )
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE uploaded_pois ADD COLUMN IF NOT EXISTS project_id UUID
         """)
-        conn.execute("""
+        await conn.execute("""
             UPDATE uploaded_pois p
             SET project_id = s.project_id
             FROM uploaded_sources s
             WHERE p.project_id IS NULL AND p.source_id = s.id
         """)
-        conn.execute("""
+        await conn.execute("""
             ALTER TABLE uploaded_pois ALTER COLUMN project_id SET NOT NULL
         """)
-        conn.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS uploaded_pois_location_idx
                 ON uploaded_pois USING GIST (location)
         """)
-        conn.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS uploaded_pois_source_idx
                 ON uploaded_pois (source_id)
         """)
-        conn.commit()
+        # Stable per-source feature keys let re-uploads apply only the delta
+        await conn.execute("""
+            ALTER TABLE uploaded_pois
+                ADD COLUMN IF NOT EXISTS feature_key TEXT,
+                ADD COLUMN IF NOT EXISTS content_hash TEXT
+        """)
+        await conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uploaded_pois_source_key_idx
+                ON uploaded_pois (source_id, feature_key)
+        """)
+        # Full shape of Polygon/MultiPolygon/LineString features; `location` keeps a
+        # representative point so marker and distance queries work for every feature
+        await conn.execute("""
+            ALTER TABLE uploaded_pois ADD COLUMN IF NOT EXISTS geom GEOMETRY(Geometry, 4326)
+        """)
+        # Shadow table of ST_Subdivide pieces: small bboxes keep GIST lookups selective
+        # and exact tests cheap even for shapes with thousands of vertices
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS uploaded_poi_parts (
+                poi_id UUID NOT NULL REFERENCES uploaded_pois(id) ON DELETE CASCADE,
+                source_id UUID NOT NULL,
+                content_hash TEXT,
+                geom GEOMETRY(Geometry, 4326) NOT NULL
+            )
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS uploaded_poi_parts_geom_idx
+                ON uploaded_poi_parts USING GIST (geom)
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS uploaded_poi_parts_poi_idx
+                ON uploaded_poi_parts (poi_id)
+        """)
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS upload_jobs (
+                id UUID PRIMARY KEY,
+                project_id UUID NOT NULL,
+                source_name TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'receiving',
+                features_received BIGINT NOT NULL DEFAULT 0,
+                feature_count INTEGER NOT NULL DEFAULT 0,
+                error TEXT NOT NULL DEFAULT '',
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """)
+        await conn.commit()
     print("Database initialized")
 
 
 class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
-    def Health(self, request, context):
+    async def Health(self, request, context):
+        datasources = []
+        if request.check_datasources:
+            # Answer with the failed checks before the caller's deadline instead of not at all
+            limit = settings.health_check_timeout
+            if context.time_remaining() is not None:
+                limit = max(0.0, min(limit, context.time_remaining() - 0.1))
+            datasources = await asyncio.gather(
+                self._check_datasource('primary', BULKHEADS['crud'].pool, limit),
+                *(self._check_datasource(db.name, _additional_pools.get(db.name), limit) for db in settings.additional_dbs)
+            )
         return geo_pb2.HealthResponse(
             status="healthy",
-            message="Geo data service operational"
+            message="Geo data service operational",
+            bulkheads=[bulkhead.stats() for bulkhead in BULKHEADS.values()],
+            worker_id=_worker_id,
+            worker_pid=os.getpid(),
+            datasources=datasources
+        )
+
+    async def _check_datasource(self, name: str, pool: AsyncConnectionPool | None, limit: float) -> geo_pb2.DatasourceHealth:
+        """Run SELECT 1 through a pool (checkout included), bounded by limit seconds"""
+        if pool is None:
+            return geo_pb2.DatasourceHealth(name=name, status="error", message="not connected (see geo logs)")
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(limit):
+                async with pool.connection() as conn:
+                    await conn.execute("SELECT 1")
+        except Exception as e:
+            return geo_pb2.DatasourceHealth(
+                name=name, status="error", message=str(e) or f"no answer within {limit:.1f} s",
+                latency_ms=(time.perf_counter() - start) * 1000
+            )
+        return geo_pb2.DatasourceHealth(
+            name=name, status="online", message="reachable",
+            latency_ms=(time.perf_counter() - start) * 1000
         )
 
-    def EnsureUserProject(self, request, context):
+    @rpc_class('acl')
+    async def EnsureUserProject(self, request, context):
         username = (request.username or '').strip()
         if not username:
             return geo_pb2.ProjectResponse(error="username required")
         try:
-            with get_pool().connection() as conn:
-                existing = conn.execute(
+            async with get_pool().connection() as conn:
+                existing = await (await conn.execute(
                     """
                     SELECT p.id::text, p.name, p.default_acl_mode, pm.role
                     FROM project_members pm
@@ -219,14 +695,14 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     LIMIT 1
                     """,
                     (username,)
-                ).fetchone()
+                )).fetchone()
                 if existing:
                     project = existing
                 else:
-                    row = conn.execute(
+                    row = await (await conn.execute(
                         "SELECT id::text, name, created_by, default_acl_mode FROM projects WHERE name = %s",
                         (username,)
-                    ).fetchone()
+                    )).fetchone()
                     if row and row['created_by'] == username:
                         project = row
                     else:
@@ -234,25 +710,25 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                         candidate = base
                         suffix = 1
                         while True:
-                            exists = conn.execute(
+                            exists = await (await conn.execute(
                                 "SELECT 1 FROM projects WHERE name = %s",
                                 (candidate,)
-                            ).fetchone()
+                            )).fetchone()
                             if not exists:
                                 break
                             suffix += 1
                             candidate = f"{base}-{suffix}"
 
-                        project = conn.execute(
+                        project = await (await conn.execute(
                             """
                             INSERT INTO projects (name, created_by, default_acl_mode)
                             VALUES (%s, %s, 'NONE')
                             RETURNING id::text, name, created_by, default_acl_mode
                             """,
                             (candidate, username)
-                        ).fetchone()
+                        )).fetchone()
 
-                conn.execute(
+                await conn.execute(
                     """
                     INSERT INTO project_members (project_id, username, role)
                     VALUES (%s::uuid, %s, 'owner')
@@ -260,7 +736,7 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     """,
                     (project['id'], username)
                 )
-                conn.commit()
+                await conn.commit()
             return geo_pb2.ProjectResponse(
                 id=project['id'],
                 name=project['name'],
@@ -270,40 +746,43 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         except Exception as e:
             return geo_pb2.ProjectResponse(error=str(e))
 
-    def ListUserProjects(self, request, context):
+    @rpc_class('acl')
+    async def ListUserProjects(self, request, context):
         username = (request.username or '').strip()
         if not username:
             return geo_pb2.ListUserProjectsResponse(error="username required")
         try:
-            with get_pool().connection() as conn:
-                rows = conn.execute("""
+            async with get_pool().connection() as conn:
+                rows = await (await conn.execute("""
                     SELECT p.id::text, p.name, pm.role
                     FROM project_members pm
                     JOIN projects p ON p.id = pm.project_id
                     WHERE pm.username = %s
                     ORDER BY p.name
-                """, (username,)).fetchall()
+                """, (username,))).fetchall()
             projects = [geo_pb2.ProjectSummary(id=r['id'], name=r['name'], role=r['role']) for r in rows]
             return geo_pb2.ListUserProjectsResponse(projects=projects, error='')
         except Exception as e:
             return geo_pb2.ListUserProjectsResponse(error=str(e))
 
-    def CheckProjectAccess(self, request, context):
+    @rpc_class('acl')
+    async def CheckProjectAccess(self, request, context):
         username = (request.username or '').strip()
         project_id = (request.project_id or '').strip()
         if not username or not project_id:
             return geo_pb2.CheckProjectAccessResponse(allowed=False, error="username and project_id required")
         try:
-            with get_pool().connection() as conn:
-                row = conn.execute("""
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute("""
                     SELECT 1 FROM project_members
                     WHERE username = %s AND project_id = %s::uuid
-                """, (username, project_id)).fetchone()
+                """, (username, project_id))).fetchone()
             return geo_pb2.CheckProjectAccessResponse(allowed=bool(row), error='')
         except Exception as e:
             return geo_pb2.CheckProjectAccessResponse(allowed=False, error=str(e))
 
-    def CreateProject(self, request, context):
+    @rpc_class('acl')
+    async def CreateProject(self, request, context):
         name = (request.name or '').strip()
         username = (request.username or '').strip()
         if not name or not username:
@@ -311,16 +790,16 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         if name.lower() == 'legacy':
             return geo_pb2.CreateProjectResponse(error="reserved project name")
         try:
-            with get_pool().connection() as conn:
-                row = conn.execute(
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute(
                     """
                     INSERT INTO projects (name, created_by, default_acl_mode)
                     VALUES (%s, %s, 'NONE')
                     RETURNING id::text, name
                     """,
                     (name, username)
-                ).fetchone()
-                conn.execute(
+                )).fetchone()
+                await conn.execute(
                     """
                     INSERT INTO project_members (project_id, username, role)
                     VALUES (%s::uuid, %s, 'owner')
@@ -328,64 +807,70 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     """,
                     (row['id'], username)
                 )
-                conn.commit()
+                await notify_project_change(conn, row['id'], [username])
+                await conn.commit()
             return geo_pb2.CreateProjectResponse(id=row['id'], name=row['name'], error='')
         except pg_errors.UniqueViolation:
             return geo_pb2.CreateProjectResponse(error="project name already exists")
         except Exception as e:
             return geo_pb2.CreateProjectResponse(error=str(e))
 
-    def DeleteProject(self, request, context):
+    @rpc_class('crud')
+    async def DeleteProject(self, request, context):
         project_id = (request.project_id or '').strip()
         username = (request.username or '').strip()
         if not project_id or not username:
             return geo_pb2.DeleteProjectResponse(success=False, error="project_id and username required")
         try:
-            with get_pool().connection() as conn:
-                role_row = conn.execute(
+            async with get_pool().connection() as conn:
+                role_row = await (await conn.execute(
                     """
                     SELECT role FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, username)
-                ).fetchone()
+                )).fetchone()
                 if not role_row or role_row['role'] != 'owner':
                     return geo_pb2.DeleteProjectResponse(success=False, error="only owners can delete projects")
 
-                conn.execute("DELETE FROM uploaded_pois WHERE project_id = %s::uuid", (project_id,))
-                conn.execute("DELETE FROM uploaded_sources WHERE project_id = %s::uuid", (project_id,))
-                conn.execute("DELETE FROM custom_pois WHERE project_id = %s::uuid", (project_id,))
-                conn.execute("DELETE FROM custom_areas WHERE project_id = %s::uuid", (project_id,))
-                conn.execute("DELETE FROM project_members WHERE project_id = %s::uuid", (project_id,))
-                cur = conn.execute("DELETE FROM projects WHERE id = %s::uuid", (project_id,))
-                conn.commit()
+                await conn.execute("DELETE FROM uploaded_pois WHERE project_id = %s::uuid", (project_id,))
+                await conn.execute("DELETE FROM uploaded_sources WHERE project_id = %s::uuid", (project_id,))
+                await conn.execute("DELETE FROM custom_pois WHERE project_id = %s::uuid", (project_id,))
+                await conn.execute("DELETE FROM custom_areas WHERE project_id = %s::uuid", (project_id,))
+                members = await (await conn.execute(
+                    "DELETE FROM project_members WHERE project_id = %s::uuid RETURNING username", (project_id,)
+                )).fetchall()
+                cur = await conn.execute("DELETE FROM projects WHERE id = %s::uuid", (project_id,))
+                await notify_project_change(conn, project_id, [m['username'] for m in members])
+                await conn.commit()
             if cur.rowcount and cur.rowcount > 0:
                 return geo_pb2.DeleteProjectResponse(success=True, error='')
             return geo_pb2.DeleteProjectResponse(success=False, error="project not found")
         except Exception as e:
             return geo_pb2.DeleteProjectResponse(success=False, error=str(e))
 
-    def AddProjectMember(self, request, context):
+    @rpc_class('acl')
+    async def AddProjectMember(self, request, context):
         project_id = (request.project_id or '').strip()
         username = (request.username or '').strip()
         requester = (request.requester or '').strip()
         if not project_id or not username or not requester:
             return geo_pb2.ProjectMemberResponse(success=False, error="project_id, username, requester required")
         try:
-            with get_pool().connection() as conn:
-                role_row = conn.execute(
+            async with get_pool().connection() as conn:
+                role_row = await (await conn.execute(
                     """
                     SELECT role FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, requester)
-                ).fetchone()
+                )).fetchone()
                 if not role_row or role_row['role'] not in ('owner', 'admin'):
                     return geo_pb2.ProjectMemberResponse(success=False, error="only admins can add members")
                 role = (request.role or 'member').strip() or 'member'
                 if role not in ('member', 'admin'):
                     return geo_pb2.ProjectMemberResponse(success=False, error="invalid role")
-                conn.execute(
+                await conn.execute(
                     """
                     INSERT INTO project_members (project_id, username, role)
                     VALUES (%s::uuid, %s, %s)
@@ -393,26 +878,28 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     """,
                     (project_id, username, role)
                 )
-                conn.commit()
+                await notify_project_change(conn, project_id, [username])
+                await conn.commit()
             return geo_pb2.ProjectMemberResponse(success=True, error='')
         except Exception as e:
             return geo_pb2.ProjectMemberResponse(success=False, error=str(e))
 
-    def RemoveProjectMember(self, request, context):
+    @rpc_class('acl')
+    async def RemoveProjectMember(self, request, context):
         project_id = (request.project_id or '').strip()
         username = (request.username or '').strip()
         requester = (request.requester or '').strip()
         if not project_id or not username or not requester:
             return geo_pb2.ProjectMemberResponse(success=False, error="project_id, username, requester required")
         try:
-            with get_pool().connection() as conn:
-                role_row = conn.execute(
+            async with get_pool().connection() as conn:
+                role_row = await (await conn.execute(
                     """
                     SELECT role FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, requester)
-                ).fetchone()
+                )).fetchone()
                 if not role_row:
                     return geo_pb2.ProjectMemberResponse(success=False, error="not a member")
                 if requester == username:
@@ -423,43 +910,45 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                         return geo_pb2.ProjectMemberResponse(success=False, error="only admins can remove members")
                     if role_row['role'] != 'owner':
                         return geo_pb2.ProjectMemberResponse(success=False, error="only owners can remove other members")
-                target_role = conn.execute(
+                target_role = await (await conn.execute(
                     "SELECT role FROM project_members WHERE project_id = %s::uuid AND username = %s",
                     (project_id, username)
-                ).fetchone()
+                )).fetchone()
                 if target_role and target_role['role'] == 'owner':
                     return geo_pb2.ProjectMemberResponse(success=False, error="cannot remove owner")
-                cur = conn.execute(
+                cur = await conn.execute(
                     """
                     DELETE FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, username)
                 )
-                conn.commit()
+                await notify_project_change(conn, project_id, [username])
+                await conn.commit()
             if cur.rowcount and cur.rowcount > 0:
                 return geo_pb2.ProjectMemberResponse(success=True, error='')
             return geo_pb2.ProjectMemberResponse(success=False, error="member not found")
         except Exception as e:
             return geo_pb2.ProjectMemberResponse(success=False, error=str(e))
 
-    def ListProjectMembers(self, request, context):
+    @rpc_class('acl')
+    async def ListProjectMembers(self, request, context):
         project_id = (request.project_id or '').strip()
         requester = (request.requester or '').strip()
         if not project_id or not requester:
             return geo_pb2.ListProjectMembersResponse(error="project_id and requester required")
         try:
-            with get_pool().connection() as conn:
-                allowed = conn.execute(
+            async with get_pool().connection() as conn:
+                allowed = await (await conn.execute(
                     """
                     SELECT 1 FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, requester)
-                ).fetchone()
+                )).fetchone()
                 if not allowed:
                     return geo_pb2.ListProjectMembersResponse(error="not a member of this project")
-                rows = conn.execute(
+                rows = await (await conn.execute(
                     """
                     SELECT username, role
                     FROM project_members
@@ -467,54 +956,75 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     ORDER BY role DESC, username
                     """,
                     (project_id,)
-                ).fetchall()
+                )).fetchall()
             members = [geo_pb2.ProjectMember(username=r['username'], role=r['role']) for r in rows]
             return geo_pb2.ListProjectMembersResponse(members=members, error='')
         except Exception as e:
             return geo_pb2.ListProjectMembersResponse(error=str(e))
 
-    def PromoteProjectOwner(self, request, context):
+    @rpc_class('acl')
+    async def PromoteProjectOwner(self, request, context):
         project_id = (request.project_id or '').strip()
         new_owner = (request.new_owner or '').strip()
         requester = (request.requester or '').strip()
         if not project_id or not new_owner or not requester:
             return geo_pb2.ProjectMemberResponse(success=False, error="project_id, new_owner, requester required")
         try:
-            with get_pool().connection() as conn:
-                role_row = conn.execute(
+            async with get_pool().connection() as conn:
+                role_row = await (await conn.execute(
                     """
                     SELECT role FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, requester)
-                ).fetchone()
+                )).fetchone()
                 if not role_row or role_row['role'] != 'owner':
                     return geo_pb2.ProjectMemberResponse(success=False, error="only owner can transfer ownership")
-                target = conn.execute(
+                target = await (await conn.execute(
                     """
                     SELECT role FROM project_members
                     WHERE project_id = %s::uuid AND username = %s
                     """,
                     (project_id, new_owner)
-                ).fetchone()
+                )).fetchone()
                 if not target:
                     return geo_pb2.ProjectMemberResponse(success=False, error="new owner must be a member")
-                conn.execute(
+                await conn.execute(
                     "UPDATE project_members SET role = 'admin' WHERE project_id = %s::uuid AND role = 'owner'",
                     (project_id,)
                 )
-                conn.execute(
+                await conn.execute(
                     "UPDATE project_members SET role = 'owner' WHERE project_id = %s::uuid AND username = %s",
                     (project_id, new_owner)
                 )
-                conn.commit()
+                await notify_project_change(conn, project_id, [requester, new_owner])
+                await conn.commit()
             return geo_pb2.ProjectMemberResponse(success=True, error='')
         except Exception as e:
             return geo_pb2.ProjectMemberResponse(success=False, error=str(e))
 
-    def EnrichPolygon(self, request, context):
+    async def WatchProjectChanges(self, request, context):
+        """Stream committed project/membership changes until the caller disconnects.
+
+        Listens on a dedicated connection (not from the pool), so changes made through
+        any geo replica reach every subscribed backend worker. A disconnect cancels
+        the handler, which ends the notifies() wait and closes the connection.
+        """
+        async with await psycopg.AsyncConnection.connect(settings.geo_db_url, autocommit=True) as conn:
+            await conn.execute(f"LISTEN {PROJECT_CHANGES_CHANNEL}")
+            async for notify in conn.notifies():
+                change = json.loads(notify.payload)
+                yield geo_pb2.ProjectChange(project_id=change['project_id'], usernames=change['usernames'])
+
+    @rpc_class('enrich')
+    async def EnrichPolygon(self, request, context):
         """Enrich a polygon with OSM data and custom POIs blended together"""
-        coords = [(coord.lng, coord.lat) for coord in request.coordinates]
+        try:
+            coords = self._request_coords(request)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return geo_pb2.EnrichmentResponse()
         project_id = request.project_id
 
         if len(coords) < 3:
@@ -530,45 +1040,43 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         # Determine which sources to query (empty = all)
         enabled = set(request.sources)
 
-        # Query OSM via Overpass
-        osm_businesses = []
-        error = None
-        if not enabled or 'osm' in enabled:
-            osm_businesses, error = self._get_businesses_from_overpass(coords)
-
-        # Query custom POIs from PostGIS
-        custom_businesses = []
-        if not enabled or 'custom' in enabled:
+        async def guarded(label: str, query, default):
             try:
-                custom_businesses = self._get_custom_pois_in_polygon(coords, project_id)
+                return await query
             except Exception as e:
-                print(f"PostGIS query error (POIs): {e}")
+                print(f"{label} error: {e}")
+                return default
 
-        # Query custom areas that intersect the polygon (always — used for nearby_features)
-        try:
-            area_names = self._get_intersecting_area_names(coords, project_id)
-        except Exception as e:
-            print(f"PostGIS query error (areas): {e}")
-            area_names = []
-
-        # Query additional PostGIS sources
-        additional_businesses = []
-        for db in settings.additional_dbs:
-            if not enabled or db.name in enabled:
-                try:
-                    additional_businesses += self._get_additional_db_pois_in_polygon(db, coords)
-                except Exception as e:
-                    print(f"Additional DB '{db.name}' query error: {e}")
-
-        # Query uploaded sources (stored in PostGIS)
-        uploaded_businesses = []
-        try:
-            if not enabled:
-                uploaded_businesses = self._get_uploaded_pois_in_polygon(coords, project_id)
-            else:
-                uploaded_businesses = self._get_uploaded_pois_in_polygon(coords, project_id, list(enabled))
-        except Exception as e:
-            print(f"Uploaded source query error: {e}")
+        async def no_businesses():
+            return [], None
+
+        async def nothing():
+            return []
+
+        additional_dbs = [db for db in settings.additional_dbs if not enabled or db.name in enabled]
+
+        # Overpass and every PostGIS source run concurrently; each DB query holds
+        # its own pool connection only while it runs
+        (osm_businesses, error), custom_businesses, area_names, uploaded_businesses, *additional = await asyncio.gather(
+            # Query OSM via Overpass
+            self._get_businesses_from_overpass(coords) if not enabled or 'osm' in enabled else no_businesses(),
+            # Query custom POIs from PostGIS
+            guarded("PostGIS query (POIs)", self._get_custom_pois_in_polygon(coords, project_id), [])
+            if not enabled or 'custom' in enabled else nothing(),
+            # Query custom areas that intersect the polygon (always — used for nearby_features)
+            guarded("PostGIS query (areas)", self._get_intersecting_area_names(coords, project_id), []),
+            # Query uploaded sources (stored in PostGIS)
+            guarded("Uploaded source query", self._get_uploaded_pois_in_polygon(
+                coords, project_id, list(enabled) if enabled else None
+            ), []),
+            # Query additional PostGIS sources
+            *(
+                guarded(f"Additional DB '{db.name}' query", self._get_additional_db_pois_in_polygon(db, coords), [])
+                for db in additional_dbs
+            )
+        )
+        await check_deadline(context, "after querying sources")
+        additional_businesses = [b for businesses in additional for b in businesses]
 
         # Blend: custom first, then additional sources, uploaded, then OSM
         all_businesses = custom_businesses + additional_businesses + uploaded_businesses + osm_businesses
@@ -578,22 +1086,28 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         else:
             print(f"Enriched polygon: {area_km2:.2f} km², pop: {estimated_population}, {len(osm_businesses)} OSM + {len(custom_businesses)} custom")
 
+        if request.columnar_response:
+            result = {'business_columns': self._business_columns(all_businesses)}
+        else:
+            result = {'businesses': [geo_pb2.Business(**b) for b in all_businesses]}
+
         return geo_pb2.EnrichmentResponse(
             area_km2=area_km2,
             estimated_population=estimated_population,
             region_type=region_type,
             nearby_features=area_names,
-            businesses=all_businesses,
-            error=error or ""
+            error=error or "",
+            **result
         )
 
-    def AddCustomPOI(self, request, context):
+    @rpc_class('crud')
+    async def AddCustomPOI(self, request, context):
         logger.debug(f"[GEO AddCustomPOI] name={request.name!r} category={request.category!r} lat={request.lat} lng={request.lng}")
         try:
             logger.debug("[GEO AddCustomPOI] acquiring DB connection")
-            with get_pool().connection() as conn:
+            async with get_pool().connection() as conn:
                 logger.debug("[GEO AddCustomPOI] executing INSERT")
-                row = conn.execute("""
+                row = await (await conn.execute("""
                     INSERT INTO custom_pois (name, category, description, phone, website, location, tags, project_id)
                     VALUES (%s, %s, %s, %s, %s, ST_SetSRID(ST_MakePoint(%s, %s), 4326), %s::jsonb, %s::uuid)
                     RETURNING id::text, name, category, description, phone, website,
@@ -608,8 +1122,8 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     request.lng, request.lat,
                     request.tags_json or '{}',
                     request.project_id
-                )).fetchone()
-                conn.commit()
+                ))).fetchone()
+                await conn.commit()
             logger.debug(f"[GEO AddCustomPOI] inserted row: {row}")
             return geo_pb2.CustomPOIResponse(
                 id=row['id'],
@@ -627,31 +1141,33 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
             logger.error(f"[GEO AddCustomPOI] exception: {e}", exc_info=True)
             return geo_pb2.CustomPOIResponse(error=str(e))
 
-    def DeleteCustomPOI(self, request, context):
+    @rpc_class('crud')
+    async def DeleteCustomPOI(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                result = conn.execute(
+            async with get_pool().connection() as conn:
+                result = await conn.execute(
                     "DELETE FROM custom_pois WHERE id = %s::uuid AND project_id = %s::uuid",
                     (request.id, request.project_id)
                 )
-                conn.commit()
+                await conn.commit()
                 if result.rowcount == 0:
                     return geo_pb2.DeleteResponse(success=False, error='POI not found')
             return geo_pb2.DeleteResponse(success=True, error='')
         except Exception as e:
             return geo_pb2.DeleteResponse(success=False, error=str(e))
 
-    def UpdateCustomPOI(self, request, context):
+    @rpc_class('crud')
+    async def UpdateCustomPOI(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                row = conn.execute("""
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute("""
                     UPDATE custom_pois SET name = %s, category = %s, description = %s, phone = %s, website = %s
                     WHERE id = %s::uuid AND project_id = %s::uuid
                     RETURNING id::text, name, category, description, phone, website,
                               ST_Y(location) AS lat, ST_X(location) AS lng,
                               tags::text AS tags_json
-                """, (request.name, request.category, request.description or '', request.phone or '', request.website or '', request.id, request.project_id)).fetchone()
-                conn.commit()
+                """, (request.name, request.category, request.description or '', request.phone or '', request.website or '', request.id, request.project_id))).fetchone()
+                await conn.commit()
                 if not row:
                     return geo_pb2.CustomPOIResponse(error='POI not found')
             return geo_pb2.CustomPOIResponse(
@@ -669,29 +1185,30 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         except Exception as e:
             return geo_pb2.CustomPOIResponse(error=str(e))
 
-    def ListCustomPOIs(self, request, context):
+    @rpc_class('crud')
+    async def ListCustomPOIs(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                # If bounding box provided, filter by it
-                if request.min_lat or request.max_lat:
-                    rows = conn.execute("""
-                        SELECT id::text, name, category, description, phone, website,
-                               ST_Y(location) AS lat, ST_X(location) AS lng,
-                               tags::text AS tags_json
-                        FROM custom_pois
-                        WHERE project_id = %s::uuid
-                          AND ST_Within(location, ST_MakeEnvelope(%s, %s, %s, %s, 4326))
-                        ORDER BY created_at DESC
-                    """, (request.project_id, request.min_lng, request.min_lat, request.max_lng, request.max_lat)).fetchall()
-                else:
-                    rows = conn.execute("""
-                        SELECT id::text, name, category, description, phone, website,
-                               ST_Y(location) AS lat, ST_X(location) AS lng,
-                               tags::text AS tags_json
-                        FROM custom_pois
-                        WHERE project_id = %s::uuid
-                        ORDER BY created_at DESC
-                    """, (request.project_id,)).fetchall()
+            limit, cursor = self._page_params(request)
+            conditions = ["project_id = %s::uuid"]
+            params = [request.project_id]
+            # If bounding box provided, filter by it
+            if request.min_lat or request.max_lat:
+                conditions.append("ST_Within(location, ST_MakeEnvelope(%s, %s, %s, %s, 4326))")
+                params += [request.min_lng, request.min_lat, request.max_lng, request.max_lat]
+            if cursor:
+                conditions.append("(created_at, id) < (%s::timestamptz, %s::uuid)")
+                params += cursor
+            async with get_pool().connection() as conn:
+                rows = await (await conn.execute(f"""
+                    SELECT id::text, name, category, description, phone, website,
+                           ST_Y(location) AS lat, ST_X(location) AS lng,
+                           tags::text AS tags_json, created_at
+                    FROM custom_pois
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                """, (*params, limit + 1))).fetchall()
+            rows, next_page_token = self._next_page(rows, limit)
             pois = [
                 geo_pb2.CustomPOIResponse(
                     id=r['id'], name=r['name'], category=r['category'],
@@ -700,11 +1217,12 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                 )
                 for r in rows
             ]
-            return geo_pb2.ListCustomPOIsResponse(pois=pois, error='')
+            return geo_pb2.ListCustomPOIsResponse(pois=pois, error='', next_page_token=next_page_token)
         except Exception as e:
             return geo_pb2.ListCustomPOIsResponse(error=str(e))
 
-    def AddCustomArea(self, request, context):
+    @rpc_class('crud')
+    async def AddCustomArea(self, request, context):
         try:
             # Build WKT polygon from coordinates
             coords = [(c.lng, c.lat) for c in request.coordinates]
@@ -713,8 +1231,8 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                 coords.append(coords[0])
             polygon_wkt = self._coords_to_polygon_wkt(coords)
 
-            with get_pool().connection() as conn:
-                row = conn.execute("""
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute("""
                     INSERT INTO custom_areas (name, description, geom, metadata, project_id)
                     VALUES (%s, %s, ST_GeomFromText(%s, 4326), %s::jsonb, %s::uuid)
                     RETURNING id::text, name, description, metadata::text AS metadata_json,
@@ -725,8 +1243,9 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                     polygon_wkt,
                     request.metadata_json or '{}',
                     request.project_id
-                )).fetchone()
-                conn.commit()
+                ))).fetchone()
+                await sync_custom_area_parts(conn, row['id'])
+                await conn.commit()
 
             # Parse coordinates back from WKT for response
             resp_coords = self._wkt_to_coords(row['geom_wkt'])
@@ -741,16 +1260,20 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         except Exception as e:
             return geo_pb2.CustomAreaResponse(error=str(e))
 
-    def UpdateCustomArea(self, request, context):
+    @rpc_class('crud')
+    async def UpdateCustomArea(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                row = conn.execute("""
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute("""
                     UPDATE custom_areas SET name = %s, description = %s
                     WHERE id = %s::uuid AND project_id = %s::uuid
                     RETURNING id::text, name, description, metadata::text AS metadata_json,
                               ST_AsText(geom) AS geom_wkt
-                """, (request.name, request.description, request.id, request.project_id)).fetchone()
-                conn.commit()
+                """, (request.name, request.description, request.id, request.project_id))).fetchone()
+                if row:
+                    # Geometry is immutable here; this only backfills parts if they are missing
+                    await sync_custom_area_parts(conn, row['id'])
+                await conn.commit()
                 if not row:
                     return geo_pb2.CustomAreaResponse(error='Area not found')
             return geo_pb2.CustomAreaResponse(
@@ -764,84 +1287,93 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         except Exception as e:
             return geo_pb2.CustomAreaResponse(error=str(e))
 
-    def DeleteCustomArea(self, request, context):
+    @rpc_class('crud')
+    async def DeleteCustomArea(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                result = conn.execute(
+            async with get_pool().connection() as conn:
+                result = await conn.execute(
                     "DELETE FROM custom_areas WHERE id = %s::uuid AND project_id = %s::uuid",
                     (request.id, request.project_id)
                 )
-                conn.commit()
+                await conn.commit()
                 if result.rowcount == 0:
                     return geo_pb2.DeleteResponse(success=False, error='Area not found')
             return geo_pb2.DeleteResponse(success=True, error='')
         except Exception as e:
             return geo_pb2.DeleteResponse(success=False, error=str(e))
 
-    def ListCustomAreas(self, request, context):
+    @rpc_class('crud')
+    async def ListCustomAreas(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                rows = conn.execute("""
+            limit, cursor = self._page_params(request)
+            geom_expr, geom_params = self._simplified_geom(request)
+            geom_fn = "ST_AsBinary" if request.packed_response else "ST_AsText"
+            conditions = ["project_id = %s::uuid"]
+            params = [request.project_id]
+            if cursor:
+                conditions.append("(created_at, id) < (%s::timestamptz, %s::uuid)")
+                params += cursor
+            async with get_pool().connection() as conn:
+                rows = await (await conn.execute(f"""
                     SELECT id::text, name, description,
                            metadata::text AS metadata_json,
-                           ST_AsText(geom) AS geom_wkt
+                           {geom_fn}({geom_expr}) AS geom, created_at
                     FROM custom_areas
-                    WHERE project_id = %s::uuid
-                    ORDER BY created_at DESC
-                """, (request.project_id,)).fetchall()
-            areas = [
-                geo_pb2.CustomAreaResponse(
-                    id=r['id'],
-                    name=r['name'],
-                    description=r['description'],
-                    coordinates=self._wkt_to_coords(r['geom_wkt']),
-                    metadata_json=r['metadata_json']
-                )
-                for r in rows
-            ]
-            return geo_pb2.ListCustomAreasResponse(areas=areas, error='')
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                """, (*geom_params, *params, limit + 1))).fetchall()
+            rows, next_page_token = self._next_page(rows, limit)
+            areas = self._area_responses(rows, request.packed_response)
+            return geo_pb2.ListCustomAreasResponse(areas=areas, error='', next_page_token=next_page_token)
         except Exception as e:
             return geo_pb2.ListCustomAreasResponse(error=str(e))
 
-    def ListIntersectingAreas(self, request, context):
+    @rpc_class('crud')
+    async def ListIntersectingAreas(self, request, context):
         try:
-            coords = [(c.lng, c.lat) for c in request.coordinates]
+            coords = self._request_coords(request)
             if len(coords) < 3:
                 return geo_pb2.ListCustomAreasResponse(areas=[], error='')
             polygon_wkt = self._coords_to_polygon_wkt(coords)
-            with get_pool().connection() as conn:
-                rows = conn.execute("""
+            limit, cursor = self._page_params(request)
+            # Match against the subdivided parts; IN collapses multiple hits per area
+            conditions = ["project_id = %s::uuid", """id IN (
+                SELECT area_id FROM custom_area_parts
+                WHERE project_id = %s::uuid AND ST_Intersects(geom, ST_GeomFromText(%s, 4326))
+            )"""]
+            params = [request.project_id, request.project_id, polygon_wkt]
+            if cursor:
+                conditions.append("(created_at, id) < (%s::timestamptz, %s::uuid)")
+                params += cursor
+            geom_expr, geom_params = self._simplified_geom(request)
+            geom_fn = "ST_AsBinary" if request.packed_response else "ST_AsText"
+            async with get_pool().connection() as conn:
+                rows = await (await conn.execute(f"""
                     SELECT id::text, name, description,
                            metadata::text AS metadata_json,
-                           ST_AsText(geom) AS geom_wkt
+                           {geom_fn}({geom_expr}) AS geom, created_at
                     FROM custom_areas
-                    WHERE project_id = %s::uuid
-                      AND ST_Intersects(geom, ST_GeomFromText(%s, 4326))
-                    ORDER BY created_at DESC
-                """, (request.project_id, polygon_wkt)).fetchall()
-            areas = [
-                geo_pb2.CustomAreaResponse(
-                    id=r['id'],
-                    name=r['name'],
-                    description=r['description'],
-                    coordinates=self._wkt_to_coords(r['geom_wkt']),
-                    metadata_json=r['metadata_json']
-                )
-                for r in rows
-            ]
-            return geo_pb2.ListCustomAreasResponse(areas=areas, error='')
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                """, (*geom_params, *params, limit + 1))).fetchall()
+            rows, next_page_token = self._next_page(rows, limit)
+            areas = self._area_responses(rows, request.packed_response)
+            return geo_pb2.ListCustomAreasResponse(areas=areas, error='', next_page_token=next_page_token)
         except Exception as e:
             return geo_pb2.ListCustomAreasResponse(error=str(e))
 
-    def AddRoute(self, request, context):
+    @rpc_class('crud')
+    async def AddRoute(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                row = conn.execute("""
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute("""
                     INSERT INTO saved_routes (name, route_type, stops)
                     VALUES (%s, %s, %s::jsonb)
                     RETURNING id::text, name, route_type, stops::text AS stops_json, created_at::text
-                """, (request.name, request.route_type, request.stops_json)).fetchone()
-                conn.commit()
+                """, (request.name, request.route_type, request.stops_json))).fetchone()
+                await conn.commit()
             return geo_pb2.RouteResponse(
                 id=row['id'], name=row['name'], route_type=row['route_type'],
                 stops_json=row['stops_json'], created_at=row['created_at']
@@ -849,32 +1381,42 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         except Exception as e:
             return geo_pb2.RouteResponse(error=str(e))
 
-    def ListRoutes(self, request, context):
+    @rpc_class('crud')
+    async def ListRoutes(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                rows = conn.execute("""
-                    SELECT id::text, name, route_type, stops::text AS stops_json, created_at::text
-                    FROM saved_routes ORDER BY created_at DESC
-                """).fetchall()
+            limit, cursor = self._page_params(request)
+            where = "WHERE (created_at, id) < (%s::timestamptz, %s::uuid)" if cursor else ""
+            async with get_pool().connection() as conn:
+                rows = await (await conn.execute(f"""
+                    SELECT id::text, name, route_type, stops::text AS stops_json,
+                           created_at::text, created_at AS created_ts
+                    FROM saved_routes
+                    {where}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                """, (*(cursor or ()), limit + 1))).fetchall()
+            rows, next_page_token = self._next_page(rows, limit, key='created_ts')
             return geo_pb2.ListRoutesResponse(routes=[
                 geo_pb2.RouteResponse(
                     id=r['id'], name=r['name'], route_type=r['route_type'],
                     stops_json=r['stops_json'], created_at=r['created_at']
                 ) for r in rows
-            ])
+            ], next_page_token=next_page_token)
         except Exception as e:
             return geo_pb2.ListRoutesResponse(error=str(e))
 
-    def DeleteRoute(self, request, context):
+    @rpc_class('crud')
+    async def DeleteRoute(self, request, context):
         try:
-            with get_pool().connection() as conn:
-                conn.execute("DELETE FROM saved_routes WHERE id = %s::uuid", (request.id,))
-                conn.commit()
+            async with get_pool().connection() as conn:
+                await conn.execute("DELETE FROM saved_routes WHERE id = %s::uuid", (request.id,))
+                await conn.commit()
             return geo_pb2.DeleteResponse(success=True)
         except Exception as e:
             return geo_pb2.DeleteResponse(success=False, error=str(e))
 
-    def UploadSource(self, request, context):
+    @rpc_class('upload')
+    async def UploadSource(self, request, context):
         """Upload a GeoJSON datasource (stored in PostGIS)"""
         # TODO: check authentication when auth is implemented
         try:
@@ -885,126 +1427,378 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
             features = data.get('features', [])
             # Validate required fields
             for i, f in enumerate(features):
-                if f.get('geometry', {}).get('type') != 'Point':
-                    return geo_pb2.UploadSourceResponse(error=f'Feature {i}: only Point geometries supported')
+                if (f.get('geometry') or {}).get('type') not in UPLOAD_GEOMETRY_TYPES:
+                    return geo_pb2.UploadSourceResponse(
+                        error=f'Feature {i}: unsupported geometry (expected {", ".join(UPLOAD_GEOMETRY_TYPES)})'
+                    )
                 if 'name' not in f.get('properties', {}):
                     return geo_pb2.UploadSourceResponse(error=f'Feature {i}: missing required "name" property')
 
-            with get_pool().connection() as conn:
-                row = conn.execute("""
-                    INSERT INTO uploaded_sources (name, project_id)
-                    VALUES (%s, %s::uuid)
-                    ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
-                    RETURNING id::text
-                """, (request.name, request.project_id)).fetchone()
-                source_id = row['id']
+            rows = []
+            for i, f in enumerate(features):
+                props = f.get('properties', {}) or {}
+                if f['geometry']['type'] == 'Point':
+                    coords_arr = f['geometry']['coordinates']
+                    lng, lat, wkb = float(coords_arr[0]), float(coords_arr[1]), None
+                else:
+                    geom = shape(f['geometry'])
+                    if not geom.is_valid:
+                        raise ValueError(f'Feature {i}: invalid {geom.geom_type}')
+                    anchor = geom.representative_point()
+                    lng, lat, wkb = anchor.x, anchor.y, geom.wkb
+                rows.append((
+                    str(props.get('name') or 'Unnamed'),
+                    str(props.get('category') or ''),
+                    str(props.get('description') or ''),
+                    str(props.get('phone') or ''),
+                    str(props.get('website') or ''),
+                    str(props.get('email') or ''),
+                    lng,
+                    lat,
+                    json.dumps(props),
+                    wkb
+                ))
 
-                conn.execute("DELETE FROM uploaded_pois WHERE source_id = %s::uuid", (source_id,))
+            async def batches():
+                yield rows
 
-                insert_rows = []
-                for f in features:
-                    props = f.get('properties', {}) or {}
-                    coords_arr = f['geometry']['coordinates']
-                    insert_rows.append((
-                        source_id,
-                        props.get('name', 'Unnamed'),
-                        props.get('category', ''),
-                        props.get('description', ''),
-                        props.get('phone', ''),
-                        props.get('website', ''),
-                        props.get('email', ''),
-                        coords_arr[0],
-                        coords_arr[1],
-                        json.dumps(props)
-                    ))
-
-                if insert_rows:
-                    with conn.cursor() as cur:
-                        cur.executemany("""
-                            INSERT INTO uploaded_pois (
-                                source_id, name, category, description, phone, website, email,
-                                location, properties, project_id
-                            )
-                            VALUES (
-                                %s::uuid, %s, %s, %s, %s, %s, %s,
-                                ST_SetSRID(ST_MakePoint(%s, %s), 4326), %s::jsonb, %s::uuid
-                            )
-                        """, [(*r, request.project_id) for r in insert_rows])
-
-                conn.commit()
-
-            logger.debug(f"[UploadSource] {request.name}: {len(features)} features (db)")
+            job_id = str(uuid.uuid4())
+            counts = await self._ingest_upload(
+                request.name, request.project_id, job_id, batches(), request.id_property
+            )
+
+            logger.debug(f"[UploadSource] {request.name}: {counts}")
             return geo_pb2.UploadSourceResponse(
                 name=request.name,
-                feature_count=len(features),
-                error=''
+                error='',
+                job_id=job_id,
+                **counts
             )
         except json.JSONDecodeError as e:
             return geo_pb2.UploadSourceResponse(error=f'Invalid JSON: {e}')
+        except ValueError as e:
+            return geo_pb2.UploadSourceResponse(error=str(e))
         except Exception as e:
             logger.error(f"[UploadSource] error: {e}", exc_info=True)
             return geo_pb2.UploadSourceResponse(error=str(e))
 
-    def ListUploadedSources(self, request, context):
+    @rpc_class('upload')
+    async def UploadSourceStream(self, request_iterator, context):
+        """Ingest a client-streamed datasource chunk by chunk (stored in PostGIS)"""
+        # TODO: check authentication when auth is implemented
+        first = await anext(request_iterator, None)
+        if first is None or not first.name:
+            return geo_pb2.UploadSourceResponse(error='first chunk must carry the datasource name')
+        name, project_id = first.name, first.project_id
+        job_id = first.job_id or str(uuid.uuid4())
+
+        async def batches():
+            chunk = first
+            while chunk is not None:
+                yield [
+                    (f.name, f.category, f.description, f.phone, f.website, f.email,
+                     f.lng, f.lat, f.properties_json or '{}', f.geometry_wkb or None)
+                    for f in chunk.features
+                ]
+                chunk = await anext(request_iterator, None)
+
+        try:
+            counts = await self._ingest_upload(name, project_id, job_id, batches(), first.id_property)
+            logger.debug(f"[UploadSourceStream] {name}: {counts} (job {job_id})")
+            return geo_pb2.UploadSourceResponse(name=name, error='', job_id=job_id, **counts)
+        except ValueError as e:
+            return geo_pb2.UploadSourceResponse(name=name, error=str(e), job_id=job_id)
+        except Exception as e:
+            logger.error(f"[UploadSourceStream] error: {e}", exc_info=True)
+            return geo_pb2.UploadSourceResponse(name=name, error=str(e), job_id=job_id)
+
+    @rpc_class('crud')
+    async def GetUploadJob(self, request, context):
+        """Report progress of a (possibly still running) upload job"""
+        try:
+            async with get_pool().connection() as conn:
+                row = await (await conn.execute("""
+                    SELECT id::text, source_name, status, features_received, feature_count, error
+                    FROM upload_jobs
+                    WHERE id = %s::uuid AND project_id = %s::uuid
+                """, (request.job_id, request.project_id))).fetchone()
+            if not row:
+                return geo_pb2.UploadJob(job_id=request.job_id, error='Upload job not found')
+            return geo_pb2.UploadJob(
+                job_id=row['id'],
+                source_name=row['source_name'],
+                status=row['status'],
+                features_received=row['features_received'],
+                feature_count=row['feature_count'],
+                error=row['error']
+            )
+        except Exception as e:
+            return geo_pb2.UploadJob(job_id=request.job_id, error=str(e))
+
+    @rpc_class('crud')
+    async def ListUploadedSources(self, request, context):
         """List all uploaded datasources"""
         # TODO: check authentication when auth is implemented
         if not request.project_id:
             return geo_pb2.ListUploadedSourcesResponse(sources=[])
-        with get_pool().connection() as conn:
-            rows = conn.execute("""
-                SELECT s.name, COUNT(p.id) AS feature_count
-                FROM uploaded_sources s
-                LEFT JOIN uploaded_pois p ON p.source_id = s.id
-                WHERE s.project_id = %s::uuid
-                GROUP BY s.name
-                ORDER BY s.name
-            """, (request.project_id,)).fetchall()
+        try:
+            limit, cursor = self._page_params(request, key='name')
+            conditions = ["s.project_id = %s::uuid"]
+            params = [request.project_id]
+            if cursor:
+                conditions.append("(s.name, s.id) > (%s, %s::uuid)")
+                params += cursor
+            async with get_pool().connection() as conn:
+                rows = await (await conn.execute(f"""
+                    SELECT s.id::text, s.name, COUNT(p.id) AS feature_count
+                    FROM uploaded_sources s
+                    LEFT JOIN uploaded_pois p ON p.source_id = s.id
+                    WHERE {' AND '.join(conditions)}
+                    GROUP BY s.id
+                    ORDER BY s.name, s.id
+                    LIMIT %s
+                """, (*params, limit + 1))).fetchall()
+            rows, next_page_token = self._next_page(rows, limit, key='name')
+        except Exception as e:
+            return geo_pb2.ListUploadedSourcesResponse(error=str(e))
         sources = [geo_pb2.UploadedSource(name=r['name'], feature_count=r['feature_count']) for r in rows]
-        return geo_pb2.ListUploadedSourcesResponse(sources=sources)
+        return geo_pb2.ListUploadedSourcesResponse(sources=sources, next_page_token=next_page_token)
 
-    def DeleteUploadedSource(self, request, context):
+    @rpc_class('crud')
+    async def DeleteUploadedSource(self, request, context):
         """Delete an uploaded datasource"""
         # TODO: check authentication when auth is implemented
-        with get_pool().connection() as conn:
-            cur = conn.execute("DELETE FROM uploaded_sources WHERE name = %s AND project_id = %s::uuid", (request.name, request.project_id))
-            conn.commit()
+        async with get_pool().connection() as conn:
+            cur = await conn.execute("DELETE FROM uploaded_sources WHERE name = %s AND project_id = %s::uuid", (request.name, request.project_id))
+            await conn.commit()
         if cur.rowcount and cur.rowcount > 0:
             logger.debug(f"[DeleteUploadedSource] deleted {request.name}")
             return geo_pb2.DeleteResponse(success=True, error='')
         return geo_pb2.DeleteResponse(success=False, error='Source not found')
 
-    def _get_custom_pois_in_polygon(self, coords, project_id: str) -> list:
+    async def _ingest_upload(self, name: str, project_id: str, job_id: str, batches,
+                       id_property: str = '') -> dict:
+        """Binary-COPY feature batches into a staging table, then apply the delta to uploaded_pois.
+
+        `batches` is an async iterable of lists of (name, category, description, phone,
+        website, email, lng, lat, properties_json, geometry_wkb) tuples; geometry_wkb is None for Points,
+        otherwise lng/lat is a representative point of the shape. Features are keyed by `id_property` (falling
+        back to settings.upload_id_property) or, without one, by a hash of geometry and
+        properties; only inserted, changed and vanished keys touch uploaded_pois. The delta
+        runs in the same transaction as the COPY, so readers see either the previous
+        dataset or the new one, never a partial upload.
+
+        Returns the counts for UploadSourceResponse.
+        """
+        id_property = id_property or settings.upload_id_property
+        await self._record_upload_job(job_id, project_id, name)
+        received = 0
+        seen: dict[str, int] = {}
+        last_report = time.monotonic()
+        try:
+            async with get_pool().connection() as conn:
+                await conn.execute("""
+                    CREATE TEMP TABLE upload_staging (
+                        name TEXT, category TEXT, description TEXT, phone TEXT,
+                        website TEXT, email TEXT, lng FLOAT8, lat FLOAT8, properties TEXT,
+                        geom_wkb BYTEA, feature_key TEXT, content_hash TEXT
+                    ) ON COMMIT DROP
+                """)
+                async with conn.cursor() as cur:
+                    async with cur.copy("""
+                        COPY upload_staging (
+                            name, category, description, phone, website, email, lng, lat, properties,
+                            geom_wkb, feature_key, content_hash
+                        )
+                        FROM STDIN (FORMAT BINARY)
+                    """) as copy:
+                        copy.set_types(['text'] * 6 + ['float8', 'float8', 'text', 'bytea', 'text', 'text'])
+                        async for batch in batches:
+                            self._validate_upload_batch(batch, received)
+                            for row in batch:
+                                content_hash = hashlib.blake2b(
+                                    '\x1f'.join(map(repr, row)).encode(), digest_size=16
+                                ).hexdigest()
+                                if id_property:
+                                    key = json.loads(row[8]).get(id_property)
+                                    if key is None or key == '':
+                                        raise ValueError(f'Feature {received}: missing id property "{id_property}"')
+                                    key = str(key)
+                                    if key in seen:
+                                        raise ValueError(f'Feature {received}: duplicate {id_property} "{key}"')
+                                    seen[key] = 1
+                                else:
+                                    # Identical features are legal; number repeats so each keeps its own row
+                                    occurrence = seen.get(content_hash, 0)
+                                    seen[content_hash] = occurrence + 1
+                                    key = f'{content_hash}:{occurrence}' if occurrence else content_hash
+                                await copy.write_row((*row, key, content_hash))
+                                received += 1
+                            if time.monotonic() - last_report >= 1.0:
+                                await self._update_upload_job(job_id, features_received=received)
+                                last_report = time.monotonic()
+
+                await self._update_upload_job(job_id, status='swapping', features_received=received)
+                await conn.execute("ANALYZE upload_staging")
+                source_id = (await (await conn.execute("""
+                    INSERT INTO uploaded_sources (name, project_id)
+                    VALUES (%s, %s::uuid)
+                    ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+                    RETURNING id::text
+                """, (name, project_id))).fetchone())['id']
+                # Rows from before keyed uploads have no feature_key and are replaced once
+                deleted = (await conn.execute("""
+                    DELETE FROM uploaded_pois p
+                    WHERE p.source_id = %s::uuid
+                      AND NOT EXISTS (SELECT 1 FROM upload_staging s WHERE s.feature_key = p.feature_key)
+                """, (source_id,))).rowcount
+                updated = (await conn.execute("""
+                    UPDATE uploaded_pois p
+                    SET name = s.name, category = s.category, description = s.description,
+                        phone = s.phone, website = s.website, email = s.email,
+                        location = ST_SetSRID(ST_MakePoint(s.lng, s.lat), 4326),
+                        geom = ST_GeomFromWKB(s.geom_wkb, 4326),
+                        properties = s.properties::jsonb, content_hash = s.content_hash
+                    FROM upload_staging s
+                    WHERE p.source_id = %s::uuid
+                      AND p.feature_key = s.feature_key
+                      AND p.content_hash IS DISTINCT FROM s.content_hash
+                """, (source_id,))).rowcount
+                inserted = (await conn.execute("""
+                    INSERT INTO uploaded_pois (
+                        source_id, name, category, description, phone, website, email,
+                        location, geom, properties, project_id, feature_key, content_hash
+                    )
+                    SELECT %s::uuid, s.name, s.category, s.description, s.phone, s.website, s.email,
+                           ST_SetSRID(ST_MakePoint(s.lng, s.lat), 4326), ST_GeomFromWKB(s.geom_wkb, 4326),
+                           s.properties::jsonb, %s::uuid, s.feature_key, s.content_hash
+                    FROM upload_staging s
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM uploaded_pois p
+                        WHERE p.source_id = %s::uuid AND p.feature_key = s.feature_key
+                    )
+                """, (source_id, project_id, source_id))).rowcount
+                await self._sync_uploaded_poi_parts(conn, source_id)
+                await conn.commit()
+
+            if inserted or updated or deleted:
+                await self._update_upload_job(job_id, status='analyzing', feature_count=received)
+                async with get_pool().connection() as conn:
+                    await conn.execute("ANALYZE uploaded_pois")
+                    await conn.commit()
+            await self._update_upload_job(job_id, status='done', feature_count=received)
+            return {
+                'feature_count': received,
+                'inserted': inserted,
+                'updated': updated,
+                'deleted': deleted,
+                'unchanged': received - inserted - updated,
+            }
+        except Exception as e:
+            await self._update_upload_job(job_id, status='failed', features_received=received, error=str(e))
+            raise
+
+    async def _sync_uploaded_poi_parts(self, conn, source_id: str):
+        """Re-subdivide shapes of a source whose content changed (parts of deleted rows cascade)"""
+        await conn.execute("""
+            DELETE FROM uploaded_poi_parts pp
+            USING uploaded_pois p
+            WHERE pp.poi_id = p.id
+              AND p.source_id = %s::uuid
+              AND pp.content_hash IS DISTINCT FROM p.content_hash
+        """, (source_id,))
+        await conn.execute("""
+            INSERT INTO uploaded_poi_parts (poi_id, source_id, content_hash, geom)
+            SELECT p.id, p.source_id, p.content_hash,
+                   ST_Subdivide(p.geom, %s)
+            FROM uploaded_pois p
+            WHERE p.source_id = %s::uuid
+              AND p.geom IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM uploaded_poi_parts pp WHERE pp.poi_id = p.id)
+        """, (settings.subdivide_max_vertices, source_id))
+
+    def _validate_upload_batch(self, batch: list, offset: int):
+        """Check names and WGS84 coordinates of a batch as whole arrays instead of per feature"""
+        if not batch:
+            return
+        coords = np.array([(row[6], row[7]) for row in batch], dtype=np.float64)
+        lng, lat = coords[:, 0], coords[:, 1]
+        invalid = ~(np.isfinite(lng) & np.isfinite(lat)) | (np.abs(lng) > 180) | (np.abs(lat) > 90)
+        if invalid.any():
+            raise ValueError(f'Feature {offset + int(invalid.argmax())}: coordinates out of WGS84 range')
+        unnamed = np.array([not row[0] for row in batch])
+        if unnamed.any():
+            raise ValueError(f'Feature {offset + int(unnamed.argmax())}: missing required "name" property')
+
+    async def _record_upload_job(self, job_id: str, project_id: str, name: str):
+        """Register an upload job so its progress can be polled via GetUploadJob.
+
+        A client-supplied job id may restart a job of the same project, never take over
+        another project's job.
+        """
+        async with get_pool('crud').connection() as conn:
+            cur = await conn.execute("""
+                INSERT INTO upload_jobs (id, project_id, source_name)
+                VALUES (%s::uuid, %s::uuid, %s)
+                ON CONFLICT (id) DO UPDATE SET
+                    source_name = EXCLUDED.source_name,
+                    status = 'receiving', features_received = 0, feature_count = 0,
+                    error = '', updated_at = now()
+                WHERE upload_jobs.project_id = EXCLUDED.project_id
+            """, (job_id, project_id, name))
+            await conn.commit()
+        if not cur.rowcount:
+            raise ValueError('job_id is already in use')
+
+    async def _update_upload_job(self, job_id: str, **fields):
+        """Persist upload progress on its own connection (the ingest transaction is still open).
+
+        Job rows are written through the crud partition, next to GetUploadJob, so progress
+        updates never wait behind the upload pool's ingest connections.
+        """
+        try:
+            assignments = ", ".join(f"{key} = %s" for key in fields)
+            async with get_pool('crud').connection() as conn:
+                await conn.execute(
+                    f"UPDATE upload_jobs SET {assignments}, updated_at = now() WHERE id = %s::uuid",
+                    (*fields.values(), job_id)
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.warning(f"[upload job {job_id}] progress update failed: {e}")
+
+    async def _get_custom_pois_in_polygon(self, coords, project_id: str) -> list:
         """Query PostGIS for custom POIs within a polygon using ST_Within"""
         polygon_wkt = self._coords_to_polygon_wkt(coords)
 
-        with get_pool().connection() as conn:
-            rows = conn.execute("""
+        async with get_pool().connection() as conn:
+            rows = await (await conn.execute("""
                 SELECT id::text, name, category, description, phone, website,
                        ST_Y(location) AS lat, ST_X(location) AS lng,
                        tags::text AS tags_json
                 FROM custom_pois
                 WHERE project_id = %s::uuid
                   AND ST_Within(location, ST_GeomFromText(%s, 4326))
-            """, (project_id, polygon_wkt)).fetchall()
+            """, (project_id, polygon_wkt))).fetchall()
 
         return [
-            geo_pb2.Business(
-                name=row['name'],
-                lat=row['lat'],
-                lng=row['lng'],
-                type=row['category'],
-                address='',
-                phone=row['phone'],
-                website=row['website'],
-                email='',
-                source='custom',
-                id=row['id'],
-                description=row['description']
-            )
+            {
+                'name': row['name'],
+                'lat': row['lat'],
+                'lng': row['lng'],
+                'type': row['category'],
+                'address': '',
+                'phone': row['phone'],
+                'website': row['website'],
+                'email': '',
+                'source': 'custom',
+                'id': row['id'],
+                'description': row['description']
+            }
             for row in rows
         ]
 
-    def _get_additional_db_pois_in_polygon(self, db, coords) -> list:
+    async def _get_additional_db_pois_in_polygon(self, db, coords) -> list:
         """Query an additional PostGIS source for features within the polygon."""
         pool = _additional_pools.get(db.name)
         if pool is None:
@@ -1029,78 +1823,180 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
             WHERE ST_Within({db.geom_col}, ST_GeomFromText(%s, 4326))
         """
 
-        with pool.connection() as conn:
-            rows = conn.execute(query, (polygon_wkt,)).fetchall()
+        async with DeadlinePool(pool).connection() as conn:
+            rows = await (await conn.execute(query, (polygon_wkt,))).fetchall()
 
         return [
-            geo_pb2.Business(
-                name=row['name'] or 'Unnamed',
-                lat=row['lat'],
-                lng=row['lng'],
-                type=row.get('category') or 'unknown',
-                description=row.get('description') or '',
-                source=db.name,
-                address='', phone='', website='', email='', id=''
-            )
+            {
+                'name': row['name'] or 'Unnamed',
+                'lat': row['lat'],
+                'lng': row['lng'],
+                'type': row.get('category') or 'unknown',
+                'description': row.get('description') or '',
+                'source': db.name,
+                'address': '', 'phone': '', 'website': '', 'email': '', 'id': ''
+            }
             for row in rows
         ]
 
-    def _get_uploaded_pois_in_polygon(self, coords, project_id: str, source_names: list[str] | None = None) -> list:
-        """Query uploaded sources (PostGIS) for features within the polygon."""
-        polygon_wkt = self._coords_to_polygon_wkt(coords)
+    async def _get_uploaded_pois_in_polygon(self, coords, project_id: str, source_names: list[str] | None = None) -> list:
+        """Query uploaded sources (PostGIS) for features within the polygon.
 
-        with get_pool().connection() as conn:
-            if source_names:
-                rows = conn.execute("""
-                    SELECT p.id::text, s.name AS source_name, p.name, p.category, p.description, p.phone, p.website, p.email,
-                           ST_Y(p.location) AS lat, ST_X(p.location) AS lng
-                    FROM uploaded_pois p
-                    JOIN uploaded_sources s ON s.id = p.source_id
-                    WHERE s.project_id = %s::uuid
-                      AND s.name = ANY(%s)
-                      AND ST_Within(p.location, ST_GeomFromText(%s, 4326))
-                """, (project_id, source_names, polygon_wkt)).fetchall()
-            else:
-                rows = conn.execute("""
-                    SELECT p.id::text, s.name AS source_name, p.name, p.category, p.description, p.phone, p.website, p.email,
-                           ST_Y(p.location) AS lat, ST_X(p.location) AS lng
-                    FROM uploaded_pois p
-                    JOIN uploaded_sources s ON s.id = p.source_id
-                    WHERE s.project_id = %s::uuid
-                      AND ST_Within(p.location, ST_GeomFromText(%s, 4326))
-                """, (project_id, polygon_wkt)).fetchall()
+        Points must lie within the polygon; shapes (polygons, lines) count when they
+        intersect it. Shapes are matched through their ST_Subdivide parts, so the GIST
+        index prunes to a few small pieces before any exact test runs.
+        """
+        polygon_wkt = self._coords_to_polygon_wkt(coords)
+        source_filter = "AND s.name = ANY(%(sources)s)" if source_names else ""
+
+        async with get_pool().connection() as conn:
+            rows = await (await conn.execute(f"""
+                WITH area AS (SELECT ST_GeomFromText(%(wkt)s, 4326) AS g),
+                sources AS (
+                    SELECT s.id, s.name
+                    FROM uploaded_sources s
+                    WHERE s.project_id = %(project_id)s::uuid
+                      {source_filter}
+                ),
+                matched AS (
+                    SELECT p.id
+                    FROM uploaded_pois p, area
+                    WHERE p.source_id IN (SELECT id FROM sources)
+                      AND p.geom IS NULL
+                      AND ST_Within(p.location, area.g)
+                    UNION
+                    SELECT pp.poi_id
+                    FROM uploaded_poi_parts pp, area
+                    WHERE pp.source_id IN (SELECT id FROM sources)
+                      AND ST_Intersects(pp.geom, area.g)
+                )
+                SELECT p.id::text, s.name AS source_name, p.name, p.category, p.description, p.phone, p.website, p.email,
+                       ST_Y(p.location) AS lat, ST_X(p.location) AS lng
+                FROM matched m
+                JOIN uploaded_pois p ON p.id = m.id
+                JOIN sources s ON s.id = p.source_id
+            """, {'wkt': polygon_wkt, 'project_id': project_id, 'sources': source_names})).fetchall()
 
         return [
-            geo_pb2.Business(
-                name=row['name'] or 'Unnamed',
-                lat=row['lat'],
-                lng=row['lng'],
-                type=row['category'] or 'unknown',
-                description=row['description'] or '',
-                phone=row['phone'] or '',
-                website=row['website'] or '',
-                email=row['email'] or '',
-                source=row['source_name'],
-                address='',
-                id=row['id']
-            )
+            {
+                'name': row['name'] or 'Unnamed',
+                'lat': row['lat'],
+                'lng': row['lng'],
+                'type': row['category'] or 'unknown',
+                'description': row['description'] or '',
+                'phone': row['phone'] or '',
+                'website': row['website'] or '',
+                'email': row['email'] or '',
+                'source': row['source_name'],
+                'address': '',
+                'id': row['id']
+            }
             for row in rows
         ]
 
-    def _get_intersecting_area_names(self, coords, project_id: str) -> list[str]:
+    async def _get_intersecting_area_names(self, coords, project_id: str) -> list[str]:
         """Query PostGIS for custom areas that intersect the given polygon"""
         polygon_wkt = self._coords_to_polygon_wkt(coords)
 
-        with get_pool().connection() as conn:
-            rows = conn.execute("""
+        async with get_pool().connection() as conn:
+            rows = await (await conn.execute("""
                 SELECT name FROM custom_areas
                 WHERE project_id = %s::uuid
-                  AND ST_Intersects(geom, ST_GeomFromText(%s, 4326))
+                  AND id IN (
+                      SELECT area_id FROM custom_area_parts
+                      WHERE project_id = %s::uuid
+                        AND ST_Intersects(geom, ST_GeomFromText(%s, 4326))
+                  )
                 ORDER BY name
-            """, (project_id, polygon_wkt)).fetchall()
+            """, (project_id, project_id, polygon_wkt))).fetchall()
 
         return [row['name'] for row in rows]
 
+    def _simplified_geom(self, request) -> tuple[str, tuple]:
+        """SQL expression (and params) for custom_areas.geom at the requested tolerance/zoom"""
+        tolerance = request.tolerance
+        if tolerance <= 0 and request.HasField('zoom'):
+            # Degrees covered by one 256px web map tile pixel at this zoom
+            zoom = max(0, min(request.zoom, 24))
+            tolerance = settings.simplify_pixel_tolerance * 360.0 / (256 * 2 ** zoom)
+        if tolerance <= 0:
+            return "geom", ()
+        return "ST_SimplifyPreserveTopology(geom, %s)", (tolerance,)
+
+    def _page_params(self, request, key: str = 'created_at') -> tuple[int, list | None]:
+        """Resolve page_size/page_token into a row limit and a (key, id) cursor"""
+        limit = request.page_size or settings.list_default_page_size
+        limit = max(1, min(limit, settings.list_max_page_size))
+        if not request.page_token:
+            return limit, None
+        try:
+            token = request.page_token
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+            value, row_id = raw.rsplit('|', 1)
+            if key != 'name':
+                datetime.fromisoformat(value)
+            uuid.UUID(row_id)
+        except Exception:
+            raise ValueError('invalid page_token')
+        return limit, [value, row_id]
+
+    def _next_page(self, rows: list, limit: int, key: str = 'created_at') -> tuple[list, str]:
+        """Drop the look-ahead row and encode the cursor of the last returned row"""
+        if len(rows) <= limit:
+            return rows, ''
+        rows = rows[:limit]
+        last = rows[-1]
+        value = last[key] if key == 'name' else last[key].isoformat()
+        raw = f"{value}|{last['id']}"
+        return rows, base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def _request_coords(self, request) -> list:
+        """(lng, lat) ring of a PolygonRequest, preferring packed_coordinates over coordinates"""
+        if request.packed_coordinates:
+            return [tuple(xy) for xy in self._unpack_coords(request.packed_coordinates).tolist()]
+        return [(c.lng, c.lat) for c in request.coordinates]
+
+    def _pack_coords(self, xy: np.ndarray) -> list[int]:
+        """Delta-encode an (n, 2) lng/lat array into fixed-point packed_coordinates"""
+        fixed = np.rint(xy[:, :2] * COORD_PACK_SCALE).astype(np.int64)
+        return np.diff(fixed, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel().tolist()
+
+    def _unpack_coords(self, packed) -> np.ndarray:
+        """Decode packed_coordinates into an (n, 2) lng/lat array"""
+        deltas = np.asarray(packed, dtype=np.int64)
+        if len(deltas) % 2:
+            raise ValueError('packed_coordinates must hold lng/lat pairs')
+        return np.cumsum(deltas.reshape(-1, 2), axis=0) / COORD_PACK_SCALE
+
+    def _business_columns(self, businesses: list[dict]) -> geo_pb2.BusinessColumns:
+        """Pack business dicts into BusinessColumns, dictionary-encoding type and source"""
+        columns = geo_pb2.BusinessColumns()
+        for field in BUSINESS_COLUMNS:
+            getattr(columns, field).extend([b[field] for b in businesses])
+        for field in ('type', 'source'):
+            codes = {}
+            getattr(columns, f'{field}_index').extend([codes.setdefault(b[field], len(codes)) for b in businesses])
+            getattr(columns, f'{field}_values').extend(codes)
+        return columns
+
+    def _area_responses(self, rows: list, packed: bool) -> list:
+        """Build CustomAreaResponses from rows whose `geom` is WKB (packed) or WKT"""
+        if packed:
+            geoms = shapely.from_wkb([bytes(r['geom']) for r in rows])
+            geometry = [{'packed_coordinates': self._pack_coords(shapely.get_coordinates(g))} for g in geoms]
+        else:
+            geometry = [{'coordinates': self._wkt_to_coords(r['geom'])} for r in rows]
+        return [
+            geo_pb2.CustomAreaResponse(
+                id=r['id'],
+                name=r['name'],
+                description=r['description'],
+                metadata_json=r['metadata_json'],
+                **g
+            )
+            for r, g in zip(rows, geometry)
+        ]
+
     def _wkt_to_coords(self, wkt: str) -> list:
         """Parse POLYGON((lng lat, ...)) WKT into Coordinate list"""
         # Extract coordinate string from POLYGON((...))
@@ -1158,12 +2054,10 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
 
         return None
 
-    def _get_businesses_from_overpass(self, coords):
+    async def _get_businesses_from_overpass(self, coords):
         """Query Overpass API for businesses in polygon or circle"""
         circle_params = self._detect_circle(coords)
 
-        polygon = Polygon(coords)
-
         lats = [lat for lng, lat in coords]
         lngs = [lng for lng, lat in coords]
         bbox = f"{min(lats)},{min(lngs)},{max(lats)},{max(lngs)}"
@@ -1180,7 +2074,7 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
             print("Querying Overpass with polygon filter")
 
         query = f"""
-        [out:json][timeout:120];
+        [out:json][timeout:{max(1, int(time_left(120)))}];
         (
           nwr["shop"]{area_filter};
           nwr["office"]{area_filter};
@@ -1210,12 +2104,15 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         """
 
         try:
-            response = httpx.post(
-                settings.overpass_api_url,
-                data={"data": query},
-                timeout=30.0
-            )
+            async with _overpass_slots:
+                response = await get_http_client().post(
+                    settings.overpass_api_url,
+                    data={"data": query},
+                    timeout=time_left(30.0)
+                )
             response.raise_for_status()
+            if deadline_passed():
+                return [], "Deadline exceeded waiting for Overpass"
             data = response.json()
 
             businesses = []
@@ -1230,94 +2127,42 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
                 for a in aerodromes:
                     print(f"    - {a.get('tags', {}).get('name', 'Unnamed')} (id={a.get('id')}, type={a.get('type')})")
 
-            for element in elements:
-                tags = element.get('tags', {})
-                name = tags.get('name', 'Unnamed')
-
-                historic_val = tags.get('historic')
-                if historic_val:
-                    castle_type = tags.get('castle_type')
-                    business_type = f"{historic_val}:{castle_type}" if castle_type else historic_val
-                else:
-                    landuse_val = tags.get('landuse')
-                    landuse_type = None
-                    if landuse_val in ['port', 'industrial', 'military']:
-                        landuse_type = landuse_val
-
-                    business_type = (
-                        tags.get('tourism') or
-                        tags.get('military') or
-                        tags.get('aeroway') or
-                        landuse_type or
-                        tags.get('shop') or
-                        tags.get('amenity') or
-                        tags.get('government') or
-                        tags.get('office') or
-                        tags.get('public_transport') or
-                        tags.get('railway') or
-                        tags.get('power') or
-                        tags.get('man_made') or
-                        tags.get('leisure') or
-                        (tags.get('building') if tags.get('building') in ['government', 'public', 'palace', 'castle'] else None) or
-                        'business'
-                    )
-
-                address = tags.get('addr:street', '')
-                phone = tags.get('phone') or tags.get('contact:phone', '')
-                website = tags.get('website') or tags.get('contact:website', '')
-                email = tags.get('email') or tags.get('contact:email', '')
-
-                if 'lat' in element and 'lon' in element:
-                    lat = element['lat']
-                    lng = element['lon']
-                elif 'center' in element:
-                    lat = element['center']['lat']
-                    lng = element['center']['lon']
-                else:
-                    print(f"  WARNING: No coordinates found for {name}, skipping")
-                    continue
-
-                point = Point(lng, lat)
-                if not polygon.contains(point):
-                    continue
-
-                idx = len(businesses)
-                businesses.append(geo_pb2.Business(
-                    name=name,
-                    lat=lat,
-                    lng=lng,
-                    type=business_type,
-                    address=address,
-                    phone=phone,
-                    website=website,
-                    email=email,
-                    source='osm',
-                    id=''
-                ))
+            lat, lng, (names, types, addresses, phones, websites, emails, wikidata, wikipedia) = \
+                await classify_overpass_elements(elements, coords)
+            for idx, (business_lat, business_lng) in enumerate(zip(lat.tolist(), lng.tolist())):
+                businesses.append({
+                    'name': names[idx],
+                    'lat': business_lat,
+                    'lng': business_lng,
+                    'type': types[idx],
+                    'address': addresses[idx],
+                    'phone': phones[idx],
+                    'website': websites[idx],
+                    'email': emails[idx],
+                    'source': 'osm',
+                    'id': '',
+                    'description': ''
+                })
 
                 # Track wikidata/wikipedia for description enrichment
-                if tags.get('wikidata'):
-                    qid_to_indices.setdefault(tags['wikidata'], []).append(idx)
-                elif tags.get('wikipedia'):
-                    wiki_to_indices.setdefault(tags['wikipedia'], []).append(idx)
-
-                if tags.get('aeroway') == 'aerodrome':
-                    print(f"  ✓ Added aerodrome: {name} (center: {lat}, {lng})")
-                elif any(tag in tags for tag in ['historic', 'tourism']) or tags.get('building') in ['palace', 'castle']:
-                    print(f"  → {name} (type={business_type})")
-
-            # Enrich with Wikidata/Wikipedia descriptions
-            if qid_to_indices:
-                descriptions = self._fetch_wikidata_descriptions(list(qid_to_indices.keys()))
-                for qid, desc in descriptions.items():
-                    for idx in qid_to_indices.get(qid, []):
-                        businesses[idx].description = desc
-
-            if wiki_to_indices:
-                descriptions = self._fetch_wikipedia_summaries(list(wiki_to_indices.keys()))
-                for wiki_key, desc in descriptions.items():
-                    for idx in wiki_to_indices.get(wiki_key, []):
-                        businesses[idx].description = desc
+                if wikidata[idx]:
+                    qid_to_indices.setdefault(wikidata[idx], []).append(idx)
+                elif wikipedia[idx]:
+                    wiki_to_indices.setdefault(wikipedia[idx], []).append(idx)
+
+            # Enrich with Wikidata/Wikipedia descriptions (both APIs queried concurrently);
+            # lookups stop at the deadline and the businesses keep empty descriptions
+            wikidata_descriptions, wikipedia_descriptions = await asyncio.gather(
+                self._fetch_wikidata_descriptions(list(qid_to_indices.keys())),
+                self._fetch_wikipedia_summaries(list(wiki_to_indices.keys()))
+            )
+            for qid, desc in wikidata_descriptions.items():
+                for idx in qid_to_indices.get(qid, []):
+                    businesses[idx]['description'] = desc
+
+            for wiki_key, desc in wikipedia_descriptions.items():
+                for idx in wiki_to_indices.get(wiki_key, []):
+                    businesses[idx]['description'] = desc
 
             return businesses, None
         except httpx.TimeoutException as e:
@@ -1330,25 +2175,28 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
             return [], error_msg
 
 
-    def _fetch_wikidata_descriptions(self, qids: list) -> dict:
+    async def _fetch_wikidata_descriptions(self, qids: list) -> dict:
         """Batch fetch short descriptions from Wikidata for a list of QIDs"""
         if not qids:
             return {}
         results = {}
         try:
             for i in range(0, len(qids), 50):
+                if deadline_passed():
+                    break
                 batch = qids[i:i + 50]
-                resp = httpx.get(
-                    'https://www.wikidata.org/w/api.php',
-                    params={
-                        'action': 'wbgetentities',
-                        'ids': '|'.join(batch),
-                        'props': 'descriptions',
-                        'languages': 'en',
-                        'format': 'json'
-                    },
-                    timeout=10.0
-                )
+                async with _wiki_slots:
+                    resp = await get_http_client().get(
+                        'https://www.wikidata.org/w/api.php',
+                        params={
+                            'action': 'wbgetentities',
+                            'ids': '|'.join(batch),
+                            'props': 'descriptions',
+                            'languages': 'en',
+                            'format': 'json'
+                        },
+                        timeout=time_left(10.0)
+                    )
                 resp.raise_for_status()
                 for qid, entity in resp.json().get('entities', {}).items():
                     desc = entity.get('descriptions', {}).get('en', {}).get('value', '')
@@ -1358,7 +2206,7 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
             print(f"Wikidata API error: {e}")
         return results
 
-    def _fetch_wikipedia_summaries(self, wiki_keys: list) -> dict:
+    async def _fetch_wikipedia_summaries(self, wiki_keys: list) -> dict:
         """Fetch 2-sentence extracts from Wikipedia for 'lang:title' keys"""
         if not wiki_keys:
             return {}
@@ -1374,22 +2222,25 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         for lang, items in by_lang.items():
             try:
                 for i in range(0, len(items), 20):
+                    if deadline_passed():
+                        break
                     batch = items[i:i + 20]
                     title_to_key = {title: key for key, title in batch}
-                    resp = httpx.get(
-                        f'https://{lang}.wikipedia.org/w/api.php',
-                        params={
-                            'action': 'query',
-                            'prop': 'extracts',
-                            'exintro': '1',
-                            'exsentences': '2',
-                            'explaintext': '1',
-                            'titles': '|'.join(title_to_key.keys()),
-                            'format': 'json',
-                            'redirects': '1'
-                        },
-                        timeout=10.0
-                    )
+                    async with _wiki_slots:
+                        resp = await get_http_client().get(
+                            f'https://{lang}.wikipedia.org/w/api.php',
+                            params={
+                                'action': 'query',
+                                'prop': 'extracts',
+                                'exintro': '1',
+                                'exsentences': '2',
+                                'explaintext': '1',
+                                'titles': '|'.join(title_to_key.keys()),
+                                'format': 'json',
+                                'redirects': '1'
+                            },
+                            timeout=time_left(10.0)
+                        )
                     resp.raise_for_status()
                     for page in resp.json().get('query', {}).get('pages', {}).values():
                         title = page.get('title', '')
@@ -1401,19 +2252,188 @@ class GeoDataServicer(geo_pb2_grpc.GeoDataServiceServicer):
         return results
 
 
-def serve():
-    """Start the gRPC server"""
-    init_db()
-    init_additional_pools()
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+async def serve(worker_id: int = 0, ready=None):
+    """Start the gRPC server and serve until SIGTERM/SIGINT, then drain in-flight RPCs.
+
+    Supervised workers (GEO_WORKERS > 1) pass their id and an event set once listening;
+    the supervisor has already created the schema.
+    """
+    global _worker_id
+    _worker_id = worker_id
+    for bulkhead in BULKHEADS.values():
+        await bulkhead.pool.open()
+    if ready is None:
+        await init_db()
+    await init_additional_pools()
+    # RPCs run as coroutines on one event loop; beyond max_concurrent_rpcs new calls
+    # fail fast with RESOURCE_EXHAUSTED instead of queueing behind a thread pool.
+    # Accept the backend's keepalive pings on idle shared channels (default minimum is 5 min).
+    # SO_REUSEPORT lets every worker bind geo_port; the kernel spreads connections.
+    server = grpc.aio.server(
+        options=[
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.min_ping_interval_without_data_ms', 10000),
+            ('grpc.so_reuseport', 1),
+        ],
+        maximum_concurrent_rpcs=settings.max_concurrent_rpcs or None
+    )
     geo_pb2_grpc.add_GeoDataServiceServicer_to_server(
         GeoDataServicer(), server
     )
     server.add_insecure_port(f'[::]:{settings.geo_port}')
-    server.start()
-    print(f"Geo data service listening on port {settings.geo_port}")
-    server.wait_for_termination()
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stopping.set)
+    await server.start()
+    if ready is None:
+        print(f"Geo data service listening on port {settings.geo_port}")
+    else:
+        print(f"Geo worker {worker_id} (pid {os.getpid()}) listening on port {settings.geo_port}")
+        ready.set()
+    try:
+        await stopping.wait()
+        # Stop accepting (new connections go to the other workers), send GOAWAY and
+        # give in-flight RPCs the grace period before cancelling them.
+        await server.stop(settings.worker_shutdown_grace)
+    finally:
+        await get_http_client().aclose()
+        if _overpass_executor is not None:
+            _overpass_executor.shutdown(wait=False, cancel_futures=True)
+        for pool in (*(bulkhead.pool for bulkhead in BULKHEADS.values()), *_additional_pools.values()):
+            await pool.close()
+
+
+def _run_worker(worker_id: int, ready):
+    """Entry point of a supervised worker process."""
+    asyncio.run(serve(worker_id, ready))
+
+
+async def _prepare_schema():
+    """Create tables once in the supervisor, before workers start (avoids racing DDL)."""
+    pool = BULKHEADS['crud'].pool
+    await pool.open()
+    try:
+        await init_db()
+    finally:
+        await pool.close()
+
+
+class Supervisor:
+    """Runs geo workers as separate processes sharing geo_port and keeps them alive.
+
+    Each worker has its own interpreter, event loop, HTTP client and PostGIS pools, so
+    CPU-bound enrichment (Overpass parsing, tag classification, containment tests,
+    protobuf building) scales across cores. Crashed workers are respawned with
+    backoff; SIGHUP replaces the workers one at a time, starting the replacement
+    before draining the old process so the port always has listeners.
+    """
+
+    def __init__(self, workers: int):
+        self.count = workers
+        self.context = multiprocessing.get_context('spawn')
+        self.workers: dict[int, multiprocessing.process.BaseProcess] = {}
+        self.started: dict[int, float] = {}
+        self.failures: collections.Counter = collections.Counter()
+        self.stopping = False
+        self.restart_requested = False
+
+    def spawn(self, worker_id: int):
+        """Start a worker and wait until it listens; returns None if it did not come up."""
+        ready = self.context.Event()
+        process = self.context.Process(
+            target=_run_worker, args=(worker_id, ready), name=f'geo-worker-{worker_id}'
+        )
+        process.start()
+        deadline = time.monotonic() + settings.worker_start_timeout
+        while not ready.wait(0.2):
+            if not process.is_alive() or time.monotonic() > deadline:
+                logger.error(f"Geo worker {worker_id} failed to start (exit code {process.exitcode})")
+                self.stop_worker(process)
+                return None
+        self.started[worker_id] = time.monotonic()
+        return process
+
+    def stop_worker(self, process):
+        """SIGTERM a worker and wait for it to drain; SIGKILL it after the grace period."""
+        if process.is_alive():
+            process.terminate()
+        process.join(settings.worker_shutdown_grace + 5)
+        if process.is_alive():
+            logger.warning(f"{process.name} did not drain in time, killing it")
+            process.kill()
+            process.join()
+
+    def rolling_restart(self):
+        """Replace each worker with a fresh one (e.g. after a deploy or config change)."""
+        for worker_id, old in list(self.workers.items()):
+            if self.stopping:
+                return
+            new = self.spawn(worker_id)
+            if new is None:
+                logger.error("Rolling restart aborted; keeping the remaining old workers")
+                return
+            self.workers[worker_id] = new
+            self.stop_worker(old)
+        print(f"Rolling restart of {self.count} geo workers complete")
+
+    def respawn_exited(self):
+        """Restart workers that died, backing off while they keep crashing on startup."""
+        for worker_id, process in list(self.workers.items()):
+            if process.is_alive() or self.stopping:
+                continue
+            logger.error(f"Geo worker {worker_id} exited with code {process.exitcode}; restarting")
+            if time.monotonic() - self.started.get(worker_id, 0) < 10:
+                self.failures[worker_id] += 1
+                time.sleep(min(2 ** self.failures[worker_id], 30))
+                if self.stopping:
+                    return
+            else:
+                self.failures[worker_id] = 0
+            new = self.spawn(worker_id)
+            if new is not None:
+                self.workers[worker_id] = new
+            else:
+                self.started[worker_id] = time.monotonic()
+
+    def _on_stop(self, signum, frame):
+        self.stopping = True
+
+    def _on_reload(self, signum, frame):
+        self.restart_requested = True
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        asyncio.run(_prepare_schema())
+        for worker_id in range(self.count):
+            process = self.spawn(worker_id)
+            if process is None:
+                raise SystemExit(f"Geo worker {worker_id} failed to start")
+            self.workers[worker_id] = process
+        print(f"Geo data service running {self.count} workers on port {settings.geo_port} (supervisor pid {os.getpid()})")
+        while not self.stopping:
+            if self.restart_requested:
+                self.restart_requested = False
+                self.rolling_restart()
+            self.respawn_exited()
+            time.sleep(0.5)
+        # Drain all workers at once on shutdown
+        for process in self.workers.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self.workers.values():
+            self.stop_worker(process)
+
+
+def main():
+    workers = settings.geo_workers or os.cpu_count() or 1
+    if workers > 1:
+        Supervisor(workers).run()
+    else:
+        asyncio.run(serve())
 
 
 if __name__ == '__main__':
-    serve()
+    main()
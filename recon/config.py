@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     crt_sh_api_url: str = "https://crt.sh/"
     cymru_asn_domain: str = "origin.asn.cymru.com"
     cymru_asn_details_domain: str = "asn.cymru.com"
+    rdap_bootstrap_url: str = "https://rdap.org/"
+    whois_server: str = "whois.iana.org"      # port-43 fallback when RDAP has no answer
+    whois_timeout: float = 10.0
 
     @property
     def user_agent(self) -> str:
@@ -20,7 +23,9 @@ class Settings(BaseSettings):
 
     # Service Configuration
     recon_port: int = 50052
-    max_workers: int = 5
+    max_workers: int = 5                 # domains in flight per RunRecon / RunReconStream call
+    max_concurrent_domains: int = 200    # domains in flight across the whole process
+    max_http_connections: int = 100      # shared HTTP client connection limit
 
     # Rate Limiting
     crt_sh_rate_limit: int = 300
@@ -1,50 +1,71 @@
-from concurrent import futures
+import asyncio
+import contextlib
 import grpc
 import recon_pb2
 import recon_pb2_grpc
 import httpx
+import dns.asyncresolver
 import dns.resolver
-import socket
 import re
 from datetime import datetime
-import threading
-import queue
 from config import settings
 
 
+_http_client: httpx.AsyncClient | None = None
+
+# Domains in flight across all RPCs; each one is a coroutine, not a thread
+_domain_slots = asyncio.Semaphore(settings.max_concurrent_domains)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared HTTP client for crt.sh, RIPEstat, BGPView, PeeringDB, RDAP and header checks"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(limits=httpx.Limits(max_connections=settings.max_http_connections))
+    return _http_client
+
+
 class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
-    def Health(self, request, context):
+    async def Health(self, request, context):
         """Health check endpoint - returns service status without doing any actual recon"""
         return recon_pb2.HealthResponse(
             status="healthy",
             message="Recon service operational"
         )
 
-    def RunRecon(self, request, context):
+    async def RunRecon(self, request, context):
         """Run reconnaissance on provided domains"""
-        results = []
+        # Per-call parallelism, as in RunReconStream; _domain_slots bounds the whole process
+        call_slots = asyncio.Semaphore(max(1, min(settings.max_workers, len(request.domains))))
 
-        for domain in request.domains:
-            print(f"Running recon on: {domain}")
-            result = self._recon_domain(domain)
-            results.append(result)
+        async def run(domain):
+            async with call_slots, _domain_slots:
+                print(f"Running recon on: {domain}")
+                return await self._recon_domain(domain)
 
+        results = await asyncio.gather(*(run(domain) for domain in request.domains))
         return recon_pb2.ReconResponse(results=results)
 
-    def RunReconStream(self, request, context):
+    async def RunReconStream(self, request, context):
         """Run reconnaissance with streaming updates (parallel execution)"""
         total_domains = len(request.domains)
-        update_queue = queue.Queue()
-        completed_count = [0]  # Use list for mutable counter
-        lock = threading.Lock()
-
-        def recon_worker(idx, domain):
-            """Worker function to recon a single domain"""
+        update_queue = asyncio.Queue()
+        completed_count = 0
+        # Per-stream parallelism; _domain_slots bounds the whole process
+        stream_slots = asyncio.Semaphore(max(1, min(settings.max_workers, total_domains)))
+
+        async def recon_worker(idx, domain):
+            """Worker coroutine to recon a single domain"""
+            async with stream_slots, _domain_slots:
+                await recon_domain(idx, domain)
+
+        async def recon_domain(idx, domain):
+            nonlocal completed_count
             silent_mode = request.silent_mode
             mode_label = "SILENT" if silent_mode else "FULL"
 
             # Send start log
-            update_queue.put(recon_pb2.ReconUpdate(
+            update_queue.put_nowait(recon_pb2.ReconUpdate(
                 type=recon_pb2.ReconUpdate.LOG,
                 message=f"[{idx}/{total_domains}] Starting {mode_label} recon on {domain}"
             ))
@@ -55,121 +76,129 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
             try:
                 # DNS Records
-                update_queue.put(recon_pb2.ReconUpdate(
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] → Querying DNS records..."
                 ))
-                domain_recon.dns_records.extend(self._get_dns_records(clean_domain))
-                update_queue.put(recon_pb2.ReconUpdate(
+                domain_recon.dns_records.extend(await self._get_dns_records(clean_domain))
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] ✓ Found {len(domain_recon.dns_records)} DNS records"
                 ))
 
                 # SSL Certificates
-                update_queue.put(recon_pb2.ReconUpdate(
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] → Fetching SSL certificates from crt.sh..."
                 ))
-                domain_recon.ssl_certificates.extend(self._get_ssl_certs(clean_domain))
-                update_queue.put(recon_pb2.ReconUpdate(
+                domain_recon.ssl_certificates.extend(await self._get_ssl_certs(clean_domain))
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] ✓ Found {len(domain_recon.ssl_certificates)} certificates"
                 ))
 
                 # Subdomains
-                update_queue.put(recon_pb2.ReconUpdate(
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] → Enumerating subdomains..."
                 ))
-                domain_recon.subdomains.extend(self._get_subdomains(clean_domain))
-                update_queue.put(recon_pb2.ReconUpdate(
+                domain_recon.subdomains.extend(await self._get_subdomains(clean_domain))
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] ✓ Discovered {len(domain_recon.subdomains)} subdomains"
                 ))
 
                 # Security Headers (SKIP in silent mode - requires HTTP request to target)
                 if not silent_mode:
-                    update_queue.put(recon_pb2.ReconUpdate(
+                    update_queue.put_nowait(recon_pb2.ReconUpdate(
                         type=recon_pb2.ReconUpdate.LOG,
                         message=f"[{clean_domain}] → Checking security headers..."
                     ))
-                    headers = self._get_security_headers(clean_domain)
+                    headers = await self._get_security_headers(clean_domain)
                     if headers:
                         domain_recon.security_headers.CopyFrom(headers)
-                        update_queue.put(recon_pb2.ReconUpdate(
+                        update_queue.put_nowait(recon_pb2.ReconUpdate(
                             type=recon_pb2.ReconUpdate.LOG,
                             message=f"[{clean_domain}] ✓ Analyzed security headers"
                         ))
                 else:
-                    update_queue.put(recon_pb2.ReconUpdate(
+                    update_queue.put_nowait(recon_pb2.ReconUpdate(
                         type=recon_pb2.ReconUpdate.LOG,
                         message=f"[{clean_domain}] ⊘ Skipped security headers (silent mode)"
                     ))
 
                 # WHOIS
-                update_queue.put(recon_pb2.ReconUpdate(
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] → Performing WHOIS lookup..."
                 ))
-                whois_data = self._get_whois(clean_domain)
+                whois_data = await self._get_whois(clean_domain)
                 if whois_data:
                     domain_recon.whois.CopyFrom(whois_data)
-                    update_queue.put(recon_pb2.ReconUpdate(
+                    update_queue.put_nowait(recon_pb2.ReconUpdate(
                         type=recon_pb2.ReconUpdate.LOG,
                         message=f"[{clean_domain}] ✓ Retrieved WHOIS data"
                     ))
 
                 # ASN (passive - only DNS queries)
-                update_queue.put(recon_pb2.ReconUpdate(
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] → Looking up ASN information..."
                 ))
-                asn_info = self._get_asn_info(clean_domain)
+                asn_info = await self._get_asn_info(clean_domain)
                 if asn_info:
                     domain_recon.asn_info.CopyFrom(asn_info)
-                    update_queue.put(recon_pb2.ReconUpdate(
+                    update_queue.put_nowait(recon_pb2.ReconUpdate(
                         type=recon_pb2.ReconUpdate.LOG,
                         message=f"[{clean_domain}] ✓ Found ASN: {asn_info.asn}"
                     ))
 
             except Exception as e:
                 domain_recon.error = str(e)
-                update_queue.put(recon_pb2.ReconUpdate(
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
                     type=recon_pb2.ReconUpdate.LOG,
                     message=f"[{clean_domain}] ✗ Error: {str(e)}"
                 ))
 
             # Send result
-            update_queue.put(recon_pb2.ReconUpdate(
+            update_queue.put_nowait(recon_pb2.ReconUpdate(
                 type=recon_pb2.ReconUpdate.RESULT,
                 message=f"Completed {clean_domain}",
                 result=domain_recon
             ))
 
             # Track completion
-            with lock:
-                completed_count[0] += 1
-                if completed_count[0] == total_domains:
-                    # All domains complete
-                    update_queue.put(recon_pb2.ReconUpdate(
-                        type=recon_pb2.ReconUpdate.COMPLETE,
-                        message=f"Recon complete for {total_domains} domain(s)"
-                    ))
-                    update_queue.put(None)  # Sentinel to stop yielding
+            completed_count += 1
+            if completed_count == total_domains:
+                # All domains complete
+                update_queue.put_nowait(recon_pb2.ReconUpdate(
+                    type=recon_pb2.ReconUpdate.COMPLETE,
+                    message=f"Recon complete for {total_domains} domain(s)"
+                ))
+                update_queue.put_nowait(None)  # Sentinel to stop yielding
 
-        # Start worker threads for each domain
-        with futures.ThreadPoolExecutor(max_workers=min(settings.max_workers, total_domains)) as executor:
-            for idx, domain in enumerate(request.domains, 1):
-                executor.submit(recon_worker, idx, domain)
+        if not total_domains:
+            yield recon_pb2.ReconUpdate(type=recon_pb2.ReconUpdate.COMPLETE, message="Recon complete for 0 domain(s)")
+            return
 
+        # Start a worker task for each domain
+        workers = [
+            asyncio.create_task(recon_worker(idx, domain))
+            for idx, domain in enumerate(request.domains, 1)
+        ]
+        try:
             # Yield updates as they come in from the queue
             while True:
-                update = update_queue.get()
+                update = await update_queue.get()
                 if update is None:  # Sentinel value
                     break
                 yield update
+        finally:
+            # Client went away (or we are done): stop any lookups still running
+            for worker in workers:
+                worker.cancel()
 
-    def _recon_domain(self, domain):
+    async def _recon_domain(self, domain):
         """Perform comprehensive recon on a single domain"""
         # Clean domain (remove http:// https:// www.)
         domain = self._clean_domain(domain)
@@ -178,26 +207,26 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
         try:
             # 1. DNS Records
-            domain_recon.dns_records.extend(self._get_dns_records(domain))
+            domain_recon.dns_records.extend(await self._get_dns_records(domain))
 
             # 2. SSL Certificates from crt.sh
-            domain_recon.ssl_certificates.extend(self._get_ssl_certs(domain))
+            domain_recon.ssl_certificates.extend(await self._get_ssl_certs(domain))
 
             # 3. Subdomains from crt.sh
-            domain_recon.subdomains.extend(self._get_subdomains(domain))
+            domain_recon.subdomains.extend(await self._get_subdomains(domain))
 
             # 4. Security Headers
-            headers = self._get_security_headers(domain)
+            headers = await self._get_security_headers(domain)
             if headers:
                 domain_recon.security_headers.CopyFrom(headers)
 
             # 5. WHOIS data
-            whois_data = self._get_whois(domain)
+            whois_data = await self._get_whois(domain)
             if whois_data:
                 domain_recon.whois.CopyFrom(whois_data)
 
             # 6. ASN Information
-            asn_info = self._get_asn_info(domain)
+            asn_info = await self._get_asn_info(domain)
             if asn_info:
                 domain_recon.asn_info.CopyFrom(asn_info)
 
@@ -215,30 +244,32 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
         domain = domain.split('/')[0]
         return domain
 
-    def _get_dns_records(self, domain):
-        """Get DNS records using dnspython"""
-        records = []
+    async def _get_dns_records(self, domain):
+        """Get DNS records using dnspython (all record types queried concurrently)"""
         record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'SOA']
 
-        for record_type in record_types:
+        async def lookup(record_type):
             try:
-                answers = dns.resolver.resolve(domain, record_type)
-                for rdata in answers:
-                    records.append(recon_pb2.DNSRecord(
+                answers = await dns.asyncresolver.resolve(domain, record_type)
+                return [
+                    recon_pb2.DNSRecord(
                         type=record_type,
                         value=str(rdata),
                         ttl=int(answers.ttl)
-                    ))
+                    )
+                    for rdata in answers
+                ]
             except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, Exception):
-                pass
+                return []
 
-        return records
+        answers = await asyncio.gather(*(lookup(record_type) for record_type in record_types))
+        return [record for records in answers for record in records]
 
-    def _get_ssl_certs(self, domain):
+    async def _get_ssl_certs(self, domain):
         """Get SSL certificates from crt.sh"""
         certs = []
         try:
-            response = httpx.get(
+            response = await get_http_client().get(
                 settings.crt_sh_api_url,
                 params={'q': domain, 'output': 'json'},
                 timeout=10.0,
@@ -269,11 +300,11 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
         return certs
 
-    def _get_subdomains(self, domain):
+    async def _get_subdomains(self, domain):
         """Extract unique subdomains from crt.sh certificates"""
         subdomains = set()
         try:
-            response = httpx.get(
+            response = await get_http_client().get(
                 settings.crt_sh_api_url,
                 params={'q': f'%.{domain}', 'output': 'json'},
                 timeout=10.0,
@@ -293,10 +324,10 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
         return sorted(list(subdomains))[:50]  # Return max 50 subdomains
 
-    def _get_security_headers(self, domain):
+    async def _get_security_headers(self, domain):
         """Check security headers by making HTTP request"""
         try:
-            response = httpx.get(
+            response = await get_http_client().get(
                 f'https://{domain}',
                 timeout=10.0,
                 follow_redirects=True
@@ -316,50 +347,132 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
             print(f"Error fetching security headers for {domain}: {e}")
             return None
 
-    def _get_whois(self, domain):
-        """Get WHOIS data using python-whois library or whois command"""
+    async def _get_whois(self, domain):
+        """Get WHOIS data over RDAP, falling back to a plain port-43 WHOIS query"""
         try:
-            import whois as whois_lib
-            w = whois_lib.whois(domain)
-
-            # Handle both single values and lists
-            registrar = w.registrar if isinstance(w.registrar, str) else (w.registrar[0] if w.registrar else '')
-            creation_date = self._format_date(w.creation_date)
-            expiration_date = self._format_date(w.expiration_date)
-
-            name_servers = w.name_servers if isinstance(w.name_servers, list) else ([w.name_servers] if w.name_servers else [])
-            status = w.status if isinstance(w.status, list) else ([w.status] if w.status else [])
+            w = await self._get_rdap(domain) or await self._get_port43_whois(domain)
+            if not w:
+                return None
 
             return recon_pb2.WhoisData(
-                registrar=registrar,
-                creation_date=creation_date,
-                expiration_date=expiration_date,
-                name_servers=name_servers if name_servers else [],
-                registrant_org=w.org if hasattr(w, 'org') and w.org else '',
-                status=' | '.join(status) if status else ''
+                registrar=w['registrar'],
+                creation_date=self._format_date(w['creation_date']),
+                expiration_date=self._format_date(w['expiration_date']),
+                name_servers=w['name_servers'],
+                registrant_org=w['org'],
+                status=' | '.join(w['status'])
             )
         except Exception as e:
             print(f"Error fetching WHOIS for {domain}: {e}")
             return None
 
+    async def _get_rdap(self, domain):
+        """Registration data from RDAP (JSON over HTTPS), located via the bootstrap redirector"""
+        try:
+            response = await get_http_client().get(
+                f"{settings.rdap_bootstrap_url.rstrip('/')}/domain/{domain}",
+                timeout=10.0,
+                follow_redirects=True,
+                headers={'Accept': 'application/rdap+json', 'User-Agent': settings.user_agent}
+            )
+            if response.status_code != 200:
+                return None
+            data = response.json()
+        except Exception as e:
+            print(f"RDAP lookup failed for {domain}, falling back to WHOIS: {e}")
+            return None
+
+        events = {e.get('eventAction'): e.get('eventDate', '') for e in data.get('events', [])}
+        return {
+            'registrar': self._rdap_entity(data, 'registrar', 'fn'),
+            'creation_date': events.get('registration', ''),
+            'expiration_date': events.get('expiration', ''),
+            'name_servers': [ns['ldhName'].lower() for ns in data.get('nameservers', []) if ns.get('ldhName')],
+            'org': self._rdap_entity(data, 'registrant', 'org') or self._rdap_entity(data, 'registrant', 'fn'),
+            'status': data.get('status', [])
+        }
+
+    def _rdap_entity(self, data, role, field):
+        """First vCard `field` of an RDAP entity with the given role (entities can nest)"""
+        for entity in data.get('entities', []):
+            if role in entity.get('roles', []):
+                vcard = entity.get('vcardArray') or ['vcard', []]
+                for prop in vcard[1]:
+                    if len(prop) > 3 and prop[0] == field and isinstance(prop[3], str) and prop[3]:
+                        return prop[3]
+            found = self._rdap_entity(entity, role, field)
+            if found:
+                return found
+        return ''
+
+    async def _get_port43_whois(self, domain):
+        """Registration data from the registry's WHOIS server, found via the IANA referral"""
+        tld = domain.rsplit('.', 1)[-1]
+        referral = await self._whois_query(settings.whois_server, tld)
+        server = next(
+            (line.split(':', 1)[1].strip() for line in referral.splitlines() if line.lower().startswith(('refer:', 'whois:'))),
+            ''
+        )
+        if not server:
+            return None
+
+        fields = {}
+        for line in (await self._whois_query(server, domain)).splitlines():
+            key, sep, value = line.partition(':')
+            if sep and value.strip():
+                fields.setdefault(key.strip().lower(), []).append(value.strip())
+        if not fields:
+            return None
+
+        def first(*keys):
+            return next((fields[key][0] for key in keys if fields.get(key)), '')
+
+        return {
+            'registrar': first('registrar', 'registrar name'),
+            'creation_date': first('creation date', 'created', 'registered on'),
+            'expiration_date': first('registry expiry date', 'registrar registration expiration date',
+                                     'expiration date', 'expiry date', 'expires'),
+            'name_servers': [ns.split()[0].lower() for ns in fields.get('name server', []) + fields.get('nserver', [])],
+            'org': first('registrant organization', 'registrant organisation', 'org'),
+            'status': [status.split()[0] for status in fields.get('domain status', []) + fields.get('status', [])]
+        }
+
+    async def _whois_query(self, server, query):
+        """Send one query to a WHOIS server (TCP port 43) and read the reply until it closes"""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(server, 43), settings.whois_timeout)
+        try:
+            writer.write(f"{query}\r\n".encode())
+            await writer.drain()
+            reply = await asyncio.wait_for(reader.read(), settings.whois_timeout)
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+        return reply.decode('utf-8', errors='replace')
+
     def _format_date(self, date_value):
-        """Format date from whois (handles lists and datetime objects)"""
+        """Format date from whois (handles lists, datetime objects and ISO 8601 strings)"""
         if not date_value:
             return ''
         if isinstance(date_value, list):
             date_value = date_value[0]
+        if isinstance(date_value, str):
+            try:
+                date_value = datetime.fromisoformat(date_value)
+            except ValueError:
+                return date_value
         if isinstance(date_value, datetime):
             return date_value.strftime('%Y-%m-%d')
         return str(date_value)
 
-    def _get_asn_info(self, domain):
+    async def _get_asn_info(self, domain):
         """Get comprehensive ASN information using multiple sources"""
         try:
             # First resolve domain to IP
-            ip = socket.gethostbyname(domain)
+            ip = str((await dns.asyncresolver.resolve(domain, 'A'))[0])
 
             # 1. Get basic ASN from Team Cymru (fast, reliable)
-            asn_data = self._get_cymru_asn(ip)
+            asn_data = await self._get_cymru_asn(ip)
             if not asn_data:
                 return None
 
@@ -368,16 +481,16 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
             bgp_prefix = asn_data['prefix']
             rir = asn_data['rir']
 
-            # 2. Get detailed BGP data from RIPEstat (with BGPView fallback)
-            bgp_data = self._get_ripestat_data(asn)
+            # 2. Get detailed BGP data from RIPEstat and 3. peering info from PeeringDB, concurrently
+            bgp_data, peering_data = await asyncio.gather(
+                self._get_ripestat_data(asn),
+                self._get_peeringdb_data(asn)
+            )
 
             # Fallback to BGPView if RIPEstat didn't return data
             if not bgp_data.get('org') and not bgp_data.get('prefixes_v4'):
                 print(f"  Falling back to BGPView for AS{asn}")
-                bgp_data = self._get_bgpview_data(asn)
-
-            # 3. Get peering info from PeeringDB
-            peering_data = self._get_peeringdb_data(asn)
+                bgp_data = await self._get_bgpview_data(asn)
 
             return recon_pb2.ASNInfo(
                 asn=f'AS{asn}',
@@ -403,7 +516,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
             print(f"Error getting ASN info for {domain}: {e}")
             return None
 
-    def _get_cymru_asn(self, ip):
+    async def _get_cymru_asn(self, ip):
         """Get enhanced ASN data from Team Cymru (includes prefix, RIR, country)"""
         try:
             # Reverse IP for Team Cymru query
@@ -411,7 +524,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
             # Query Team Cymru for full ASN data
             # Format: "ASN | BGP Prefix | Country | RIR | Allocated Date"
-            answers = dns.resolver.resolve(f'{reversed_ip}.origin.asn.cymru.com', 'TXT')
+            answers = await dns.asyncresolver.resolve(f'{reversed_ip}.origin.asn.cymru.com', 'TXT')
             for rdata in answers:
                 txt = str(rdata).strip('"')
                 parts = [p.strip() for p in txt.split(' | ')]
@@ -427,7 +540,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
         return None
 
-    def _get_ripestat_data(self, asn):
+    async def _get_ripestat_data(self, asn):
         """Get comprehensive BGP data from RIPEstat API"""
         try:
             # RIPEstat works for all RIRs, not just RIPE
@@ -447,7 +560,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
             # 1. Get announced prefixes (BGP routes)
             try:
-                response = httpx.get(
+                response = await get_http_client().get(
                     f"{base_url}/announced-prefixes/data.json",
                     params={'resource': asn},
                     timeout=5.0
@@ -470,7 +583,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
             # 2. Get AS neighbors (peers, upstreams, downstreams)
             try:
-                response = httpx.get(
+                response = await get_http_client().get(
                     f"{base_url}/asn-neighbours/data.json",
                     params={'resource': asn},
                     timeout=5.0
@@ -499,7 +612,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
             # 3. Get abuse contacts
             try:
-                response = httpx.get(
+                response = await get_http_client().get(
                     f"{base_url}/abuse-contact-finder/data.json",
                     params={'resource': asn},
                     timeout=5.0
@@ -513,7 +626,7 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
             # 4. Get AS holder (organization name)
             try:
-                response = httpx.get(
+                response = await get_http_client().get(
                     f"{base_url}/as-overview/data.json",
                     params={'resource': asn},
                     timeout=5.0
@@ -541,13 +654,13 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
                 'abuse_contacts': []
             }
 
-    def _get_bgpview_data(self, asn):
+    async def _get_bgpview_data(self, asn):
         """Get BGP data from BGPView API (fallback for RIPEstat)"""
         try:
             # Remove 'AS' prefix if present
             asn_num = asn.replace('AS', '')
 
-            response = httpx.get(
+            response = await get_http_client().get(
                 f"https://api.bgpview.io/asn/{asn_num}",
                 timeout=10.0,
                 headers={'User-Agent': settings.user_agent}
@@ -610,13 +723,13 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
             'abuse_contacts': []
         }
 
-    def _get_peeringdb_data(self, asn):
+    async def _get_peeringdb_data(self, asn):
         """Get peering information from PeeringDB API"""
         try:
             # Remove 'AS' prefix if present
             asn_num = asn.replace('AS', '')
 
-            response = httpx.get(
+            response = await get_http_client().get(
                 "https://api.peeringdb.com/api/net",
                 params={'asn': asn_num},
                 timeout=5.0,
@@ -648,17 +761,28 @@ class ReconServicer(recon_pb2_grpc.ReconServiceServicer):
 
         return {'policy': '', 'type': '', 'facilities': []}
 
-def serve():
+async def serve():
     """Start the gRPC server"""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    # Accept the backend's keepalive pings on idle shared channels (default minimum is 5 min)
+    server = grpc.aio.server(options=[
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.min_ping_interval_without_data_ms', 10000),
+    ])
     recon_pb2_grpc.add_ReconServiceServicer_to_server(
         ReconServicer(), server
     )
     server.add_insecure_port(f'[::]:{ settings.recon_port}')
-    server.start()
+    await server.start()
     print(f"Recon service listening on port {settings.recon_port}")
-    server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await get_http_client().aclose()
+
+
+def main():
+    asyncio.run(serve())
 
 
 if __name__ == '__main__':
-    serve()
+    main()